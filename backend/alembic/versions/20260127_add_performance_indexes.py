@@ -1,7 +1,7 @@
 """add performance indexes
 
 Revision ID: 20260127_add_perf_indexes
-Revises: 20260127_initial_create_all_core_tables
+Revises: 001
 Create Date: 2026-01-27
 
 """
@@ -18,53 +18,59 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# (name, table, columns) of the composite indexes created by this revision
+COMPOSITE_INDEXES = [
+    # tickets
+    ('ix_tickets_hotel_status', 'tickets', ['hotel_id', 'status']),
+    ('ix_tickets_assigned_status', 'tickets', ['assigned_to', 'status']),
+    ('ix_tickets_hotel_created', 'tickets', ['hotel_id', 'created_at']),
+    # messages
+    ('ix_messages_conversation_created', 'messages', ['conversation_id', 'created_at']),
+    ('ix_messages_conversation_direction', 'messages', ['conversation_id', 'direction']),
+    # conversations
+    ('ix_conversations_hotel_status', 'conversations', ['hotel_id', 'status']),
+]
+
+
 def upgrade() -> None:
-    # Add composite indexes for tickets table
-    op.create_index(
-        'ix_tickets_hotel_status',
-        'tickets',
-        ['hotel_id', 'status']
-    )
-    op.create_index(
-        'ix_tickets_assigned_status',
-        'tickets',
-        ['assigned_to', 'status']
-    )
-    op.create_index(
-        'ix_tickets_hotel_created',
-        'tickets',
-        ['hotel_id', 'created_at']
-    )
-
-    # Add indexes for messages table
-    op.create_index(
-        'ix_messages_conversation_created',
-        'messages',
-        ['conversation_id', 'created_at']
-    )
-    op.create_index(
-        'ix_messages_conversation_direction',
-        'messages',
-        ['conversation_id', 'direction']
-    )
-
-    # Add indexes for conversations table
-    op.create_index(
-        'ix_conversations_hotel_status',
-        'conversations',
-        ['hotel_id', 'status']
-    )
-
-    # Add GIN index for full-text search on message content
-    # Note: This requires PostgreSQL with pg_trgm extension
-    # op.execute('CREATE INDEX ix_messages_content_trgm ON messages USING gin(content gin_trgm_ops)')
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    if is_postgresql:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building the
+    # indexes concurrently keeps tickets/messages/conversations writable
+    with op.get_context().autocommit_block():
+        for name, table, columns in COMPOSITE_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=is_postgresql,
+            )
+
+        # Add trigram GIN index so ILIKE '%...%' searches on message content can
+        # use an index (PostgreSQL only, requires the pg_trgm extension)
+        if is_postgresql:
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_content_trgm '
+                'ON messages USING gin (content gin_trgm_ops)'
+            )
 
 
 def downgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
     # Drop indexes
-    op.drop_index('ix_tickets_hotel_status', table_name='tickets')
-    op.drop_index('ix_tickets_assigned_status', table_name='tickets')
-    op.drop_index('ix_tickets_hotel_created', table_name='tickets')
-    op.drop_index('ix_messages_conversation_created', table_name='messages')
-    op.drop_index('ix_messages_conversation_direction', table_name='messages')
-    op.drop_index('ix_conversations_hotel_status', table_name='conversations')
+    with op.get_context().autocommit_block():
+        if is_postgresql:
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_messages_content_trgm')
+
+        for name, table, _ in COMPOSITE_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=is_postgresql,
+            )
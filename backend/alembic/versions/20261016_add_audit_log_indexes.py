@@ -0,0 +1,71 @@
+"""add audit log indexes
+
+Revision ID: 20261016_add_audit_log_indexes
+Revises: 20260127_add_perf_indexes
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_add_audit_log_indexes'
+down_revision: str | None = '20260127_add_perf_indexes'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    bind = op.get_bind()
+
+    # audit_logs is created from the ORM metadata, skip if it does not exist yet
+    if 'audit_logs' not in sa.inspect(bind).get_table_names():
+        return
+
+    is_postgresql = bind.dialect.name == 'postgresql'
+
+    # Build without blocking writes on PostgreSQL (CONCURRENTLY needs autocommit)
+    with op.get_context().autocommit_block():
+        # Audit summary: hotel_id + created_at window
+        op.create_index(
+            'ix_audit_logs_hotel_created',
+            'audit_logs',
+            ['hotel_id', 'created_at'],
+            if_not_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
+        # Login history: hotel_id + action + created_at window
+        op.create_index(
+            'ix_audit_logs_hotel_action_created',
+            'audit_logs',
+            ['hotel_id', 'action', 'created_at'],
+            if_not_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    bind = op.get_bind()
+
+    if 'audit_logs' not in sa.inspect(bind).get_table_names():
+        return
+
+    is_postgresql = bind.dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_audit_logs_hotel_action_created',
+            table_name='audit_logs',
+            if_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
+        op.drop_index(
+            'ix_audit_logs_hotel_created',
+            table_name='audit_logs',
+            if_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
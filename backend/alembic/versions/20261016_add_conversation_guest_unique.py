@@ -0,0 +1,69 @@
+"""add unique active conversation per (hotel_id, guest_id)
+
+Revision ID: 20261016_conv_guest_unique
+Revises: 20261016_add_staff_filter_index
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_conv_guest_unique'
+down_revision: str | None = '20261016_add_staff_filter_index'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Keep only the newest active conversation per guest and hotel; older
+# duplicates (left by the former select-then-insert race) are closed
+CLOSE_DUPLICATE_ACTIVE_CONVERSATIONS = """
+UPDATE conversations
+SET status = 'closed'
+WHERE status = 'active'
+  AND EXISTS (
+    SELECT 1 FROM conversations AS newer
+    WHERE newer.hotel_id = conversations.hotel_id
+      AND newer.guest_id = conversations.guest_id
+      AND newer.status = 'active'
+      AND (
+        newer.created_at > conversations.created_at
+        OR (newer.created_at = conversations.created_at AND newer.id > conversations.id)
+      )
+  )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    op.execute(CLOSE_DUPLICATE_ACTIVE_CONVERSATIONS)
+
+    # Conflict target of the webhook's conversation upsert
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ux_conversations_hotel_guest_active',
+            'conversations',
+            ['hotel_id', 'guest_id'],
+            unique=True,
+            if_not_exists=True,
+            postgresql_where=sa.text("status = 'active'"),
+            sqlite_where=sa.text("status = 'active'"),
+            postgresql_concurrently=is_postgresql,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ux_conversations_hotel_guest_active',
+            table_name='conversations',
+            if_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
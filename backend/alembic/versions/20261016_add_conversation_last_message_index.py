@@ -0,0 +1,45 @@
+"""add conversation (hotel_id, last_message_at) index
+
+Revision ID: 20261016_conv_last_message_idx
+Revises: 20261016_message_fulltext_idx
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_conv_last_message_idx'
+down_revision: str | None = '20261016_message_fulltext_idx'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    # Serves list_conversations (hotel_id = ? ORDER BY last_message_at DESC
+    # LIMIT n) without a sort; a backward btree scan yields DESC order
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversations_hotel_last_message',
+            'conversations',
+            ['hotel_id', 'last_message_at'],
+            if_not_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_conversations_hotel_last_message',
+            table_name='conversations',
+            if_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
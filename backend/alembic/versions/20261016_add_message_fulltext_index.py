@@ -0,0 +1,43 @@
+"""add full-text GIN index on message content
+
+Revision ID: 20261016_message_fulltext_idx
+Revises: 20261016_drop_redundant_indexes
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_message_fulltext_idx'
+down_revision: str | None = '20261016_drop_redundant_indexes'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Must match the expression built by app.api.v1.messages._content_filter,
+# otherwise the planner cannot use the index
+CONTENT_TSVECTOR = "to_tsvector('simple', coalesce(content, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # tsvector/GIN are PostgreSQL only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_content_tsv '
+            f'ON messages USING gin ({CONTENT_TSVECTOR})'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_messages_content_tsv')
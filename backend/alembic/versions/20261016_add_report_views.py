@@ -0,0 +1,78 @@
+"""add report materialized views
+
+Revision ID: 20261016_add_report_views
+Revises: 20261016_conv_last_message_idx
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_add_report_views'
+down_revision: str | None = '20261016_conv_last_message_idx'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Column layout must match the Table definitions in app.services.report_service
+TICKET_REPORT_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_ticket_report_by_hotel_day AS
+SELECT hotel_id,
+       created_at::date AS day,
+       status,
+       priority,
+       category,
+       count(*)::integer AS count
+FROM tickets
+GROUP BY hotel_id, created_at::date, status, priority, category
+"""
+
+MESSAGE_REPORT_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_message_report_by_hotel_day AS
+SELECT c.hotel_id,
+       m.created_at::date AS day,
+       m.message_type,
+       m.direction,
+       count(*)::integer AS count
+FROM messages m
+JOIN conversations c ON c.id = m.conversation_id
+GROUP BY c.hotel_id, m.created_at::date, m.message_type, m.direction
+"""
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Materialized views are PostgreSQL only; other backends aggregate the
+    # base tables directly
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(TICKET_REPORT_VIEW)
+    op.execute(MESSAGE_REPORT_VIEW)
+
+    # REFRESH ... CONCURRENTLY requires a unique index on each view
+    op.create_index(
+        'ux_mv_ticket_report_by_hotel_day',
+        'mv_ticket_report_by_hotel_day',
+        ['hotel_id', 'day', 'status', 'priority', 'category'],
+        unique=True,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ux_mv_message_report_by_hotel_day',
+        'mv_message_report_by_hotel_day',
+        ['hotel_id', 'day', 'message_type', 'direction'],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_message_report_by_hotel_day')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_ticket_report_by_hotel_day')
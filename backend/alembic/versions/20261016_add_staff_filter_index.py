@@ -0,0 +1,45 @@
+"""add staff (hotel_id, role, status, is_available) index
+
+Revision ID: 20261016_add_staff_filter_index
+Revises: 20261016_add_report_views
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_add_staff_filter_index'
+down_revision: str | None = '20261016_add_report_views'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    # Serves list_staff filters (hotel_id, then optional role/status/
+    # is_available) and available-staff lookups for assignment
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_staff_hotel_role_status',
+            'staff',
+            ['hotel_id', 'role', 'status', 'is_available'],
+            if_not_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_staff_hotel_role_status',
+            table_name='staff',
+            if_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
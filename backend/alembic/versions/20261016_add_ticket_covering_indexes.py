@@ -0,0 +1,85 @@
+"""add ticket covering and partial indexes
+
+Revision ID: 20261016_ticket_covering_idx
+Revises: 20261016_add_audit_log_indexes
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_ticket_covering_idx'
+down_revision: str | None = '20261016_add_audit_log_indexes'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Statuses treated as "open" by CRUDTicket.get_open_tickets
+OPEN_STATUS_FILTER = "status IN ('pending', 'assigned', 'in_progress')"
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        # Open tickets per hotel, newest first; only active rows are indexed
+        op.create_index(
+            'ix_tickets_hotel_open',
+            'tickets',
+            ['hotel_id', sa.text('created_at DESC')],
+            if_not_exists=True,
+            postgresql_where=sa.text(OPEN_STATUS_FILTER),
+            postgresql_include=['status', 'priority', 'category', 'assigned_to'],
+            postgresql_concurrently=is_postgresql,
+            sqlite_where=sa.text(OPEN_STATUS_FILTER),
+        )
+
+        # Export/listing filters: replace the plain (hotel_id, created_at)
+        # index with a covering one (INCLUDE is PostgreSQL only)
+        if is_postgresql:
+            op.create_index(
+                'ix_tickets_hotel_created_covering',
+                'tickets',
+                ['hotel_id', 'created_at'],
+                if_not_exists=True,
+                postgresql_include=['status', 'priority', 'category'],
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                'ix_tickets_hotel_created',
+                table_name='tickets',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        if is_postgresql:
+            op.create_index(
+                'ix_tickets_hotel_created',
+                'tickets',
+                ['hotel_id', 'created_at'],
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                'ix_tickets_hotel_created_covering',
+                table_name='tickets',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+        op.drop_index(
+            'ix_tickets_hotel_open',
+            table_name='tickets',
+            if_exists=True,
+            postgresql_concurrently=is_postgresql,
+        )
@@ -0,0 +1,44 @@
+"""add extended statistics for correlated ticket columns
+
+Revision ID: 20261016_add_ticket_stats
+Revises: 20261016_ticket_covering_idx
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_add_ticket_stats'
+down_revision: str | None = '20261016_ticket_covering_idx'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Extended statistics are PostgreSQL only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # hotel_id and status/assignee are strongly correlated per tenant; without
+    # multi-column stats the planner multiplies selectivities and misestimates
+    op.execute(
+        'CREATE STATISTICS IF NOT EXISTS tickets_hotel_status_stats '
+        '(dependencies, ndistinct) ON hotel_id, status FROM tickets'
+    )
+    op.execute(
+        'CREATE STATISTICS IF NOT EXISTS tickets_hotel_assignee_status_stats '
+        '(dependencies, ndistinct) ON hotel_id, assigned_to, status FROM tickets'
+    )
+    op.execute('ANALYZE tickets')
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP STATISTICS IF EXISTS tickets_hotel_assignee_status_stats')
+    op.execute('DROP STATISTICS IF EXISTS tickets_hotel_status_stats')
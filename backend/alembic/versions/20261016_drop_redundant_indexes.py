@@ -0,0 +1,64 @@
+"""drop redundant single-column indexes
+
+Revision ID: 20261016_drop_redundant_indexes
+Revises: 20261016_add_ticket_stats
+Create Date: 2026-10-16
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_drop_redundant_indexes'
+down_revision: str | None = '20261016_add_ticket_stats'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# (name, table, columns) of indexes that duplicate another index
+REDUNDANT_INDEXES = [
+    # Leading column of ix_tickets_hotel_status
+    ('ix_tickets_hotel_id', 'tickets', ['hotel_id']),
+    # Leading column of ix_conversations_hotel_status
+    ('ix_conversations_hotel_id', 'conversations', ['hotel_id']),
+    # Leading column of ix_messages_conversation_created
+    ('ix_messages_conversation_id', 'messages', ['conversation_id']),
+    # Duplicates of the primary key indexes
+    ('ix_hotels_id', 'hotels', ['id']),
+    ('ix_staff_id', 'staff', ['id']),
+    ('ix_conversations_id', 'conversations', ['id']),
+    ('ix_messages_id', 'messages', ['id']),
+    ('ix_tickets_id', 'tickets', ['id']),
+    ('ix_routing_rules_id', 'routing_rules', ['id']),
+    ('ix_ticket_timeline_id', 'ticket_timeline', ['id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=is_postgresql,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in REDUNDANT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=is_postgresql,
+            )
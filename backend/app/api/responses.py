@@ -0,0 +1,31 @@
+"""
+JSON response helpers for API routes
+"""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from app.schemas.common import APIResponse
+
+
+def json_response(adapter: TypeAdapter, data: Any = None, message: str = "success") -> Response:
+    """
+    Serialize data in the APIResponse envelope straight to a JSON response
+
+    The envelope is dumped by a TypeAdapter built once at import time, so
+    the route's response_model is only used for OpenAPI and the data is not
+    validated and encoded a second time. Data must already match the
+    adapter's type (schema instances, or plain values for dict/list types).
+
+    Args:
+        adapter: TypeAdapter for the route's APIResponse[...] type
+        data: Response data
+        message: Response message
+
+    Returns:
+        JSON response
+    """
+    response = APIResponse.model_construct(data=data, message=message)
+    return Response(content=adapter.dump_json(response), media_type="application/json")
@@ -2,81 +2,70 @@
 Audit Log API endpoints
 """
 
-from typing import Annotated, List, Optional
 from datetime import datetime
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.schemas.common import APIResponse
+from app.api.responses import json_response
 from app.dependencies import DBSession
+from app.schemas.audit import AuditFilter
+from app.schemas.common import APIResponse, DateRangeFilter
 from app.services.audit_service import audit_service
+from app.utils.csv_stream import format_csv_datetime, iter_csv
 
 router = APIRouter()
 
+# Serializes the log list envelope straight to JSON bytes, bypassing the
+# response_model round-trip (the decorator keeps it for OpenAPI only)
+audit_logs_response_adapter = TypeAdapter(APIResponse[list[dict]])
 
-@router.get("", response_model=APIResponse[List[dict]])
+
+@router.get("", response_model=APIResponse[list[dict]])
 def get_audit_logs(
+    filters: Annotated[AuditFilter, Depends()],
     db: Session = Depends(DBSession),
     hotel_id: Annotated[str, Query(description="Hotel ID")] = ...,
-    staff_id: Annotated[Optional[str], Query(description="Filter by staff ID")] = None,
-    action: Annotated[Optional[str], Query(description="Filter by action")] = None,
-    resource_type: Annotated[Optional[str], Query(description="Filter by resource type")] = None,
-    start_date: Annotated[Optional[str], Query(description="Start date (ISO format)")] = None,
-    end_date: Annotated[Optional[str], Query(description="End date (ISO format)")] = None,
     limit: Annotated[int, Query(ge=1, le=500)] = 100,
-) -> APIResponse[List[dict]]:
+) -> Response:
     """
     Get audit logs with filters
 
     Args:
+        filters: Optional staff/action/resource type/date filters
         db: Database session
         hotel_id: Hotel ID
-        staff_id: Optional staff ID filter
-        action: Optional action filter
-        resource_type: Optional resource type filter
-        start_date: Optional start date
-        end_date: Optional end date
         limit: Maximum records to return
 
     Returns:
         List of audit log entries
     """
-    # Parse dates
-    start_dt = datetime.fromisoformat(start_date) if start_date else None
-    end_dt = datetime.fromisoformat(end_date) if end_date else None
-
-    logs = audit_service.get_logs(
+    rows = audit_service.get_logs_with_staff(
         db,
         hotel_id,
-        staff_id=staff_id,
-        action=action,
-        resource_type=resource_type,
-        start_date=start_dt,
-        end_date=end_dt,
+        staff_id=filters.staff_id,
+        action=filters.action,
+        resource_type=filters.resource_type,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
         limit=limit,
     )
 
-    # Get staff names
-    staff_ids = list(set([log.staff_id for log in logs if log.staff_id]))
-    staff_map = {}
-    if staff_ids:
-        from app.models.staff import Staff
-        staff_results = db.query(Staff).filter(Staff.id.in_(staff_ids)).all()
-        staff_map = {s.id: s.name for s in staff_results}
-
-    return APIResponse(data=[
+    return json_response(audit_logs_response_adapter, [
         {
             "id": log.id,
             "action": log.action,
             "resource_type": log.resource_type,
             "resource_id": log.resource_id,
             "staff_id": log.staff_id,
-            "staff_name": staff_map.get(log.staff_id) or "Unknown",
+            "staff_name": staff_name or "Unknown",
             "ip_address": log.ip_address,
             "created_at": log.created_at.isoformat() if log.created_at else None,
         }
-        for log in logs
+        for log, staff_name in rows
     ])
 
 
@@ -98,65 +87,55 @@ def get_audit_summary(
         Summary with action counts
     """
     from datetime import timedelta
+
     from sqlalchemy import func
 
     start_date = datetime.utcnow() - timedelta(days=days)
 
-    # Count logs by action
+    # Count logs per (action, resource_type) in a single scan and roll the
+    # pairs up in Python; the filter predicate is evaluated only once
     from app.models.audit_log import AuditLog
 
-    action_counts = (
-        db.query(AuditLog.action, func.count(AuditLog.id))
+    pair_counts = (
+        db.query(AuditLog.action, AuditLog.resource_type, func.count(AuditLog.id))
         .filter(
             AuditLog.hotel_id == hotel_id,
             AuditLog.created_at >= start_date,
         )
-        .group_by(AuditLog.action)
+        .group_by(AuditLog.action, AuditLog.resource_type)
         .all()
     )
 
-    # Count logs by resource type
-    resource_counts = (
-        db.query(AuditLog.resource_type, func.count(AuditLog.id))
-        .filter(
-            AuditLog.hotel_id == hotel_id,
-            AuditLog.created_at >= start_date,
-        )
-        .group_by(AuditLog.resource_type)
-        .all()
-    )
+    action_counts: dict[str, int] = {}
+    resource_counts: dict[str, int] = {}
+    total_count = 0
 
-    # Total count
-    total_count = (
-        db.query(func.count(AuditLog.id))
-        .filter(
-            AuditLog.hotel_id == hotel_id,
-            AuditLog.created_at >= start_date,
-        )
-        .scalar()
-    )
+    for action, resource, count in pair_counts:
+        action_counts[action] = action_counts.get(action, 0) + count
+        resource_counts[resource] = resource_counts.get(resource, 0) + count
+        total_count += count
 
     return APIResponse(data={
         "period_days": days,
-        "total_actions": total_count or 0,
+        "total_actions": total_count,
         "by_action": [
             {"action": action, "count": count}
-            for action, count in action_counts
+            for action, count in action_counts.items()
         ],
         "by_resource": [
             {"resource_type": resource, "count": count}
-            for resource, count in resource_counts
+            for resource, count in resource_counts.items()
         ],
     })
 
 
-@router.get("/login-history", response_model=APIResponse[List[dict]])
+@router.get("/login-history", response_model=APIResponse[list[dict]])
 def get_login_history(
     db: Session = Depends(DBSession),
     hotel_id: Annotated[str, Query(description="Hotel ID")] = ...,
     staff_id: Annotated[Optional[str], Query(description="Filter by staff ID")] = None,
     days: Annotated[int, Query(ge=1, le=90)] = 30,
-) -> APIResponse[List[dict]]:
+) -> APIResponse[list[dict]]:
     """
     Get login/logout history
 
@@ -179,68 +158,57 @@ def get_login_history(
     return APIResponse(data=history)
 
 
-@router.get("/export", response_model=APIResponse[str])
+@router.get("/export")
 def export_audit_logs(
+    date_range: Annotated[DateRangeFilter, Depends()],
     db: Session = Depends(DBSession),
     hotel_id: Annotated[str, Query(description="Hotel ID")] = ...,
-    start_date: Annotated[Optional[str], Query(description="Start date")] = None,
-    end_date: Annotated[Optional[str], Query(description="End date")] = None,
-) -> APIResponse[str]:
+) -> StreamingResponse:
     """
     Export audit logs as CSV
 
     Args:
+        date_range: Optional start/end date
         db: Database session
         hotel_id: Hotel ID
-        start_date: Optional start date
-        end_date: Optional end date
 
     Returns:
-        CSV data as string
+        Streamed CSV file
     """
-    import csv
-    from io import StringIO
-
-    start_dt = datetime.fromisoformat(start_date) if start_date else None
-    end_dt = datetime.fromisoformat(end_date) if end_date else None
-
-    logs = audit_service.get_logs(
+    rows = audit_service.get_logs_with_staff(
         db,
         hotel_id,
-        start_date=start_dt,
-        end_date=end_dt,
+        start_date=date_range.start_date,
+        end_date=date_range.end_date,
         limit=10000,
+        yield_per=1000,
     )
 
-    # Get staff names
-    staff_ids = list(set([log.staff_id for log in logs if log.staff_id]))
-    staff_map = {}
-    if staff_ids:
-        from app.models.staff import Staff
-        staff_results = db.query(Staff).filter(Staff.id.in_(staff_ids)).all()
-        staff_map = {s.id: s.name for s in staff_results}
-
-    # Generate CSV
-    output = StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow([
+    header = [
         "时间",
         "操作",
         "资源类型",
         "资源ID",
         "操作人",
         "IP地址",
-    ])
+    ]
 
-    for log in logs:
-        writer.writerow([
-            log.created_at.strftime("%Y-%m-%d %H:%M:%S") if log.created_at else "",
+    csv_rows = (
+        [
+            format_csv_datetime(log.created_at),
             log.action,
             log.resource_type,
             log.resource_id or "",
-            staff_map.get(log.staff_id) or "Unknown",
+            staff_name or "Unknown",
             log.ip_address or "",
-        ])
+        ]
+        for log, staff_name in rows
+    )
 
-    return APIResponse(data=output.getvalue())
+    return StreamingResponse(
+        iter_csv(header, csv_rows),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=audit_logs_{hotel_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        },
+    )
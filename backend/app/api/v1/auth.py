@@ -2,22 +2,25 @@
 Authentication API endpoints
 """
 
-from typing import Annotated
-
 from fastapi import APIRouter, Depends
+from fastapi.security import HTTPAuthorizationCredentials
 
-from app.schemas.auth import LoginRequest, LoginResponse
-from app.schemas.common import APIResponse
-from app.dependencies import get_db_session
+from app.config import get_settings
+from app.core.auth import security
+from app.core.auth_cache import invalidate as invalidate_token
+from app.core.exceptions import NotFoundError, UnauthorizedError
 from app.core.security import create_access_token
 from app.crud.staff import staff as staff_crud
-from app.core.exceptions import UnauthorizedError, NotFoundError
-from app.config import get_settings
-from app.core.database import AsyncSession
+from app.dependencies import DBSession
+from app.schemas.auth import LoginRequest, LoginResponse
+from app.schemas.common import APIResponse
 
 router = APIRouter()
 
-DBSession = Annotated[AsyncSession, Depends(get_db_session)]
+settings = get_settings()
+
+# Token lifetime reported to clients, in seconds
+ACCESS_TOKEN_EXPIRES_IN = settings.access_token_expire_minutes * 60
 
 
 @router.post("/login", response_model=APIResponse[LoginResponse])
@@ -48,7 +51,6 @@ async def login(
         raise UnauthorizedError("Staff account is not active")
 
     # Create access token
-    settings = get_settings()
     access_token = create_access_token(
         data={
             "sub": staff_member.id,
@@ -63,7 +65,7 @@ async def login(
         data=LoginResponse(
             access_token=access_token,
             token_type="bearer",
-            expires_in=settings.access_token_expire_minutes * 60,
+            expires_in=ACCESS_TOKEN_EXPIRES_IN,
             staff_id=staff_member.id,
             staff_name=staff_member.name,
             hotel_id=staff_member.hotel_id,
@@ -73,17 +75,25 @@ async def login(
 
 
 @router.post("/logout", response_model=APIResponse)
-async def logout() -> APIResponse:
+async def logout(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+) -> APIResponse:
     """
     Logout endpoint
 
     Note: JWT tokens are stateless, so logout is handled on the client
     by removing the token. This endpoint can be used for logging or
-    token invalidation if using a token blacklist.
+    token invalidation if using a token blacklist. The token's cached
+    verification is dropped here.
+
+    Args:
+        credentials: HTTP Bearer credentials
 
     Returns:
         Success response
     """
+    if credentials is not None:
+        invalidate_token(credentials.credentials)
     return APIResponse(message="Logout successful")
 
 
@@ -6,7 +6,7 @@ from typing import Annotated
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.schemas.batch import (
@@ -15,7 +15,7 @@ from app.schemas.batch import (
     BatchOperationResult,
     TicketExportRequest,
 )
-from app.schemas.common import APIResponse
+from app.schemas.common import APIResponse, DateRangeFilter
 from app.dependencies import DBSession
 from app.services.batch_service import batch_service
 
@@ -66,55 +66,41 @@ def batch_update_status(
 
 @router.post("/export")
 def export_tickets(
+    date_range: Annotated[DateRangeFilter, Depends()],
     hotel_id: Annotated[str, Query(description="Hotel ID for filtering")] = ...,
     status: str | None = None,
     priority: str | None = None,
     category: str | None = None,
-    start_date: str | None = None,
-    end_date: str | None = None,
-    format: str = "csv",
     db: Session = Depends(DBSession),
-) -> Response:
+) -> StreamingResponse:
     """
-    Export tickets to CSV or Excel format
+    Export tickets to CSV
 
     Args:
+        date_range: Optional start/end date (ISO format)
         hotel_id: Hotel ID for filtering
         status: Optional status filter
         priority: Optional priority filter
         category: Optional category filter
-        start_date: Optional start date (ISO format)
-        end_date: Optional end date (ISO format)
-        format: Export format (csv or excel)
         db: Database session
 
     Returns:
         File with exported data
     """
-    # Parse dates
-    start_dt = datetime.fromisoformat(start_date) if start_date else None
-    end_dt = datetime.fromisoformat(end_date) if end_date else None
-
-    # Get tickets
+    # Stream tickets in batches so large exports are not buffered in memory
     tickets = batch_service.get_tickets_for_export(
-        db, hotel_id, status, priority, category, start_dt, end_dt
+        db,
+        hotel_id,
+        status,
+        priority,
+        category,
+        date_range.start_date,
+        date_range.end_date,
+        yield_per=500,
     )
 
-    if format == "csv":
-        csv_data = batch_service.export_tickets_to_csv(tickets)
-        return Response(
-            content=csv_data,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=tickets_{hotel_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            },
-        )
-
-    # Excel format would require additional library (openpyxl/xlsxwriter)
-    # For MVP, return CSV for both formats
-    csv_data = batch_service.export_tickets_to_csv(tickets)
-    return Response(
-        content=csv_data,
+    return StreamingResponse(
+        batch_service.iter_tickets_csv(tickets),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename=tickets_{hotel_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
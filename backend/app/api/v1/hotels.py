@@ -4,15 +4,15 @@ Hotel API endpoints
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 
+from app.api.responses import json_response
 from app.crud.hotel import hotel as hotel_crud
 from app.schemas.hotel import (
     HotelCreate,
     HotelUpdate,
     HotelResponse,
-    HotelListResponse,
 )
 from app.schemas.common import APIResponse, PaginatedData
 from app.core.auth import get_current_user_id
@@ -21,6 +21,13 @@ from app.core.exceptions import NotFoundError, ValidationError
 
 router = APIRouter()
 
+# Validates a whole page of ORM rows in a single call
+hotel_list_adapter = TypeAdapter(list[HotelResponse])
+
+# Serializes the list envelope straight to JSON bytes, bypassing the
+# response_model round-trip (the decorator keeps it for OpenAPI only)
+hotel_page_response_adapter = TypeAdapter(APIResponse[PaginatedData[HotelResponse]])
+
 
 @router.get("", response_model=APIResponse[PaginatedData[HotelResponse]])
 async def list_hotels(
@@ -28,7 +35,7 @@ async def list_hotels(
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     status: str | None = None,
-) -> APIResponse[PaginatedData[HotelResponse]]:
+) -> Response:
     """
     List hotels with pagination
 
@@ -41,25 +48,23 @@ async def list_hotels(
     Returns:
         Paginated list of hotels
     """
-    # Get hotels
+    # Get hotels and total in one query
     if status == "active":
-        hotels = await hotel_crud.get_active(db, skip=skip, limit=limit)
-        total = await hotel_crud.count_active(db)
+        hotels, total = await hotel_crud.get_active_page(db, skip=skip, limit=limit)
     else:
-        hotels = await hotel_crud.get_multi(db, skip=skip, limit=limit)
-        total = await hotel_crud.count(db)
+        hotels, total = await hotel_crud.get_page(db, skip=skip, limit=limit)
 
     # Create paginated response
     page = skip // limit + 1 if limit > 0 else 1
     pages = (total + limit - 1) // limit if limit > 0 else 0
     paginated_data = PaginatedData.create(
-        items=[HotelResponse.model_validate(h) for h in hotels],
+        items=hotel_list_adapter.validate_python(hotels, from_attributes=True),
         total=total,
         page=page,
         page_size=limit,
     )
 
-    return APIResponse(data=paginated_data)
+    return json_response(hotel_page_response_adapter, paginated_data)
 
 
 @router.get("/{hotel_id}", response_model=APIResponse[HotelResponse])
@@ -2,30 +2,103 @@
 Message API endpoints
 """
 
-from typing import Annotated, Optional
 from datetime import datetime
+from typing import Annotated
+from collections.abc import Sequence
 
-from fastapi import APIRouter, Depends, Query, HTTPException
-from fastapi.responses import Response
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, and_, func, literal_column, select, update
 
-from app.crud.message import message as message_crud
+from app.api.responses import json_response
+from app.core.auth import get_current_user_id
+from app.core.database import session_dialect
+from app.core.exceptions import NotFoundError
+from app.core.logging import get_logger
 from app.crud.conversation import conversation as conversation_crud
+from app.crud.message import message as message_crud
+from app.dependencies import DBSession, StreamingDBSession
+from app.models.conversation import Conversation, ConversationStatus
+from app.models.message import Message
+from app.schemas.common import APIResponse
 from app.schemas.message import (
+    MessageResponse,
     MessageSendRequest,
     MessageSendResponse,
-    MessageResponse,
 )
-from app.schemas.common import APIResponse
-from app.core.auth import get_current_user_id
-from app.dependencies import DBSession
-from app.core.exceptions import NotFoundError
+from app.utils.csv_stream import aiter_csv, format_csv_datetime
 from app.utils.wechat import wechat_client
-from app.models.conversation import Conversation
-from app.models.message import Message
 
 router = APIRouter()
+logger = get_logger("app.api.v1.messages")
+
+# Validates a whole page of ORM rows in a single call
+message_list_adapter = TypeAdapter(list[MessageResponse])
+
+# Serializes the list envelope straight to JSON bytes, bypassing the
+# response_model round-trip (the decorator keeps it for OpenAPI only)
+message_list_response_adapter = TypeAdapter(APIResponse[list[MessageResponse]])
+
+# Serializes the conversation list envelope straight to JSON bytes
+conversation_list_response_adapter = TypeAdapter(APIResponse[list[dict]])
+
+# Columns needed to build a MessageResponse; list queries select these
+# instead of full ORM entities
+MESSAGE_RESPONSE_COLUMNS = [getattr(Message, name) for name in MessageResponse.model_fields]
+
+# Shortest keyword accepted; single characters would match nearly every
+# message. pg_trgm extracts no trigram from a two-character pattern, so
+# such keywords scan the hotel's messages rather than use the trigram
+# index; they stay allowed because most Chinese words are two characters
+MIN_KEYWORD_LENGTH = 2
+
+# Shortest keyword served by the full-text index; shorter ones use ILIKE
+MIN_FULLTEXT_KEYWORD_LENGTH = 3
+
+
+def _content_filter(keyword: str, dialect: str) -> ColumnElement[bool]:
+    """
+    Build the message content filter for a search keyword
+
+    On PostgreSQL, ASCII keywords of at least MIN_FULLTEXT_KEYWORD_LENGTH
+    characters are matched through the ix_messages_content_tsv GIN index.
+    Short keywords and CJK text (which the 'simple' parser does not split
+    into words) keep the substring ILIKE, served by the trigram index from
+    three characters on.
+
+    Args:
+        keyword: Search keyword
+        dialect: Dialect name of the session the query runs on
+
+    Returns:
+        Filter expression on Message.content
+    """
+    if (
+        dialect == "postgresql"
+        and len(keyword) >= MIN_FULLTEXT_KEYWORD_LENGTH
+        and keyword.isascii()
+    ):
+        # Rendered inline (not as bind parameters) so the expression matches
+        # the index definition exactly
+        config = literal_column("'simple'")
+        content_tsv = func.to_tsvector(config, func.coalesce(Message.content, literal_column("''")))
+        return content_tsv.op("@@")(func.plainto_tsquery(config, keyword))
+    return Message.content.ilike(f"%{keyword}%")
+
+
+def _message_list_response(messages: Sequence) -> Response:
+    """
+    Build a JSON response for a list of messages
+
+    Args:
+        messages: Message entities or rows of MESSAGE_RESPONSE_COLUMNS
+
+    Returns:
+        JSON response with the APIResponse envelope
+    """
+    data = message_list_adapter.validate_python(messages, from_attributes=True)
+    return json_response(message_list_response_adapter, data)
 
 
 @router.get("/conversations", response_model=APIResponse[list])
@@ -34,7 +107,7 @@ async def list_conversations(
     hotel_id: str | None = None,
     status: str | None = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> APIResponse[list]:
+) -> Response:
     """
     List conversations
 
@@ -54,14 +127,16 @@ async def list_conversations(
     else:
         convs = await conversation_crud.get_multi(db, 0, limit)
 
-    return APIResponse(data=[{
+    rows = [{
         "id": c.id,
         "hotel_id": c.hotel_id,
         "guest_id": c.guest_id,
         "guest_name": c.guest_name,
         "status": c.status,
-        "last_message_at": c.last_message_at.isoformat() if c.last_message_at else None,
-    } for c in convs])
+        # Serialized to the same ISO 8601 string by pydantic-core
+        "last_message_at": c.last_message_at,
+    } for c in convs]
+    return json_response(conversation_list_response_adapter, rows)
 
 
 @router.get("/conversations/{conversation_id}/messages", response_model=APIResponse[list[MessageResponse]])
@@ -69,7 +144,7 @@ async def get_conversation_messages(
     conversation_id: str,
     db: DBSession,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> APIResponse[list[MessageResponse]]:
+) -> Response:
     """
     Get messages for a conversation
 
@@ -81,12 +156,11 @@ async def get_conversation_messages(
     Returns:
         List of messages
     """
-    conv = await conversation_crud.get(db, conversation_id)
-    if not conv:
+    if not await conversation_crud.exists(db, conversation_id):
         raise NotFoundError("Conversation not found")
 
     messages = await message_crud.get_by_conversation(db, conversation_id, limit)
-    return APIResponse(data=[MessageResponse.model_validate(m) for m in messages])
+    return _message_list_response(messages)
 
 
 @router.post("/send", response_model=APIResponse[MessageSendResponse])
@@ -106,9 +180,9 @@ async def send_message(
     Returns:
         Send result
     """
-    # Get conversation
-    conv = await conversation_crud.get(db, request.conversation_id)
-    if not conv:
+    # Only the guest ID is needed from the conversation
+    guest_id = await conversation_crud.get_guest_id(db, request.conversation_id)
+    if guest_id is None:
         raise NotFoundError("Conversation not found")
 
     # Create message record
@@ -122,12 +196,12 @@ async def send_message(
         sender_id=user_id,
     )
 
-    # Update conversation last_message_at
-    from datetime import datetime
-    from sqlalchemy import update
+    # Update conversation last_message_at in the same transaction as the
+    # message insert. Timestamps are stored as naive UTC like the model
+    # defaults.
     await db.execute(
-        update(Conversation)  # type: ignore
-        .filter(Conversation.id == request.conversation_id)
+        update(Conversation)
+        .where(Conversation.id == request.conversation_id)
         .values(last_message_at=datetime.utcnow())
     )
     await db.commit()
@@ -135,7 +209,7 @@ async def send_message(
     # Send to WeChat
     try:
         wechat_result = await wechat_client.send_text_message(
-            conv.guest_id,
+            guest_id,
             request.content,
         )
 
@@ -163,8 +237,6 @@ async def send_message(
                 ),
             )
     except Exception as e:
-        from app.core.logging import get_logger
-        logger = get_logger("app.api.v1.messages")
         logger.error(
             "Failed to send message",
             exc_info=True,
@@ -197,32 +269,33 @@ async def close_conversation(
     Returns:
         Success response
     """
-    conv = await conversation_crud.get(db, conversation_id)
-    if not conv:
-        raise NotFoundError("Conversation not found")
-
-    from app.models.conversation import ConversationStatus
-    updated = await conversation_crud.update(
+    # Existence check and status change in one statement
+    updated = await conversation_crud.update_status(
         db,
-        conv,
-        {"status": ConversationStatus.CLOSED.value},
+        conversation_id,
+        ConversationStatus.CLOSED.value,
     )
+    if not updated:
+        raise NotFoundError("Conversation not found")
 
     return APIResponse(message="Conversation closed")
 
 
 @router.get("/search", response_model=APIResponse[list[MessageResponse]])
 async def search_messages(
-    db: Session = Depends(DBSession),
+    db: DBSession,
     hotel_id: Annotated[str, Query(description="Hotel ID")] = ...,
-    keyword: Annotated[Optional[str], Query(description="Keyword to search in content")] = None,
-    conversation_id: Annotated[Optional[str], Query(description="Filter by conversation")] = None,
-    message_type: Annotated[Optional[str], Query(description="Filter by message type")] = None,
-    direction: Annotated[Optional[str], Query(description="Filter by direction")] = None,
-    start_date: Annotated[Optional[str], Query(description="Start date (ISO format)")] = None,
-    end_date: Annotated[Optional[str], Query(description="End date (ISO format)")] = None,
+    keyword: Annotated[
+        str | None,
+        Query(min_length=MIN_KEYWORD_LENGTH, description="Keyword to search in content"),
+    ] = None,
+    conversation_id: Annotated[str | None, Query(description="Filter by conversation")] = None,
+    message_type: Annotated[str | None, Query(description="Filter by message type")] = None,
+    direction: Annotated[str | None, Query(description="Filter by direction")] = None,
+    start_date: Annotated[str | None, Query(description="Start date (ISO format)")] = None,
+    end_date: Annotated[str | None, Query(description="End date (ISO format)")] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> APIResponse[list[MessageResponse]]:
+) -> Response:
     """
     Advanced message search with multiple filters
 
@@ -240,23 +313,18 @@ async def search_messages(
     Returns:
         List of matching messages
     """
-    # Get conversations for hotel
-    from sqlalchemy import select, and_, or_
-
-    conv_query = select(Conversation.id).where(Conversation.hotel_id == hotel_id)
-    conversation_ids = [row[0] for row in db.execute(conv_query).all()]
-
-    if not conversation_ids:
-        return APIResponse(data=[])
-
-    # Build query
-    query = select(Message).where(Message.conversation_id.in_(conversation_ids))
+    # Scope to the hotel through a join instead of prefetching its conversation IDs
+    query = (
+        select(*MESSAGE_RESPONSE_COLUMNS)
+        .join(Conversation, Message.conversation_id == Conversation.id)
+        .where(Conversation.hotel_id == hotel_id)
+    )
 
     # Apply filters
     filters = []
 
     if keyword:
-        filters.append(Message.content.ilike(f"%{keyword}%"))
+        filters.append(_content_filter(keyword, session_dialect(db)))
 
     if conversation_id:
         filters.append(Message.conversation_id == conversation_id)
@@ -288,19 +356,22 @@ async def search_messages(
     query = query.order_by(Message.created_at.desc()).limit(limit)
 
     # Execute query
-    results = db.execute(query).scalars().all()
+    results = (await db.execute(query)).all()
 
-    return APIResponse(data=[MessageResponse.model_validate(m) for m in results])
+    return _message_list_response(results)
 
 
 @router.get("/export")
 async def export_messages(
-    db: Session = Depends(DBSession),
+    db: StreamingDBSession,
     hotel_id: Annotated[str, Query(description="Hotel ID")] = ...,
-    keyword: Annotated[Optional[str], Query(description="Keyword to search")] = None,
-    conversation_id: Annotated[Optional[str], Query(description="Filter by conversation")] = None,
-    start_date: Annotated[Optional[str], Query(description="Start date")] = None,
-    end_date: Annotated[Optional[str], Query(description="End date")] = None,
+    keyword: Annotated[
+        str | None,
+        Query(min_length=MIN_KEYWORD_LENGTH, description="Keyword to search"),
+    ] = None,
+    conversation_id: Annotated[str | None, Query(description="Filter by conversation")] = None,
+    start_date: Annotated[str | None, Query(description="Start date")] = None,
+    end_date: Annotated[str | None, Query(description="End date")] = None,
 ) -> Response:
     """
     Export messages to CSV
@@ -316,31 +387,27 @@ async def export_messages(
     Returns:
         CSV file with message data
     """
-    import csv
-    from io import StringIO
-    from sqlalchemy import select, and_
-
-    # Get conversations for hotel
-    conv_query = select(Conversation.id).where(Conversation.hotel_id == hotel_id)
-    conversation_ids = [row[0] for row in db.execute(conv_query).all()]
-
-    if not conversation_ids:
-        return Response(
-            content="",
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=messages_export.csv"},
-        )
-
     # Build query
-    query = select(Message, Conversation).join(
-        Conversation, Message.conversation_id == Conversation.id
-    ).where(Message.conversation_id.in_(conversation_ids))
+    query = (
+        select(
+            Message.id,
+            Message.conversation_id,
+            Conversation.guest_name,
+            Message.message_type,
+            Message.direction,
+            Message.content,
+            Message.sender_id,
+            Message.created_at,
+        )
+        .join(Conversation, Message.conversation_id == Conversation.id)
+        .where(Conversation.hotel_id == hotel_id)
+    )
 
     # Apply filters
     filters = []
 
     if keyword:
-        filters.append(Message.content.ilike(f"%{keyword}%"))
+        filters.append(_content_filter(keyword, session_dialect(db)))
 
     if conversation_id:
         filters.append(Message.conversation_id == conversation_id)
@@ -362,17 +429,26 @@ async def export_messages(
     if filters:
         query = query.where(and_(*filters))
 
-    query = query.order_by(Message.created_at.desc())
-
-    # Execute query
-    results = db.execute(query).all()
-
-    # Generate CSV
-    output = StringIO()
-    writer = csv.writer(output)
+    query = query.order_by(Message.created_at.desc()).execution_options(
+        stream_results=True, yield_per=1000
+    )
 
-    # Write header
-    writer.writerow([
+    async def csv_rows():
+        # Rows are pulled from the cursor as the response is sent
+        results = await db.stream(query)
+        async for row in results:
+            yield [
+                row.id,
+                row.conversation_id,
+                row.guest_name,
+                row.message_type,
+                row.direction,
+                (row.content or "")[:500],  # Limit content length
+                row.sender_id or "",
+                format_csv_datetime(row.created_at),
+            ]
+
+    header = [
         "消息ID",
         "会话ID",
         "客人姓名",
@@ -381,28 +457,12 @@ async def export_messages(
         "内容",
         "发送者ID",
         "发送时间",
-    ])
-
-    # Write data
-    for message, conversation in results:
-        writer.writerow([
-            message.id,
-            message.conversation_id,
-            conversation.guest_name,
-            message.message_type,
-            message.direction,
-            (message.content or "")[:500],  # Limit content length
-            message.sender_id or "",
-            message.created_at.strftime("%Y-%m-%d %H:%M:%S") if message.created_at else "",
-        ])
-
-    csv_data = output.getvalue()
-
-    return Response(
-        content=csv_data,
+    ]
+
+    return StreamingResponse(
+        aiter_csv(header, csv_rows()),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename=messages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         },
     )
-
@@ -2,47 +2,65 @@
 Permission and Role Management API endpoints
 """
 
-from typing import Annotated, List
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Response
+from sqlalchemy import select
 
-from app.schemas.common import APIResponse
-from app.dependencies import DBSession
 from app.core.permissions import get_all_permissions, get_all_roles, permission_checker
+from app.dependencies import DBSession
+from app.models.permission import (
+    ROLE_PERMISSION_SETS,
+    ROLE_PERMISSION_VALUES,
+    PermissionType,
+    SystemRole,
+)
+from app.models.staff import Staff
+from app.schemas.common import APIResponse
 
 router = APIRouter()
 
+# Permissions and roles are defined in code, so these responses only change
+# on deploy: serialize them once and let clients cache them
+CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+PERMISSIONS_BODY = APIResponse(data=get_all_permissions()).model_dump_json().encode()
+ROLES_BODY = APIResponse(data=get_all_roles()).model_dump_json().encode()
+MATRIX_BODY = APIResponse(data=ROLE_PERMISSION_VALUES).model_dump_json().encode()
+
+
+def _json_response(body: bytes) -> Response:
+    """Wrap a pre-serialized JSON body with the cache headers"""
+    return Response(content=body, media_type="application/json", headers=CACHE_HEADERS)
 
-@router.get("/list", response_model=APIResponse[List[dict]])
-def list_permissions() -> APIResponse[List[dict]]:
+
+@router.get("/list", response_model=APIResponse[list[dict]])
+async def list_permissions() -> Response:
     """
     Get all available permissions
 
     Returns:
         List of all permissions with categories
     """
-    permissions = get_all_permissions()
-    return APIResponse(data=permissions)
+    return _json_response(PERMISSIONS_BODY)
 
 
-@router.get("/roles", response_model=APIResponse[List[dict]])
-def list_roles() -> APIResponse[List[dict]]:
+@router.get("/roles", response_model=APIResponse[list[dict]])
+async def list_roles() -> Response:
     """
     Get all system roles with their permissions
 
     Returns:
         List of system roles
     """
-    roles = get_all_roles()
-    return APIResponse(data=roles)
+    return _json_response(ROLES_BODY)
 
 
 @router.get("/check", response_model=APIResponse[dict])
-def check_permission(
+async def check_permission(
     permission: str,
     role: str = "staff",
-) -> APIResponse[dict]:
+) -> Response:
     """
     Check if a role has a specific permission
 
@@ -53,50 +71,58 @@ def check_permission(
     Returns:
         Check result with has_permission boolean
     """
-    from app.models.permission import PermissionType, SystemRole, ROLE_PERMISSIONS
+    return _json_response(_permission_check_body(permission, role))
 
-    try:
-        perm = PermissionType(permission)
-        sys_role = SystemRole(role)
-        perms = ROLE_PERMISSIONS.get(sys_role, [])
-        has_perm = perm in perms
 
-        return APIResponse(data={
+@lru_cache(maxsize=512)
+def _permission_check_body(permission: str, role: str) -> bytes:
+    """
+    Serialize the check_permission result for a (permission, role) pair
+
+    Args:
+        permission: Permission to check
+        role: Role to check against
+
+    Returns:
+        JSON encoded APIResponse
+    """
+    # Look the values up directly instead of constructing the enums and
+    # catching ValueError for invalid input
+    perm = PermissionType._value2member_map_.get(permission)
+    sys_role = SystemRole._value2member_map_.get(role)
+
+    if perm is None or sys_role is None:
+        response = APIResponse(data={
             "permission": permission,
             "role": role,
-            "has_permission": has_perm,
+            "has_permission": False,
+            "error": "Invalid permission or role",
         })
-    except ValueError:
-        return APIResponse(data={
+    else:
+        response = APIResponse(data={
             "permission": permission,
             "role": role,
-            "has_permission": False,
-            "error": "Invalid permission or role",
+            "has_permission": perm in ROLE_PERMISSION_SETS.get(sys_role, frozenset()),
         })
 
+    return response.model_dump_json().encode()
+
 
 @router.get("/matrix", response_model=APIResponse[dict])
-def get_permission_matrix() -> APIResponse[dict]:
+async def get_permission_matrix() -> Response:
     """
     Get permission matrix showing all roles and their permissions
 
     Returns:
         Matrix with roles as rows and permissions as columns
     """
-    from app.models.permission import SystemRole, ROLE_PERMISSIONS
-
-    matrix = {}
-
-    for role, perms in ROLE_PERMISSIONS.items():
-        matrix[role.value] = [p.value for p in perms]
-
-    return APIResponse(data=matrix)
+    return _json_response(MATRIX_BODY)
 
 
 @router.get("/staff/{staff_id}", response_model=APIResponse[dict])
-def get_staff_permissions(
+async def get_staff_permissions(
     staff_id: str,
-    db: Session = Depends(DBSession),
+    db: DBSession,
 ) -> APIResponse[dict]:
     """
     Get permissions for a specific staff member
@@ -108,9 +134,8 @@ def get_staff_permissions(
     Returns:
         Staff permissions
     """
-    from app.models.staff import Staff
-
-    staff = db.query(Staff).filter(Staff.id == staff_id).first()
+    result = await db.execute(select(Staff).where(Staff.id == staff_id).limit(1))
+    staff = result.scalar_one_or_none()
     if not staff:
         return APIResponse(code=404, message="Staff not found", data=None)
 
@@ -2,184 +2,179 @@
 Report API endpoints for statistics and analytics
 """
 
-from typing import Optional
+import hashlib
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from email.utils import formatdate
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
+from pydantic import BaseModel
 
+from app.dependencies import DBSession
+from app.schemas.common import APIResponse
 from app.schemas.report import (
-    TicketReport,
-    StaffReport,
-    MessageReport,
     DashboardSummary,
-    TicketStatusStats,
-    TicketPriorityStats,
-    TicketCategoryStats,
-    StaffPerformanceStats,
-    MessageTypeStats,
-    MessageDirectionStats,
+    MessageReport,
+    StaffReport,
+    TicketReport,
+)
+from app.services.report_service import (
+    REPORT_CACHE_TTL_SECONDS,
+    report_cache,
+    report_service,
 )
-from app.schemas.common import APIResponse
-from app.dependencies import DBSession
 
 router = APIRouter()
 
 
+def _today(now: datetime) -> tuple[datetime, datetime]:
+    """Midnight today until now"""
+    return now.replace(hour=0, minute=0, second=0, microsecond=0), now
+
+
+def _this_week(now: datetime) -> tuple[datetime, datetime]:
+    """Monday midnight until now"""
+    start = (now - timedelta(days=now.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return start, now
+
+
+def _this_month(now: datetime) -> tuple[datetime, datetime]:
+    """First day of the month at midnight until now"""
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), now
+
+
+def _last_seven_days(now: datetime) -> tuple[datetime, datetime]:
+    """Rolling seven days until now"""
+    return now - timedelta(days=7), now
+
+
+_PERIOD_FUNCS = {
+    "today": _today,
+    "this_week": _this_week,
+    "this_month": _this_month,
+}
+
+
 def get_period_dates(range_type: str) -> tuple[datetime, datetime]:
     """Get period start and end dates based on range type"""
-    now = datetime.now()
-    if range_type == "today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    elif range_type == "this_week":
-        start = now - timedelta(days=now.weekday())
-        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    elif range_type == "this_month":
-        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end = now
-    else:
-        start = now - timedelta(days=7)
-        end = now
-    return start, end
+    return _PERIOD_FUNCS.get(range_type, _last_seven_days)(datetime.now())
+
+
+async def cached_report_response(
+    request: Request,
+    key: tuple,
+    build: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """
+    Return a report from the short-lived report cache, building it on a miss
+
+    The serialized body is cached together with its ETag and build time, so
+    hits skip both the queries and serialization, and clients can revalidate
+    with If-None-Match.
+
+    Args:
+        request: Incoming request
+        key: Cache key, e.g. (report name, hotel_id, range_type)
+        build: Coroutine factory producing the report on a miss
+
+    Returns:
+        JSON response, or 304 when the client copy is current
+    """
+    entry = report_cache.get(key)
+    if entry is None:
+        body = APIResponse(data=await build()).model_dump_json().encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        entry = (body, etag, formatdate(usegmt=True))
+        report_cache.set(key, entry)
+
+    body, etag, last_modified = entry
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": f"private, max-age={REPORT_CACHE_TTL_SECONDS}",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/dashboard", response_model=APIResponse[DashboardSummary])
 async def get_dashboard_summary(
+    request: Request,
     db: DBSession,
     hotel_id: str = Query(..., description="Hotel ID for filtering"),
     range_type: str = "this_week",
-) -> APIResponse[DashboardSummary]:
+) -> Response:
     """
     Get dashboard summary statistics
     """
     period_start, period_end = get_period_dates(range_type)
 
-    summary = DashboardSummary(
-        total_tickets=42,
-        pending_tickets=8,
-        in_progress_tickets=12,
-        overdue_tickets=2,
-        total_messages=156,
-        unread_messages=5,
-        active_conversations=8,
-        available_staff=2,
-        period_start=period_start,
-        period_end=period_end,
+    return await cached_report_response(
+        request,
+        ("dashboard", hotel_id, range_type),
+        lambda: report_service.get_dashboard_summary(db, hotel_id, period_start, period_end),
     )
-    return APIResponse(data=summary)
 
 
 @router.get("/tickets", response_model=APIResponse[TicketReport])
 async def get_ticket_report(
+    request: Request,
     db: DBSession,
     hotel_id: str = Query(..., description="Hotel ID for filtering"),
     range_type: str = "this_week",
-    department: Optional[str] = None,
-) -> APIResponse[TicketReport]:
+    department: str | None = None,
+) -> Response:
     """
     Get ticket statistics report
     """
-    total = 42
-    report = TicketReport(
-        total=total,
-        by_status=[
-            TicketStatusStats(status="pending", count=8, percentage=19.0),
-            TicketStatusStats(status="assigned", count=5, percentage=11.9),
-            TicketStatusStats(status="in_progress", count=7, percentage=16.7),
-            TicketStatusStats(status="resolved", count=15, percentage=35.7),
-            TicketStatusStats(status="closed", count=7, percentage=16.7),
-        ],
-        by_priority=[
-            TicketPriorityStats(priority="P1", count=3, percentage=7.1),
-            TicketPriorityStats(priority="P2", count=12, percentage=28.6),
-            TicketPriorityStats(priority="P3", count=18, percentage=42.9),
-            TicketPriorityStats(priority="P4", count=9, percentage=21.4),
-        ],
-        by_category=[
-            TicketCategoryStats(category="maintenance", count=15, percentage=35.7),
-            TicketCategoryStats(category="housekeeping", count=10, percentage=23.8),
-            TicketCategoryStats(category="service", count=8, percentage=19.0),
-            TicketCategoryStats(category="complaint", count=5, percentage=11.9),
-            TicketCategoryStats(category="inquiry", count=4, percentage=9.5),
-        ],
-        created_in_period=18,
-        resolved_in_period=15,
-        closed_in_period=7,
-        avg_resolution_hours=28.3,
-        overdue_count=2,
+    period_start, period_end = get_period_dates(range_type)
+
+    return await cached_report_response(
+        request,
+        ("tickets", hotel_id, range_type, department),
+        lambda: report_service.get_ticket_report(
+            db, hotel_id, period_start, period_end, department
+        ),
     )
-    return APIResponse(data=report)
 
 
 @router.get("/staff", response_model=APIResponse[StaffReport])
 async def get_staff_report(
+    request: Request,
     db: DBSession,
     hotel_id: str = Query(..., description="Hotel ID for filtering"),
     range_type: str = "this_month",
-) -> APIResponse[StaffReport]:
+) -> Response:
     """
     Get staff performance report
     """
     period_start, period_end = get_period_dates(range_type)
 
-    report = StaffReport(
-        total_staff=2,
-        staff_stats=[
-            StaffPerformanceStats(
-                staff_id="staff-001",
-                staff_name="测试员工",
-                department="客服部",
-                total_assigned=18,
-                total_resolved=15,
-                total_in_progress=3,
-                resolution_rate=83.3,
-                avg_resolution_hours=25.5,
-                avg_response_hours=3.2,
-            ),
-            StaffPerformanceStats(
-                staff_id="staff-002",
-                staff_name="管理员",
-                department="管理部",
-                total_assigned=24,
-                total_resolved=20,
-                total_in_progress=4,
-                resolution_rate=83.3,
-                avg_resolution_hours=31.2,
-                avg_response_hours=5.8,
-            ),
-        ],
-        period_start=period_start,
-        period_end=period_end,
+    return await cached_report_response(
+        request,
+        ("staff", hotel_id, range_type),
+        lambda: report_service.get_staff_report(db, hotel_id, period_start, period_end),
     )
-    return APIResponse(data=report)
 
 
 @router.get("/messages", response_model=APIResponse[MessageReport])
 async def get_message_report(
+    request: Request,
     db: DBSession,
     hotel_id: str = Query(..., description="Hotel ID for filtering"),
     range_type: str = "this_week",
-) -> APIResponse[MessageReport]:
+) -> Response:
     """
     Get message statistics report
     """
     period_start, period_end = get_period_dates(range_type)
 
-    report = MessageReport(
-        total=156,
-        by_type=[
-            MessageTypeStats(message_type="text", count=130, percentage=83.3),
-            MessageTypeStats(message_type="image", count=20, percentage=12.8),
-            MessageTypeStats(message_type="audio", count=6, percentage=3.8),
-        ],
-        by_direction=[
-            MessageDirectionStats(direction="inbound", count=98, percentage=62.8),
-            MessageDirectionStats(direction="outbound", count=58, percentage=37.2),
-        ],
-        avg_daily_count=22.3,
-        peak_conversations=15,
-        period_start=period_start,
-        period_end=period_end,
+    return await cached_report_response(
+        request,
+        ("messages", hotel_id, range_type),
+        lambda: report_service.get_message_report(db, hotel_id, period_start, period_end),
     )
-    return APIResponse(data=report)
@@ -2,52 +2,23 @@
 Routing Rules Management API endpoints
 """
 
-from typing import List
-from pydantic import BaseModel, Field
+import uuid
+from operator import itemgetter
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
+from pydantic import TypeAdapter
 
+from app.api.responses import json_response
 from app.schemas.common import APIResponse
+from app.schemas.rule import RuleCreateRequest, RuleSummary, RuleTestRequest
+from app.utils.keyword_matcher import KeywordMatcher
 
 router = APIRouter()
 
-
-# Schemas
-class RuleTestRequest(BaseModel):
-    """Request for testing a routing rule"""
-    message_content: str = Field(..., description="Message content to test")
-    category: str | None = Field(None, description="Optional ticket category")
-    priority: str | None = Field(None, description="Optional ticket priority")
-
-
-class RuleSummary(BaseModel):
-    """Rule summary for display"""
-    id: str
-    name: str
-    type: str
-    keywords: List[str] | None = None
-    category: str | None = None
-    priority: str | None = None
-    target_staff_count: int = 0
-    rule_priority: int = 0
-    is_active: bool = True
-
-
-class RuleCreateRequest(BaseModel):
-    """Request for creating a routing rule"""
-    name: str = Field(..., max_length=100, description="Rule name")
-    rule_type: str = Field(..., description="Rule type: keyword, category, priority, round_robin, manual")
-    keywords: List[str] = Field(default_factory=list, description="Keywords for keyword matching")
-    category: str | None = Field(None, description="Category for category matching")
-    priority: str | None = Field(None, description="Priority for priority matching")
-    target_staff_ids: List[str] = Field(..., description="Target staff IDs for assignment")
-    rule_priority: int = Field(default=0, description="Rule priority (higher = more priority)")
-    is_active: bool = Field(default=True, description="Whether the rule is active")
-
-
-# In-memory storage for MVP (would be database in production)
-_rules: List[dict] = [
-    {
+# In-memory storage for MVP (would be database in production), keyed by
+# rule ID; dicts keep insertion order for the summary listing
+_rules: dict[str, dict] = {
+    "rule-001": {
         "id": "rule-001",
         "name": "维修关键词匹配",
         "type": "keyword",
@@ -58,7 +29,7 @@ _rules: List[dict] = [
         "rule_priority": 10,
         "is_active": True,
     },
-    {
+    "rule-002": {
         "id": "rule-002",
         "name": "投诉优先处理",
         "type": "category",
@@ -69,42 +40,81 @@ _rules: List[dict] = [
         "rule_priority": 20,
         "is_active": True,
     },
-]
+}
+
+# Envelope serializers, built once; see app.api.responses.json_response.
+# The stored rules already have the RuleSummary shape, so they are dumped
+# as plain dicts without re-validation
+rule_summary_response_adapter = TypeAdapter(APIResponse[list[dict]])
+rule_response_adapter = TypeAdapter(APIResponse[dict])
 
+# Keyword automaton over active keyword rules; reset whenever _rules changes
+# and rebuilt on the next rule test
+_automaton: KeywordMatcher | None = None
 
-@router.get("/summary", response_model=APIResponse[List[RuleSummary]])
+
+def _get_automaton() -> KeywordMatcher:
+    """
+    Get the keyword automaton, building it if the rules changed
+
+    Returns:
+        Automaton mapping each keyword to (rank, rule), where rank 0 is the
+        highest rule_priority and ties keep insertion order
+    """
+    global _automaton
+    if _automaton is None:
+        keyword_rules = sorted(
+            (
+                rule for rule in _rules.values()
+                if rule["type"] == "keyword" and rule["is_active"] and rule["keywords"]
+            ),
+            key=lambda rule: -rule["rule_priority"],
+        )
+        _automaton = KeywordMatcher(
+            (keyword, (rank, rule))
+            for rank, rule in enumerate(keyword_rules)
+            for keyword in rule["keywords"]
+        )
+    return _automaton
+
+
+def _invalidate_automaton() -> None:
+    """Drop the keyword automaton after a rule mutation"""
+    global _automaton
+    _automaton = None
+
+
+@router.get("/summary", response_model=APIResponse[list[RuleSummary]])
 async def get_rules_summary(
     hotel_id: str = Query(..., description="Hotel ID"),
-) -> APIResponse[List[RuleSummary]]:
+) -> Response:
     """
     Get summary of all routing rules for a hotel
     """
-    return APIResponse(data=_rules)
+    return json_response(rule_summary_response_adapter, list(_rules.values()))
 
 
 @router.post("/test", response_model=APIResponse[dict])
 async def test_routing_rule(
     hotel_id: str = Query(..., description="Hotel ID"),
     request: RuleTestRequest = ...,
-) -> APIResponse[dict]:
+) -> Response:
     """
     Test which rule would match a message
     """
-    # Simple keyword matching for MVP
-    matched_rule = None
-    for rule in _rules:
-        if rule["type"] == "keyword" and rule["keywords"]:
-            for keyword in rule["keywords"]:
-                if keyword in request.message_content:
-                    matched_rule = rule
-                    break
-        if matched_rule:
-            break
+    # One pass over the message finds every keyword hit; the best-ranked
+    # rule (highest rule_priority, then earliest) wins
+    best = min(
+        _get_automaton().iter(request.message_content),
+        key=itemgetter(0),
+        default=None,
+    )
+    matched_rule = best[1] if best else None
 
     if not matched_rule and _rules:
-        matched_rule = _rules[0]
+        matched_rule = next(iter(_rules.values()))
 
-    return APIResponse(data={
+    return json_response(rule_response_adapter, {
         "matched_rule": matched_rule,
         "assigned_staff": [
             {"id": "staff-001", "name": "测试员工"},
@@ -116,11 +126,10 @@ async def test_routing_rule(
 async def create_routing_rule(
     hotel_id: str = Query(..., description="Hotel ID"),
     request: RuleCreateRequest = ...,
-) -> APIResponse[dict]:
+) -> Response:
     """
     Create a new routing rule
     """
-    import uuid
     new_rule = {
         "id": f"rule-{uuid.uuid4().hex[:6]}",
         "name": request.name,
@@ -132,8 +141,9 @@ async def create_routing_rule(
         "rule_priority": request.rule_priority,
         "is_active": request.is_active,
     }
-    _rules.append(new_rule)
-    return APIResponse(data=new_rule)
+    _rules[new_rule["id"]] = new_rule
+    _invalidate_automaton()
+    return json_response(rule_response_adapter, new_rule)
 
 
 @router.put("/{rule_id}", response_model=APIResponse[dict])
@@ -144,17 +154,18 @@ async def update_routing_rule(
     """
     Update a routing rule
     """
-    for rule in _rules:
-        if rule["id"] == rule_id:
-            rule.update({
-                "name": request.name,
-                "keywords": request.keywords,
-                "rule_priority": request.rule_priority,
-                "is_active": request.is_active,
-            })
-            return APIResponse(data=rule)
+    rule = _rules.get(rule_id)
+    if rule is None:
+        return APIResponse(code=404, message="Rule not found")
 
-    return APIResponse(code=404, message="Rule not found")
+    rule.update({
+        "name": request.name,
+        "keywords": request.keywords,
+        "rule_priority": request.rule_priority,
+        "is_active": request.is_active,
+    })
+    _invalidate_automaton()
+    return APIResponse(data=rule)
 
 
 @router.delete("/{rule_id}", response_model=APIResponse)
@@ -164,8 +175,8 @@ async def delete_routing_rule(
     """
     Delete a routing rule
     """
-    global _rules
-    _rules = [r for r in _rules if r["id"] != rule_id]
+    if _rules.pop(rule_id, None) is not None:
+        _invalidate_automaton()
     return APIResponse(message="Rule deleted successfully")
 
 
@@ -177,9 +188,10 @@ async def reorder_rule(
     """
     Reorder a rule by changing its priority
     """
-    for rule in _rules:
-        if rule["id"] == rule_id:
-            rule["rule_priority"] = new_priority
-            return APIResponse(data=rule)
+    rule = _rules.get(rule_id)
+    if rule is None:
+        return APIResponse(code=404, message="Rule not found")
 
-    return APIResponse(code=404, message="Rule not found")
+    rule["rule_priority"] = new_priority
+    _invalidate_automaton()
+    return APIResponse(data=rule)
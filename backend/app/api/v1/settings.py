@@ -2,21 +2,30 @@
 System Settings API endpoints
 """
 
-from typing import List
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import json_response
+from app.core.cache import TTLCache
+from app.core.exceptions import NotFoundError
 from app.crud.system_config import system_config
+from app.dependencies import DBSession
+from app.models.conversation import Conversation
+from app.models.message import Message
+from app.models.staff import Staff
+from app.models.ticket import Ticket
+from app.schemas.common import APIResponse
 from app.schemas.system_config import (
+    PriorityConfig,
     SystemConfigCreate,
-    SystemConfigUpdate,
     SystemConfigResponse,
+    SystemConfigUpdate,
     TicketCategoryConfig,
-    PriorityConfig,
 )
-from app.schemas.common import APIResponse
-from app.dependencies import DBSession
-from app.core.exceptions import NotFoundError
 
 router = APIRouter()
 
@@ -38,41 +47,110 @@ DEFAULT_PRIORITIES = [
     {"key": "P4", "label": "低", "color": "default", "urgency_hours": 8},
 ]
 
+# Record counts for /info as scalar subqueries of one statement, so the
+# four counts cost a single round trip
+SYSTEM_STATS_STMT = select(
+    select(func.count()).select_from(Ticket).scalar_subquery().label("tickets"),
+    select(func.count()).select_from(Staff).scalar_subquery().label("staff"),
+    select(func.count()).select_from(Conversation).scalar_subquery().label("conversations"),
+    select(func.count()).select_from(Message).scalar_subquery().label("messages"),
+)
 
-@router.get("/configs", response_model=APIResponse[List[SystemConfigResponse]])
+# Validates a whole page of ORM rows in a single call
+config_list_adapter = TypeAdapter(list[SystemConfigResponse])
+category_list_adapter = TypeAdapter(list[TicketCategoryConfig])
+priority_list_adapter = TypeAdapter(list[PriorityConfig])
+
+# Envelope serializers, built once; see app.api.responses.json_response
+config_response_adapter = TypeAdapter(APIResponse[SystemConfigResponse])
+config_list_response_adapter = TypeAdapter(APIResponse[list[SystemConfigResponse]])
+category_list_response_adapter = TypeAdapter(APIResponse[list[TicketCategoryConfig]])
+priority_list_response_adapter = TypeAdapter(APIResponse[list[PriorityConfig]])
+system_info_response_adapter = TypeAdapter(APIResponse[dict])
+
+# Config keys served by the category/priority endpoints
+CATEGORIES_KEY = "ticket_categories"
+PRIORITIES_KEY = "priority_levels"
+
+# Rarely-changing settings polled by the dashboard, keyed by config key;
+# entries are dropped when the matching config is written
+settings_cache = TTLCache(ttl_seconds=30, maxsize=16)
+system_info_cache = TTLCache(ttl_seconds=60, maxsize=1)
+
+
+async def _get_cached_setting(
+    db: AsyncSession, key: str, default: list[dict], adapter: TypeAdapter
+) -> list:
+    """
+    Get a list setting, serving from the in-process cache when fresh
+
+    Args:
+        db: Database session
+        key: Configuration key
+        default: Value to use when the key is not configured
+        adapter: Adapter validating the value, once per cache fill
+
+    Returns:
+        Validated configured value, or the default
+    """
+    value = settings_cache.get(key)
+    if value is None:
+        config = await system_config.get_by_key(db, key)
+        value = adapter.validate_python(config.value if config and config.value else default)
+        settings_cache.set(key, value)
+    return value
+
+
+async def _commit_and_invalidate(db: AsyncSession, key: str) -> None:
+    """
+    Commit a config write, then drop the key's cached value
+
+    Dropping it before the commit would let a concurrent read cache the
+    old value again for a full TTL.
+
+    Args:
+        db: Database session holding the write
+        key: Configuration key
+    """
+    await db.commit()
+    settings_cache.delete(key)
+
+
+@router.get("/configs", response_model=APIResponse[list[SystemConfigResponse]])
 async def list_configs(
     db: DBSession,
     category: str | None = None,
-    skip: int = 0,
-    limit: int = 100,
-) -> APIResponse[List[SystemConfigResponse]]:
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+) -> Response:
     """List system configurations"""
     if category:
         configs = await system_config.get_by_category(db, category, skip, limit)
     else:
         configs = await system_config.get_multi(db, skip, limit)
 
-    return APIResponse(data=[SystemConfigResponse.model_validate(c) for c in configs])
+    data = config_list_adapter.validate_python(configs, from_attributes=True)
+    return json_response(config_list_response_adapter, data)
 
 
 @router.get("/configs/{config_id}", response_model=APIResponse[SystemConfigResponse])
 async def get_config(
     config_id: str,
     db: DBSession,
-) -> APIResponse[SystemConfigResponse]:
+) -> Response:
     """Get configuration by ID"""
     config = await system_config.get(db, config_id)
     if not config:
         raise NotFoundError("Configuration not found")
 
-    return APIResponse(data=SystemConfigResponse.model_validate(config))
+    return json_response(config_response_adapter, SystemConfigResponse.model_validate(config))
 
 
 @router.post("/configs", response_model=APIResponse[SystemConfigResponse])
 async def create_config(
     config_in: SystemConfigCreate,
     db: DBSession,
-) -> APIResponse[SystemConfigResponse]:
+) -> Response:
     """Create new configuration"""
     # Check if key already exists
     existing = await system_config.get_by_key(db, config_in.key)
@@ -80,7 +158,8 @@ async def create_config(
         raise HTTPException(status_code=400, detail="Configuration key already exists")
 
     config = await system_config.create(db, config_in)
-    return APIResponse(data=SystemConfigResponse.model_validate(config))
+    await _commit_and_invalidate(db, config.key)
+    return json_response(config_response_adapter, SystemConfigResponse.model_validate(config))
 
 
 @router.put("/configs/{config_id}", response_model=APIResponse[SystemConfigResponse])
@@ -88,14 +167,15 @@ async def update_config(
     config_id: str,
     config_in: SystemConfigUpdate,
     db: DBSession,
-) -> APIResponse[SystemConfigResponse]:
+) -> Response:
     """Update configuration"""
     config = await system_config.get(db, config_id)
     if not config:
         raise NotFoundError("Configuration not found")
 
     updated = await system_config.update(db, config, config_in)
-    return APIResponse(data=SystemConfigResponse.model_validate(updated))
+    await _commit_and_invalidate(db, updated.key)
+    return json_response(config_response_adapter, SystemConfigResponse.model_validate(updated))
 
 
 @router.delete("/configs/{config_id}", response_model=APIResponse)
@@ -107,97 +187,90 @@ async def delete_config(
     config = await system_config.delete(db, config_id)
     if not config:
         raise NotFoundError("Configuration not found")
+    await _commit_and_invalidate(db, config.key)
 
     return APIResponse(message="Configuration deleted successfully")
 
 
 # Ticket Categories
-@router.get("/categories", response_model=APIResponse[List[TicketCategoryConfig]])
+@router.get("/categories", response_model=APIResponse[list[TicketCategoryConfig]])
 async def get_ticket_categories(
     db: DBSession,
-) -> APIResponse[List[TicketCategoryConfig]]:
+) -> Response:
     """Get ticket categories configuration"""
-    config = await system_config.get_by_key(db, "ticket_categories")
-    if config and config.value:
-        return APIResponse(data=config.value)
-
-    # Return defaults if not configured
-    return APIResponse(data=DEFAULT_TICKET_CATEGORIES)
+    categories = await _get_cached_setting(
+        db, CATEGORIES_KEY, DEFAULT_TICKET_CATEGORIES, category_list_adapter
+    )
+    return json_response(category_list_response_adapter, categories)
 
 
-@router.put("/categories", response_model=APIResponse[List[TicketCategoryConfig]])
+@router.put("/categories", response_model=APIResponse[list[TicketCategoryConfig]])
 async def update_ticket_categories(
-    categories: List[TicketCategoryConfig],
+    categories: list[TicketCategoryConfig],
     db: DBSession,
-) -> APIResponse[List[TicketCategoryConfig]]:
+) -> Response:
     """Update ticket categories configuration"""
     await system_config.upsert(
         db,
-        "ticket_categories",
-        [c.model_dump() for c in categories],
+        CATEGORIES_KEY,
+        category_list_adapter.dump_python(categories),
         category="ticket",
         description="Ticket categories configuration",
     )
+    await _commit_and_invalidate(db, CATEGORIES_KEY)
 
-    return APIResponse(data=categories)
+    return json_response(category_list_response_adapter, categories)
 
 
 # Priorities
-@router.get("/priorities", response_model=APIResponse[List[PriorityConfig]])
+@router.get("/priorities", response_model=APIResponse[list[PriorityConfig]])
 async def get_priorities(
     db: DBSession,
-) -> APIResponse[List[PriorityConfig]]:
+) -> Response:
     """Get priority levels configuration"""
-    config = await system_config.get_by_key(db, "priority_levels")
-    if config and config.value:
-        return APIResponse(data=config.value)
-
-    # Return defaults if not configured
-    return APIResponse(data=DEFAULT_PRIORITIES)
+    priorities = await _get_cached_setting(
+        db, PRIORITIES_KEY, DEFAULT_PRIORITIES, priority_list_adapter
+    )
+    return json_response(priority_list_response_adapter, priorities)
 
 
-@router.put("/priorities", response_model=APIResponse[List[PriorityConfig]])
+@router.put("/priorities", response_model=APIResponse[list[PriorityConfig]])
 async def update_priorities(
-    priorities: List[PriorityConfig],
+    priorities: list[PriorityConfig],
     db: DBSession,
-) -> APIResponse[List[PriorityConfig]]:
+) -> Response:
     """Update priority levels configuration"""
     await system_config.upsert(
         db,
-        "priority_levels",
-        [p.model_dump() for p in priorities],
+        PRIORITIES_KEY,
+        priority_list_adapter.dump_python(priorities),
         category="ticket",
         description="Priority levels configuration",
     )
+    await _commit_and_invalidate(db, PRIORITIES_KEY)
 
-    return APIResponse(data=priorities)
+    return json_response(priority_list_response_adapter, priorities)
 
 
 # System Info
 @router.get("/info", response_model=APIResponse[dict])
 async def get_system_info(
     db: DBSession,
-) -> APIResponse[dict]:
+) -> Response:
     """Get system information"""
-    from sqlalchemy import select, func
-    from app.models.ticket import Ticket
-    from app.models.staff import Staff
-    from app.models.conversation import Conversation
-    from app.models.message import Message
-
-    # Count records
-    ticket_count = (await db.execute(select(func.count()).select_from(Ticket))).scalar() or 0
-    staff_count = (await db.execute(select(func.count()).select_from(Staff))).scalar() or 0
-    conversation_count = (await db.execute(select(func.count()).select_from(Conversation))).scalar() or 0
-    message_count = (await db.execute(select(func.count()).select_from(Message))).scalar() or 0
-
-    return APIResponse(data={
-        "version": "0.1.0",
-        "name": "迎客通 InConnect",
-        "stats": {
-            "tickets": ticket_count,
-            "staff": staff_count,
-            "conversations": conversation_count,
-            "messages": message_count,
-        },
-    })
+    info = system_info_cache.get("info")
+    if info is None:
+        stats = (await db.execute(SYSTEM_STATS_STMT)).one()
+        info = {
+            "version": "0.1.0",
+            "name": "迎客通 InConnect",
+            "stats": {
+                "tickets": stats.tickets or 0,
+                "staff": stats.staff or 0,
+                "conversations": stats.conversations or 0,
+                "messages": stats.messages or 0,
+            },
+        }
+        system_info_cache.set("info", info)
+
+    return json_response(system_info_response_adapter, info)
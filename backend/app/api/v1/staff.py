@@ -4,9 +4,11 @@ Staff API endpoints
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import json_response
 from app.crud.staff import staff as staff_crud
 from app.schemas.staff import (
     StaffCreate,
@@ -16,11 +18,19 @@ from app.schemas.staff import (
 )
 from app.schemas.common import APIResponse, PaginatedData
 from app.core.auth import get_current_user_id
+from app.core.auth_cache import invalidate_user
 from app.dependencies import DBSession
 from app.core.exceptions import NotFoundError, ValidationError
 
 router = APIRouter()
 
+# Validates a whole page of ORM rows in a single call
+staff_list_adapter = TypeAdapter(list[StaffResponse])
+
+# Serializes the paginated envelope straight to JSON bytes, bypassing the
+# response_model round-trip (the decorator keeps it for OpenAPI only)
+staff_page_response_adapter = TypeAdapter(APIResponse[PaginatedData[StaffResponse]])
+
 
 @router.get("", response_model=APIResponse[PaginatedData[StaffResponse]])
 async def list_staff(
@@ -31,7 +41,7 @@ async def list_staff(
     role: str | None = None,
     status: str | None = None,
     is_available: bool | None = None,
-) -> APIResponse[PaginatedData[StaffResponse]]:
+) -> Response:
     """
     List staff members with pagination and filters
 
@@ -47,21 +57,28 @@ async def list_staff(
     Returns:
         Paginated list of staff
     """
-    # Get staff
-    staff_list = await staff_crud.get_multi(db, skip=skip, limit=limit)
-    total = await staff_crud.count(db)
+    # Get filtered staff and total in one query
+    staff_list, total = await staff_crud.get_filtered_page(
+        db,
+        skip=skip,
+        limit=limit,
+        hotel_id=hotel_id,
+        role=role,
+        status=status,
+        is_available=is_available,
+    )
 
     # Create paginated response
     page = skip // limit + 1 if limit > 0 else 1
     pages = (total + limit - 1) // limit if limit > 0 else 0
     paginated_data = PaginatedData.create(
-        items=[StaffResponse.model_validate(s) for s in staff_list],
+        items=staff_list_adapter.validate_python(staff_list, from_attributes=True),
         total=total,
         page=page,
         page_size=limit,
     )
 
-    return APIResponse(data=paginated_data)
+    return json_response(staff_page_response_adapter, paginated_data)
 
 
 @router.get("/{staff_id}", response_model=APIResponse[StaffResponse])
@@ -103,13 +120,11 @@ async def create_staff(
     Returns:
         Created staff member
     """
-    # Check if staff with same wechat_userid exists
-    if staff_in.wechat_userid:
-        existing = await staff_crud.get_by_wechat_userid(db, staff_in.wechat_userid)
-        if existing:
-            raise ValidationError("Staff with this WeChat user ID already exists")
+    # Insert, skipping on a wechat_userid conflict, in one statement
+    staff_member = await staff_crud.create_unique(db, staff_in)
+    if staff_member is None:
+        raise ValidationError("Staff with this WeChat user ID already exists")
 
-    staff_member = await staff_crud.create(db, staff_in)
     return APIResponse(
         message="Staff created successfully",
         data=StaffResponse.model_validate(staff_member),
@@ -135,11 +150,13 @@ async def update_staff(
     Returns:
         Updated staff member
     """
-    staff_member = await staff_crud.get(db, staff_id)
-    if not staff_member:
+    updated_staff = await staff_crud.update_by_id(db, staff_id, staff_in)
+    if not updated_staff:
         raise NotFoundError("Staff not found")
 
-    updated_staff = await staff_crud.update(db, staff_member, staff_in)
+    # A role or status change must not be masked by a cached verification
+    invalidate_user(staff_id)
+
     return APIResponse(
         message="Staff updated successfully",
         data=StaffResponse.model_validate(updated_staff),
@@ -163,13 +180,11 @@ async def delete_staff(
     Returns:
         Success response
     """
-    staff_member = await staff_crud.get(db, staff_id)
-    if not staff_member:
+    deleted = await staff_crud.delete_by_id(db, staff_id)
+    if not deleted:
         raise NotFoundError("Staff not found")
 
-    deleted = await staff_crud.delete(db, staff_id)
-    if not deleted:
-        raise ValidationError("Failed to delete staff")
+    invalidate_user(staff_id)
 
     return APIResponse(message="Staff deleted successfully")
 
@@ -191,15 +206,10 @@ async def toggle_availability(
     Returns:
         Updated staff member
     """
-    staff_member = await staff_crud.get(db, staff_id)
-    if not staff_member:
+    updated_staff = await staff_crud.toggle_availability(db, staff_id)
+    if not updated_staff:
         raise NotFoundError("Staff not found")
 
-    updated_staff = await staff_crud.update(
-        db,
-        staff_member,
-        {"is_available": not staff_member.is_available},
-    )
     return APIResponse(
         message="Staff availability updated",
         data=StaffResponse.model_validate(updated_staff),
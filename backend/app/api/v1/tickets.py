@@ -2,32 +2,187 @@
 Ticket API endpoints
 """
 
-from datetime import datetime
+from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import format_datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
 
+from app.api.responses import json_response
+from app.core.auth import get_current_user_id
+from app.core.exceptions import NotFoundError, ValidationError
 from app.crud.ticket import ticket as ticket_crud
 from app.crud.ticket_timeline import ticket_timeline as timeline_crud
+from app.dependencies import DBSession
+from app.models.ticket import (
+    Ticket,
+    TicketCategory,
+    TicketPriority,
+    TicketStatus,
+)
+from app.models.ticket_timeline import TicketTimeline
+from app.schemas.common import APIResponse, PaginatedData
 from app.schemas.ticket import (
+    TicketAssignRequest,
     TicketCreate,
-    TicketUpdate,
     TicketResponse,
-    TicketListResponse,
-    TicketAssignRequest,
     TicketStatusUpdateRequest,
+    TicketUpdate,
 )
 from app.schemas.ticket_timeline import TicketTimelineResponse
-from app.schemas.common import APIResponse, PaginatedData
-from app.core.auth import get_current_user_id
-from app.dependencies import DBSession
-from app.core.exceptions import NotFoundError, ValidationError
-from app.models.ticket import TicketStatus
 from app.services.routing_service import routing_service
+from app.services.timeline_writer import timeline_writer
 
 router = APIRouter()
 
+# Envelope serializers, built once; see app.api.responses.json_response
+ticket_response_adapter = TypeAdapter(APIResponse[TicketResponse])
+ticket_list_response_adapter = TypeAdapter(APIResponse[list[TicketResponse]])
+ticket_page_response_adapter = TypeAdapter(APIResponse[PaginatedData[TicketResponse]])
+timeline_list_response_adapter = TypeAdapter(APIResponse[list[TicketTimelineResponse]])
+
+# Response fields, read straight off the ORM rows
+_TICKET_FIELDS = tuple(TicketResponse.model_fields)
+_TIMELINE_FIELDS = tuple(TicketTimelineResponse.model_fields)
+
+
+# Valid status transitions, keyed by current status
+_VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    TicketStatus.PENDING.value: frozenset({
+        TicketStatus.ASSIGNED.value,
+        TicketStatus.CLOSED.value,
+    }),
+    TicketStatus.ASSIGNED.value: frozenset({
+        TicketStatus.IN_PROGRESS.value,
+        TicketStatus.CLOSED.value,
+    }),
+    TicketStatus.IN_PROGRESS.value: frozenset({
+        TicketStatus.RESOLVED.value,
+        TicketStatus.CLOSED.value,
+    }),
+    TicketStatus.RESOLVED.value: frozenset({
+        TicketStatus.CLOSED.value,
+        TicketStatus.REOPENED.value,
+    }),
+    TicketStatus.CLOSED.value: frozenset({
+        TicketStatus.REOPENED.value,
+    }),
+    TicketStatus.REOPENED.value: frozenset({
+        TicketStatus.ASSIGNED.value,
+        TicketStatus.IN_PROGRESS.value,
+        TicketStatus.CLOSED.value,
+    }),
+}
+
+
+def _conditional_response(
+    request: Request,
+    etag: str,
+    last_modified: datetime | None,
+    build: Callable[[], Response],
+) -> Response:
+    """
+    Return 304 when the client's copy is current, otherwise build the response
+
+    The version is derived from the rows already loaded, so a revalidating
+    poll skips schema conversion and JSON encoding. Clients must revalidate
+    on every use (no-cache), so an update is never masked.
+
+    Args:
+        request: Incoming request
+        etag: Entity tag of the current representation
+        last_modified: Naive UTC modification time, if known
+        build: Builds the full JSON response on a miss
+
+    Returns:
+        JSON response, or 304 when the client copy is current
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.replace(tzinfo=UTC), usegmt=True
+        )
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response = build()
+    response.headers.update(headers)
+    return response
+
+
+def _ticket_to_response(ticket: Ticket) -> TicketResponse:
+    """
+    Build a TicketResponse from a Ticket row without validation
+
+    Validation is intentionally skipped: rows come from our own model, whose
+    columns already hold the schema's types. Only the enum columns, stored
+    as plain strings, are wrapped so they serialize as enums. Inbound bodies
+    (TicketCreate, TicketUpdate) are still fully validated.
+
+    Args:
+        ticket: Ticket instance
+
+    Returns:
+        Ticket response
+    """
+    attrs = {name: getattr(ticket, name) for name in _TICKET_FIELDS}
+    attrs["category"] = TicketCategory(attrs["category"])
+    attrs["priority"] = TicketPriority(attrs["priority"])
+    attrs["status"] = TicketStatus(attrs["status"])
+    return TicketResponse.model_construct(**attrs)
+
+
+def _timeline_entry(
+    ticket_id: str,
+    event_type: str,
+    staff_id: str | None,
+    old_value: str | None = None,
+    new_value: str | None = None,
+    comment: str | None = None,
+) -> dict:
+    """
+    Build the column values of a timeline entry for timeline_writer.enqueue
+
+    Every entry carries the same keys, so a batch goes out as one INSERT.
+
+    Args:
+        ticket_id: Ticket ID
+        event_type: Event type
+        staff_id: Staff ID who made the change
+        old_value: Old value
+        new_value: New value
+        comment: Additional comment
+
+    Returns:
+        Timeline entry values
+    """
+    return {
+        "ticket_id": ticket_id,
+        "staff_id": staff_id,
+        "event_type": event_type,
+        "old_value": old_value,
+        "new_value": new_value,
+        "comment": comment,
+    }
+
+
+def _timeline_to_response(timeline: TicketTimeline) -> TicketTimelineResponse:
+    """
+    Build a TicketTimelineResponse from a TicketTimeline row without validation
+
+    Args:
+        timeline: Timeline entry instance
+
+    Returns:
+        Timeline entry response
+    """
+    return TicketTimelineResponse.model_construct(
+        **{name: getattr(timeline, name) for name in _TIMELINE_FIELDS}
+    )
+
 
 @router.get("", response_model=APIResponse[PaginatedData[TicketResponse]])
 async def list_tickets(
@@ -38,7 +193,7 @@ async def list_tickets(
     status: str | None = None,
     priority: str | None = None,
     category: str | None = None,
-) -> APIResponse[PaginatedData[TicketResponse]]:
+) -> Response:
     """
     List tickets with pagination and filters
 
@@ -54,29 +209,28 @@ async def list_tickets(
     Returns:
         Paginated list of tickets
     """
-    # Get tickets based on filters
-    if hotel_id:
-        tickets = await ticket_crud.get_by_hotel(db, hotel_id, skip, limit)
-        # Count would need to be added
-        total = len(tickets)  # Simplified for MVP
-    elif status:
-        tickets = await ticket_crud.get_by_status(db, status, skip, limit)
-        total = len(tickets)
-    else:
-        tickets = await ticket_crud.get_multi(db, skip, limit)
-        total = await ticket_crud.count(db)
+    # Get filtered tickets and total in one query
+    tickets, total = await ticket_crud.get_filtered_page(
+        db,
+        skip=skip,
+        limit=limit,
+        hotel_id=hotel_id,
+        status=status,
+        priority=priority,
+        category=category,
+    )
 
     # Create paginated response
     page = skip // limit + 1 if limit > 0 else 1
     pages = (total + limit - 1) // limit if limit > 0 else 0
     paginated_data = PaginatedData.create(
-        items=[TicketResponse.model_validate(t) for t in tickets],
+        items=[_ticket_to_response(t) for t in tickets],
         total=total,
         page=page,
         page_size=limit,
     )
 
-    return APIResponse(data=paginated_data)
+    return json_response(ticket_page_response_adapter, paginated_data)
 
 
 @router.get("/open", response_model=APIResponse[list[TicketResponse]])
@@ -84,7 +238,7 @@ async def get_open_tickets(
     db: DBSession,
     hotel_id: str | None = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> APIResponse[list[TicketResponse]]:
+) -> Response:
     """
     Get open (not resolved/closed) tickets
 
@@ -97,56 +251,85 @@ async def get_open_tickets(
         List of open tickets
     """
     tickets = await ticket_crud.get_open_tickets(db, hotel_id, limit)
-    return APIResponse(data=[TicketResponse.model_validate(t) for t in tickets])
+    return json_response(
+        ticket_list_response_adapter, [_ticket_to_response(t) for t in tickets]
+    )
 
 
 @router.get("/{ticket_id}", response_model=APIResponse[TicketResponse])
 async def get_ticket(
     ticket_id: str,
+    request: Request,
     db: DBSession,
-) -> APIResponse[TicketResponse]:
+) -> Response:
     """
     Get ticket by ID with relations
 
     Args:
         ticket_id: Ticket ID
+        request: Incoming request
         db: Database session
 
     Returns:
-        Ticket details
+        Ticket details, or 304 when the client copy is current
     """
     ticket = await ticket_crud.get_with_relations(db, ticket_id)
     if not ticket:
         raise NotFoundError("Ticket not found")
 
-    return APIResponse(data=TicketResponse.model_validate(ticket))
+    # Every ticket write bumps updated_at
+    etag = f'W/"{ticket.id}-{ticket.updated_at:%Y%m%d%H%M%S%f}"'
+    return _conditional_response(
+        request,
+        etag,
+        ticket.updated_at,
+        lambda: json_response(ticket_response_adapter, _ticket_to_response(ticket)),
+    )
 
 
 @router.get("/{ticket_id}/timeline", response_model=APIResponse[list[TicketTimelineResponse]])
 async def get_ticket_timeline(
     ticket_id: str,
+    request: Request,
     db: DBSession,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> APIResponse[list[TicketTimelineResponse]]:
+) -> Response:
     """
     Get ticket timeline entries
 
     Args:
         ticket_id: Ticket ID
+        request: Incoming request
         db: Database session
         limit: Maximum records to return
 
     Returns:
-        List of timeline entries
+        List of timeline entries, or 304 when the client copy is current
     """
     ticket = await ticket_crud.get(db, ticket_id)
     if not ticket:
         raise NotFoundError("Ticket not found")
 
+    # Let the entries this process committed before the read land first,
+    # so the page (and its ETag) is not behind a completed write
+    await timeline_writer.flush()
     timelines = await timeline_crud.get_by_ticket(db, ticket_id, limit)
-    return APIResponse(data=[
-        TicketTimelineResponse.model_validate(t) for t in timelines
-    ])
+
+    # Entries are append-only and newest first, so the newest entry
+    # versions the page
+    newest = timelines[0] if timelines else None
+    etag = (
+        f'W/"{ticket_id}-{limit}-{newest.id}-{newest.created_at:%Y%m%d%H%M%S%f}"'
+        if newest else f'W/"{ticket_id}-{limit}-empty"'
+    )
+    return _conditional_response(
+        request,
+        etag,
+        newest.created_at if newest else None,
+        lambda: json_response(
+            timeline_list_response_adapter, [_timeline_to_response(t) for t in timelines]
+        ),
+    )
 
 
 @router.post("", response_model=APIResponse[TicketResponse])
@@ -154,7 +337,7 @@ async def create_ticket(
     ticket_in: TicketCreate,
     db: DBSession,
     user_id: str = Depends(get_current_user_id),
-) -> APIResponse[TicketResponse]:
+) -> Response:
     """
     Create new ticket
 
@@ -167,34 +350,35 @@ async def create_ticket(
         Created ticket
     """
     ticket = await ticket_crud.create(db, ticket_in)
+    timeline_entries = []
 
     # Auto-assign if requested
     if ticket_in.auto_assign:
         assigned = await routing_service.auto_assign_ticket(db, ticket)
         if assigned:
             # Create timeline entry for auto-assignment
-            await timeline_crud.create_timeline_entry(
-                db,
+            timeline_entries.append(_timeline_entry(
                 ticket.id,
                 "assigned",
                 None,
                 new_value=ticket.assigned_to,
                 comment="Automatically assigned based on routing rules",
-            )
+            ))
 
     # Create timeline entry
-    await timeline_crud.create_timeline_entry(
-        db,
+    timeline_entries.append(_timeline_entry(
         ticket.id,
         "created",
         user_id,
         new_value=ticket.title,
         comment=f"Ticket created: {ticket.title}",
-    )
+    ))
+    await timeline_writer.enqueue(db, timeline_entries)
 
-    return APIResponse(
+    return json_response(
+        ticket_response_adapter,
+        _ticket_to_response(ticket),
         message="Ticket created successfully",
-        data=TicketResponse.model_validate(ticket),
     )
 
 
@@ -204,7 +388,7 @@ async def update_ticket(
     ticket_in: TicketUpdate,
     db: DBSession,
     user_id: str = Depends(get_current_user_id),
-) -> APIResponse[TicketResponse]:
+) -> Response:
     """
     Update ticket
 
@@ -222,9 +406,10 @@ async def update_ticket(
         raise NotFoundError("Ticket not found")
 
     updated_ticket = await ticket_crud.update(db, ticket, ticket_in)
-    return APIResponse(
+    return json_response(
+        ticket_response_adapter,
+        _ticket_to_response(updated_ticket),
         message="Ticket updated successfully",
-        data=TicketResponse.model_validate(updated_ticket),
     )
 
 
@@ -234,7 +419,7 @@ async def assign_ticket(
     assign_in: TicketAssignRequest,
     db: DBSession,
     user_id: str = Depends(get_current_user_id),
-) -> APIResponse[TicketResponse]:
+) -> Response:
     """
     Assign ticket to staff member
 
@@ -262,31 +447,33 @@ async def assign_ticket(
     )
 
     # Create timeline entries
+    timeline_entries = []
     if old_assignee != assign_in.staff_id:
-        await timeline_crud.create_timeline_entry(
-            db,
+        timeline_entries.append(_timeline_entry(
             ticket_id,
             "assigned",
             user_id,
             old_value=old_assignee or "unassigned",
             new_value=assign_in.staff_id,
             comment=assign_in.comment,
-        )
+        ))
 
     if old_status != TicketStatus.ASSIGNED.value:
-        await timeline_crud.create_timeline_entry(
-            db,
+        timeline_entries.append(_timeline_entry(
             ticket_id,
             "status_changed",
             user_id,
             old_value=old_status,
             new_value=TicketStatus.ASSIGNED.value,
             comment="Ticket status changed to assigned",
-        )
+        ))
+
+    await timeline_writer.enqueue(db, timeline_entries)
 
-    return APIResponse(
+    return json_response(
+        ticket_response_adapter,
+        _ticket_to_response(updated_ticket),
         message="Ticket assigned successfully",
-        data=TicketResponse.model_validate(updated_ticket),
     )
 
 
@@ -296,7 +483,7 @@ async def update_ticket_status(
     status_in: TicketStatusUpdateRequest,
     db: DBSession,
     user_id: str = Depends(get_current_user_id),
-) -> APIResponse[TicketResponse]:
+) -> Response:
     """
     Update ticket status
 
@@ -321,49 +508,51 @@ async def update_ticket_status(
             f"Invalid status transition from {old_status} to {status_in.status}"
         )
 
-    # Update ticket status
-    update_data = {"status": status_in.status}
+    # Update ticket status. One timestamp, naive UTC like the model
+    # defaults, covers updated_at and the resolved/closed time
+    now = datetime.utcnow()
+    update_data = {"status": status_in.status, "updated_at": now}
 
     # Set timestamps based on status
     if status_in.status == TicketStatus.RESOLVED.value:
-        update_data["resolved_at"] = datetime.utcnow()
+        update_data["resolved_at"] = now
     elif status_in.status == TicketStatus.CLOSED.value:
-        update_data["closed_at"] = datetime.utcnow()
+        update_data["closed_at"] = now
 
     updated_ticket = await ticket_crud.update(db, ticket, update_data)
 
     # Create timeline entry
-    await timeline_crud.create_timeline_entry(
-        db,
+    timeline_entries = [_timeline_entry(
         ticket_id,
         "status_changed",
         user_id,
         old_value=old_status,
         new_value=status_in.status,
         comment=status_in.comment,
-    )
+    )]
 
     # Create specific timeline entry based on status
     if status_in.status == TicketStatus.RESOLVED.value:
-        await timeline_crud.create_timeline_entry(
-            db,
+        timeline_entries.append(_timeline_entry(
             ticket_id,
             "resolved",
             user_id,
             comment=status_in.comment,
-        )
+        ))
     elif status_in.status == TicketStatus.CLOSED.value:
-        await timeline_crud.create_timeline_entry(
-            db,
+        timeline_entries.append(_timeline_entry(
             ticket_id,
             "closed",
             user_id,
             comment=status_in.comment,
-        )
+        ))
+
+    await timeline_writer.enqueue(db, timeline_entries)
 
-    return APIResponse(
+    return json_response(
+        ticket_response_adapter,
+        _ticket_to_response(updated_ticket),
         message=f"Ticket status updated to {status_in.status}",
-        data=TicketResponse.model_validate(updated_ticket),
     )
 
 
@@ -406,32 +595,4 @@ def _is_valid_status_transition(old_status: str, new_status: str) -> bool:
     Returns:
         True if transition is valid
     """
-    # Define valid transitions
-    valid_transitions = {
-        TicketStatus.PENDING.value: [
-            TicketStatus.ASSIGNED.value,
-            TicketStatus.CLOSED.value,
-        ],
-        TicketStatus.ASSIGNED.value: [
-            TicketStatus.IN_PROGRESS.value,
-            TicketStatus.CLOSED.value,
-        ],
-        TicketStatus.IN_PROGRESS.value: [
-            TicketStatus.RESOLVED.value,
-            TicketStatus.CLOSED.value,
-        ],
-        TicketStatus.RESOLVED.value: [
-            TicketStatus.CLOSED.value,
-            TicketStatus.REOPENED.value,
-        ],
-        TicketStatus.CLOSED.value: [
-            TicketStatus.REOPENED.value,
-        ],
-        TicketStatus.REOPENED.value: [
-            TicketStatus.ASSIGNED.value,
-            TicketStatus.IN_PROGRESS.value,
-            TicketStatus.CLOSED.value,
-        ],
-    }
-
-    return new_status in valid_transitions.get(old_status, [])
+    return new_status in _VALID_TRANSITIONS.get(old_status, frozenset())
@@ -2,19 +2,17 @@
 WeChat Webhook for receiving messages
 """
 
-import json
 from typing import Any
 
-from fastapi import APIRouter, Request, Header
+from fastapi import APIRouter, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.logging import get_logger
 from app.crud.conversation import conversation as conversation_crud
 from app.crud.message import message as message_crud
-from app.schemas.conversation import ConversationCreate
-from app.core.logging import get_logger
-from app.dependencies import get_db_session
-from app.models.conversation import Conversation
+from app.dependencies import DBSession
 from app.models.message import Message
+from app.schemas.webhook import WeChatEvent
 
 router = APIRouter()
 logger = get_logger("app.api.v1.webhook")
@@ -23,7 +21,8 @@ logger = get_logger("app.api.v1.webhook")
 @router.post("/wechat", status_code=200)
 async def wechat_webhook(
     request: Request,
-) -> dict[str, str]:
+    db: DBSession,
+) -> dict[str, Any]:
     """
     WeChat webhook endpoint for receiving messages
 
@@ -32,43 +31,39 @@ async def wechat_webhook(
 
     Args:
         request: FastAPI request
+        db: Database session
 
     Returns:
         Success response
     """
-    from app.dependencies import get_db_session
-
-    db = await anext(get_db_session())
-
     try:
-        # Get raw body
+        # Parse and validate the raw body in a single pass
         body = await request.body()
-        data = json.loads(body)
+        event = WeChatEvent.model_validate_json(body)
 
         logger.info(
             "Received WeChat webhook",
-            extra={"event_type": data.get("event_type", "unknown")},
+            extra={"event_type": event.event_type},
         )
 
         # Parse message data
-        msg_type = data.get("msgtype")
-        from_user = data.get("from_user", {}).get("userid")
-        to_user = data.get("to_user", {}).get("userid")
-        agent_id = data.get("agentid")
+        msg_type = event.msgtype
+        from_user = event.from_user.userid
+        to_user = event.to_user.userid
+        agent_id = event.agentid
 
         # For MVP, we'll use a simplified approach
         # In production, you would verify the signature
         # and handle different message types properly
 
         if msg_type == "text":
-            content = data.get("content", "")
             message = await _handle_text_message(
                 db,
                 from_user,
                 to_user,
                 agent_id,
-                content,
-                data.get("msgid"),
+                event.content,
+                event.msgid,
             )
 
             # Check for auto-ticket creation
@@ -78,26 +73,24 @@ async def wechat_webhook(
                     await auto_ticket_service.create_ticket_from_message(db, message)
 
         elif msg_type == "image":
-            media_id = data.get("media_id")
             await _handle_media_message(
                 db,
                 from_user,
                 to_user,
                 agent_id,
                 "image",
-                media_id,
-                data.get("msgid"),
+                event.media_id,
+                event.msgid,
             )
         elif msg_type == "voice":
-            media_id = data.get("media_id")
             await _handle_media_message(
                 db,
                 from_user,
                 to_user,
                 agent_id,
                 "voice",
-                media_id,
-                data.get("msgid"),
+                event.media_id,
+                event.msgid,
             )
 
         return {"errcode": 0, "errmsg": "ok"}
@@ -108,10 +101,10 @@ async def wechat_webhook(
             exc_info=True,
             extra={"error": str(e)},
         )
-        # Return success anyway to avoid retry loops
+        # Discard the partial work so the session commits cleanly, and
+        # return success anyway to avoid retry loops
+        await db.rollback()
         return {"errcode": 0, "errmsg": "ok"}
-    finally:
-        await db.close()
 
 
 async def _handle_text_message(
@@ -132,34 +125,21 @@ async def _handle_text_message(
         agent_id: Agent ID
         content: Message content
         msg_id: WeChat message ID
-    """
-    from datetime import datetime
 
-    # Check for duplicate messages
-    if msg_id:
-        existing = await message_crud.get_by_wechat_msg_id(db, msg_id)
-        if existing:
-            logger.info("Duplicate message ignored", extra={"msg_id": msg_id})
-            return
-
-    # Get or create conversation
+    Returns:
+        Created message, or None for a duplicate
+    """
+    # Get or create conversation, updating last_message_at
     hotel_id = agent_id or "default_hotel"
 
-    conv = await conversation_crud.get_by_guest_and_hotel(
+    conv, created = await conversation_crud.upsert_by_guest(
         db, hotel_id, from_user
     )
-
-    if not conv:
-        conv_data = ConversationCreate(
-            hotel_id=hotel_id,
-            guest_id=from_user,
-            status="active",
-        )
-        conv = await conversation_crud.create(db, conv_data)
+    if created:
         logger.info("Created new conversation", extra={"conversation_id": conv.id})
 
-    # Create message
-    await message_crud.create_message(
+    # Create message; a WeChat retry of a stored message inserts nothing
+    message = await message_crud.create_unique_message(
         db,
         conv.id,
         "text",
@@ -168,14 +148,11 @@ async def _handle_text_message(
         sender_id=from_user,
         wechat_msg_id=msg_id,
     )
-
-    # Update conversation
-    from sqlalchemy import update
-    await db.execute(
-        update(Conversation)  # type: ignore
-        .filter(Conversation.id == conv.id)
-        .values(last_message_at=datetime.utcnow())
-    )
+    if message is None:
+        # Undo the conversation touch as well
+        await db.rollback()
+        logger.info("Duplicate message ignored", extra={"msg_id": msg_id})
+        return None
     await db.commit()
 
     logger.info(
@@ -183,15 +160,8 @@ async def _handle_text_message(
         extra={"conversation_id": conv.id, "guest_id": from_user},
     )
 
-    # Get the message for auto-ticket processing
-    from app.models.message import Message
-    msg_result = await db.execute(
-        select(Message)
-        .filter(Message.conversation_id == conv.id)
-        .order_by(Message.created_at.desc())
-        .limit(1)
-    )
-    return msg_result.scalar_one_or_none()
+    # The created message is used for auto-ticket processing
+    return message
 
 
 async def _handle_media_message(
@@ -215,32 +185,16 @@ async def _handle_media_message(
         media_id: WeChat media ID
         msg_id: WeChat message ID
     """
-    from datetime import datetime
-
-    # Check for duplicate
-    if msg_id:
-        existing = await message_crud.get_by_wechat_msg_id(db, msg_id)
-        if existing:
-            return
-
+    # Get or create conversation, updating last_message_at
     hotel_id = agent_id or "default_hotel"
 
-    conv = await conversation_crud.get_by_guest_and_hotel(
-        db, hotel_id, from_user
-    )
-
-    if not conv:
-        conv_data = ConversationCreate(
-            hotel_id=hotel_id,
-            guest_id=from_user,
-            status="active",
-        )
-        conv = await conversation_crud.create(db, conv_data)
+    conv, _ = await conversation_crud.upsert_by_guest(db, hotel_id, from_user)
 
     # In production, download media from WeChat and store in object storage
     media_url = f"wechat://{media_type}/{media_id}"
 
-    await message_crud.create_message(
+    # A WeChat retry of a stored message inserts nothing
+    message = await message_crud.create_unique_message(
         db,
         conv.id,
         media_type,
@@ -249,12 +203,8 @@ async def _handle_media_message(
         sender_id=from_user,
         wechat_msg_id=msg_id,
     )
-
-    # Update conversation
-    from sqlalchemy import update
-    await db.execute(
-        update(Conversation)  # type: ignore
-        .filter(Conversation.id == conv.id)
-        .values(last_message_at=datetime.utcnow())
-    )
+    if message is None:
+        # Undo the conversation touch as well
+        await db.rollback()
+        return
     await db.commit()
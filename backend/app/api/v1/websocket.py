@@ -5,16 +5,20 @@ WebSocket endpoint for real-time notifications
 import json
 from typing import Annotated
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from jose import JWTError
 
-from app.services.websocket_manager import manager, WebSocketMessage
-from app.core.security import decode_access_token
+from app.services.websocket_manager import manager, WebSocketClientMessage
+from app.core.auth_cache import decode_access_token_cached
 from app.core.logging import get_logger
 
 router = APIRouter()
 logger = get_logger("app.api.v1.websocket")
 
+# Pong envelope, encoded once; only the echoed timestamp is spliced in
+_PONG_PREFIX = '{"type":"pong","data":{"timestamp":'
+_PONG_SUFFIX = "}}"
+
 
 @router.websocket("/ws")
 async def websocket_endpoint(
@@ -30,7 +34,7 @@ async def websocket_endpoint(
     """
     # Verify token
     try:
-        payload = decode_access_token(token)
+        payload = decode_access_token_cached(token)
         if payload is None:
             await websocket.close(code=1008, reason="Invalid token")
             return
@@ -58,15 +62,29 @@ async def websocket_endpoint(
 
         # Keep connection alive and handle incoming messages
         while True:
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+
+            # The web client sends text frames; binary frames are parsed
+            # straight from bytes, skipping the UTF-8 decode step
+            is_binary = frame.get("text") is None
+            message = WebSocketClientMessage.model_validate_json(
+                frame["bytes"] if is_binary else frame["text"]
+            )
 
             # Handle client messages (ping, subscribe, etc.)
-            if message_data.get("type") == "ping":
-                await websocket.send_json({
-                    "type": "pong",
-                    "data": {"timestamp": message_data.get("timestamp")},
-                })
+            if message.type == "ping":
+                pong = (
+                    _PONG_PREFIX
+                    + json.dumps(message.timestamp, separators=(",", ":"), ensure_ascii=False)
+                    + _PONG_SUFFIX
+                )
+                # Reply in the frame type the client used
+                if is_binary:
+                    await websocket.send_bytes(pong.encode())
+                else:
+                    await websocket.send_text(pong)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket, user_id)
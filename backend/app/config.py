@@ -46,6 +46,11 @@ class Settings(BaseSettings):
     wechat_app_secret: str = Field(default="", alias="WECHAT_APP_SECRET")
     wechat_agent_id: int = Field(default=0, alias="WECHAT_AGENT_ID")
 
+    # Reports
+    report_refresh_interval_seconds: int = Field(
+        default=300, alias="REPORT_REFRESH_INTERVAL_SECONDS"
+    )
+
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
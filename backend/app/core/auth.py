@@ -5,7 +5,7 @@ Authentication dependencies for FastAPI
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.core.security import decode_access_token
+from app.core.auth_cache import decode_access_token_cached
 from app.core.exceptions import UnauthorizedError
 
 # HTTP Bearer token scheme
@@ -31,7 +31,7 @@ async def get_current_user_id(
         raise UnauthorizedError("Missing authentication token")
 
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
 
     if payload is None:
         raise UnauthorizedError("Invalid or expired token")
@@ -59,7 +59,7 @@ async def get_optional_user_id(
         return None
 
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
 
     if payload is None:
         return None
@@ -0,0 +1,64 @@
+"""
+Cache of verified JWT access token payloads
+"""
+
+import time
+from typing import Any
+
+from app.core.cache import TTLCache
+from app.core.security import decode_access_token
+
+# Verified payloads keyed by the raw token string. A cache hit skips the
+# HMAC check and base64/JSON decoding; entries still honour the token's
+# own exp claim, so a token never outlives its expiry here.
+_token_cache = TTLCache(ttl_seconds=60, maxsize=10_000)
+
+
+def decode_access_token_cached(token: str) -> dict[str, Any] | None:
+    """
+    Decode and verify JWT access token, reusing a recent verification
+
+    Args:
+        token: JWT token to decode
+
+    Returns:
+        Decoded token payload or None if invalid
+    """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, exp = cached
+        if exp is None or exp > time.time():
+            return payload
+        _token_cache.delete(token)
+        return None
+
+    payload = decode_access_token(token)
+    if payload is not None:
+        _token_cache.set(token, (payload, payload.get("exp")))
+    return payload
+
+
+def invalidate(token: str) -> None:
+    """
+    Drop a token's cached payload
+
+    Args:
+        token: JWT token
+    """
+    _token_cache.delete(token)
+
+
+def invalidate_user(user_id: str) -> None:
+    """
+    Drop the cached payloads of every token issued to a user
+
+    Called when the user's account changes (role, status, deletion), so
+    this worker re-verifies the user's tokens instead of reusing a cached
+    payload. This keeps the cache fresh; it does not revoke anything: the
+    tokens still verify, here and in other workers, until they expire.
+    Scans the whole cache (up to maxsize entries) on every call.
+
+    Args:
+        user_id: User ID (the tokens' sub claim)
+    """
+    _token_cache.delete_where(lambda cached: cached[0].get("sub") == user_id)
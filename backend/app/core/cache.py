@@ -0,0 +1,80 @@
+"""
+In-process caching utilities
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Small in-process cache with per-entry expiry
+
+    Entries expire ttl_seconds after they are set. When maxsize is reached
+    the least recently set entry is evicted. Each worker process holds its
+    own copy, so this suits data where a short staleness window is fine.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Drop a cached value if present
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Drop every cached value the predicate selects
+
+        Args:
+            predicate: Called with each cached value; True drops the entry
+        """
+        for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
@@ -4,13 +4,14 @@ Database session and connection management
 
 from typing import AsyncGenerator
 
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from app.config import get_settings
 
@@ -19,23 +20,64 @@ settings = get_settings()
 # Check if using SQLite
 is_sqlite = settings.database_url.startswith("sqlite")
 
+# Check if using PostgreSQL (any driver)
+is_postgresql = settings.database_url.startswith("postgresql")
+
+# Check if using the asyncpg driver
+is_asyncpg = settings.database_url.startswith("postgresql+asyncpg")
+
+# An in-memory SQLite database lives and dies with its connection
+is_sqlite_memory = is_sqlite and make_url(settings.database_url).database in (None, "", ":memory:")
+
 # Create async engine with appropriate settings
-if is_sqlite:
+if is_sqlite_memory:
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+elif is_sqlite:
+    # A small pool of long-lived connections: concurrent readers are not
+    # serialized on one connection, and each keeps its page cache warm
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+        max_overflow=10,
+    )
 else:
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
         pool_pre_ping=True,
         pool_size=20,
-        max_overflow=0,
+        # Allow short bursts above the steady pool instead of queueing
+        max_overflow=10,
+        # Recycle before server/proxy idle timeouts drop the connection
+        pool_recycle=1800,
+        # Keep more prepared statements per pooled connection so hot lookups
+        # (login, ticket/staff reads) skip server-side parsing
+        connect_args={"prepared_statement_cache_size": 500} if is_asyncpg else {},
     )
 
+if is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        """
+        Tune each new SQLite connection
+
+        WAL lets readers run alongside the writer, synchronous=NORMAL is
+        safe under WAL, and a 64 MB page cache keeps hot pages in memory.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -50,6 +92,22 @@ class Base(DeclarativeBase):
     pass
 
 
+def session_dialect(db: AsyncSession) -> str:
+    """
+    Get the dialect name of the database a session is bound to
+
+    Unlike the module-level flags, which follow settings.database_url,
+    this reflects the engine the session actually talks to.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dialect name, e.g. "postgresql" or "sqlite"
+    """
+    return db.get_bind().dialect.name
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get database session for dependency injection
@@ -74,6 +132,34 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_db() -> None:
+    """
+    Run the hottest lookups once at startup with throwaway parameters
+
+    This fills SQLAlchemy's compiled statement cache (and, on asyncpg, the
+    pooled connection's prepared statement cache) so the first login or
+    hotel/ticket lookup after a worker starts does not pay for it.
+    Failures are logged and never block startup.
+    """
+    from app.core.logging import get_logger
+    from app.crud.conversation import conversation as conversation_crud
+    from app.crud.hotel import hotel as hotel_crud
+    from app.crud.staff import staff as staff_crud
+    from app.crud.ticket import ticket as ticket_crud
+
+    logger = get_logger("app.database")
+
+    try:
+        async with async_session_maker() as session:
+            await hotel_crud.get(session, "warmup")
+            await staff_crud.get(session, "warmup")
+            await staff_crud.get_by_wechat_userid(session, "warmup")
+            await ticket_crud.get(session, "warmup")
+            await conversation_crud.get(session, "warmup")
+    except Exception as e:
+        logger.warning("Database warm-up skipped", error=str(e))
+
+
 async def close_db() -> None:
     """Close database connections"""
     await engine.dispose()
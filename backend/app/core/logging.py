@@ -45,42 +45,46 @@ class Logger:
 
     def _log(
         self,
-        level: str,
+        level: int,
         message: str,
-        context: dict[str, Any] | None = None,
+        context: dict[str, Any],
     ) -> None:
         """
         Log message with context
 
+        Filtered levels return before any record is built. Context is
+        passed as record attributes, which the JSON formatter emits as
+        fields; exc_info is forwarded to the stdlib logger as such.
+
         Args:
-            level: Log level (debug, info, warning, error, critical)
+            level: Log level (logging.DEBUG ... logging.CRITICAL)
             message: Log message
             context: Additional context data
         """
-        log_data = {"message": message}
-        if context:
-            log_data.update(context)
-        getattr(self.logger, level)(log_data)
+        if not self.logger.isEnabledFor(level):
+            return
+        exc_info = context.pop("exc_info", None)
+        self.logger.log(level, message, exc_info=exc_info, extra=context)
 
     def debug(self, message: str, **context: Any) -> None:
         """Log debug message"""
-        self._log("debug", message, context)
+        self._log(logging.DEBUG, message, context)
 
     def info(self, message: str, **context: Any) -> None:
         """Log info message"""
-        self._log("info", message, context)
+        self._log(logging.INFO, message, context)
 
     def warning(self, message: str, **context: Any) -> None:
         """Log warning message"""
-        self._log("warning", message, context)
+        self._log(logging.WARNING, message, context)
 
     def error(self, message: str, **context: Any) -> None:
         """Log error message"""
-        self._log("error", message, context)
+        self._log(logging.ERROR, message, context)
 
     def critical(self, message: str, **context: Any) -> None:
         """Log critical message"""
-        self._log("critical", message, context)
+        self._log(logging.CRITICAL, message, context)
 
 
 def get_logger(name: str) -> Logger:
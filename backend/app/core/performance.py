@@ -3,77 +3,120 @@ Performance monitoring middleware
 """
 
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from contextvars import ContextVar
+from typing import Any
 
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
 from app.core.logging import get_logger
 
+settings = get_settings()
 logger = get_logger("app.performance")
 
+# Requests slower than this (1 second) are logged
+SLOW_REQUEST_NS = 1_000_000_000
+
+
+class PerformanceMiddleware:
+    """
+    Middleware to track request performance
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    """Middleware to track request performance"""
+    Pure ASGI: the response is passed through untouched (no task group,
+    no body buffering) and only the header list of the response start
+    message is amended.
+    """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and track performance"""
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
+        start_ns = time.perf_counter_ns()
 
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Time to first byte, as seen by the client
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                duration_ms = elapsed_ns / 1e6
 
-        # Log slow requests (> 1 second)
-        if duration_ms > 1000:
-            logger.warning(
-                f"Slow request: {request.method} {request.url.path} took {duration_ms:.2f}ms",
-                extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_ms": duration_ms,
-                },
-            )
+                # Log slow requests
+                if elapsed_ns > SLOW_REQUEST_NS:
+                    logger.warning(
+                        f"Slow request: {scope['method']} {scope['path']} took {duration_ms:.2f}ms",
+                        method=scope["method"],
+                        path=scope["path"],
+                        duration_ms=duration_ms,
+                    )
 
-        # Add performance header
-        response.headers["X-Process-Time"] = f"{duration_ms:.2f}"
+                # Add performance header
+                MutableHeaders(scope=message).append("X-Process-Time", f"{duration_ms:.2f}")
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
-class QueryCounterMiddleware(BaseHTTPMiddleware):
+class QueryCounterMiddleware:
     """Middleware to count database queries (for development)"""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Only enable in development
+        self.enabled = settings.app_env == "development"
+        if self.enabled:
+            _listen_for_queries()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and count queries"""
-        from app.config import get_settings
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
 
-        settings = get_settings()
+        # A fresh counter per request; the context is inherited by the
+        # greenlets SQLAlchemy runs cursor calls in, so the shared list
+        # sees every query of this request and no other
+        query_count = [0]
+        token = _query_count.set(query_count)
 
-        # Only enable in development
-        if settings.app_env != "development":
-            return await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add query count header
+                MutableHeaders(scope=message).append("X-DB-Queries", str(query_count[0]))
+            await send(message)
 
-        # Import here to avoid issues
-        from sqlalchemy import event
-        from app.core.database import async_engine
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _query_count.reset(token)
+
+
+# Query counter of the current request, if any
+_query_count: ContextVar[list[int] | None] = ContextVar("query_count", default=None)
+_listening = False
 
-        query_count = [0]
 
-        def before_cursor_execute(*args, **kwargs):
-            query_count[0] += 1
+def _count_query(*_args: Any, **_kwargs: Any) -> None:
+    """Count a cursor execution against the current request"""
+    query_count = _query_count.get()
+    if query_count is not None:
+        query_count[0] += 1
 
-        # Setup listener
-        event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
 
-        # Process request
-        response = await call_next(request)
+def _listen_for_queries() -> None:
+    """Register the process-wide query counting listener once"""
+    global _listening
+    if _listening:
+        return
 
-        # Remove listener
-        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    # Import here to avoid issues
+    from sqlalchemy import event
 
-        # Add query count header
-        response.headers["X-DB-Queries"] = str(query_count[0])
+    from app.core.database import engine
 
-        return response
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+    _listening = True
@@ -3,37 +3,52 @@ Permission checking service and utilities
 """
 
 from typing import List, Optional
-from functools import wraps
+from functools import lru_cache, wraps
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from app.models.permission import PermissionType, SystemRole, ROLE_PERMISSIONS
+from app.models.permission import (
+    PermissionType,
+    SystemRole,
+    ROLE_PERMISSIONS,
+    ROLE_PERMISSION_SETS,
+    ROLE_PERMISSION_VALUES,
+)
 from app.models.staff import Staff
 from app.dependencies import DBSession
 
+# Role lookups keyed by the role string stored on Staff, so checks need no
+# SystemRole construction (and no ValueError for unknown roles)
+_SUPER_ADMIN = SystemRole.SUPER_ADMIN.value
+_ROLE_PERMISSION_LISTS: dict[str, list[PermissionType]] = {
+    role.value: perms for role, perms in ROLE_PERMISSIONS.items()
+}
+_ROLE_PERMISSION_SETS: dict[str, frozenset[PermissionType]] = {
+    role.value: perms for role, perms in ROLE_PERMISSION_SETS.items()
+}
+_NO_PERMISSIONS: frozenset[PermissionType] = frozenset()
+
+# Roles with hotel-wide reach
+_ADMIN_ROLES = frozenset({_SUPER_ADMIN, SystemRole.HOTEL_ADMIN.value})
+_MODIFY_ALL_ROLES = _ADMIN_ROLES | {SystemRole.DEPT_MANAGER.value}
+_VIEW_ALL_ROLES = _MODIFY_ALL_ROLES | {SystemRole.READ_ONLY.value}
+
 
 class PermissionChecker:
     """Service for checking user permissions"""
 
     @staticmethod
     def get_role_permissions(role: str) -> List[PermissionType]:
-        """Get permissions for a role"""
-        try:
-            system_role = SystemRole(role)
-            return ROLE_PERMISSIONS.get(system_role, [])
-        except ValueError:
-            return []
+        """Get permissions for a role, in declaration order"""
+        return _ROLE_PERMISSION_LISTS.get(role, [])
 
     @staticmethod
     def has_permission(staff: Staff, required_permission: PermissionType) -> bool:
         """Check if staff has a specific permission"""
         # Super admin has all permissions
-        if staff.role == SystemRole.SUPER_ADMIN.value:
-            return True
-
-        # Get role permissions
-        role_perms = PermissionChecker.get_role_permissions(staff.role)
-        return required_permission in role_perms
+        return (
+            staff.role == _SUPER_ADMIN
+            or required_permission in _ROLE_PERMISSION_SETS.get(staff.role, _NO_PERMISSIONS)
+        )
 
     @staticmethod
     def has_any_permission(staff: Staff, required_permissions: List[PermissionType]) -> bool:
@@ -47,7 +62,7 @@ class PermissionChecker:
     def can_access_hotel(staff: Staff, hotel_id: str) -> bool:
         """Check if staff can access a specific hotel"""
         # Super admin can access all hotels
-        if staff.role == SystemRole.SUPER_ADMIN.value:
+        if staff.role == _SUPER_ADMIN:
             return True
 
         # Staff can only access their own hotel
@@ -57,10 +72,7 @@ class PermissionChecker:
     def can_access_department(staff: Staff, department: str | None) -> bool:
         """Check if staff can access a specific department"""
         # Super admin and hotel admin can access all departments
-        if staff.role in [
-            SystemRole.SUPER_ADMIN.value,
-            SystemRole.HOTEL_ADMIN.value,
-        ]:
+        if staff.role in _ADMIN_ROLES:
             return True
 
         # Dept manager can access their own department
@@ -73,15 +85,9 @@ class PermissionChecker:
     @staticmethod
     def can_modify_ticket(staff: Staff, ticket_assigned_to: str | None) -> bool:
         """Check if staff can modify a ticket"""
-        # Super admin and hotel admin can modify all tickets
-        if staff.role in [
-            SystemRole.SUPER_ADMIN.value,
-            SystemRole.HOTEL_ADMIN.value,
-        ]:
-            return True
-
-        # Dept manager can modify tickets in their department
-        if staff.role == SystemRole.DEPT_MANAGER.value:
+        # Super admin and hotel admin can modify all tickets, dept manager
+        # those in their department
+        if staff.role in _MODIFY_ALL_ROLES:
             return True
 
         # Staff can only modify their own tickets
@@ -90,25 +96,20 @@ class PermissionChecker:
     @staticmethod
     def can_view_all_tickets(staff: Staff) -> bool:
         """Check if staff can view all tickets in hotel"""
-        return staff.role in [
-            SystemRole.SUPER_ADMIN.value,
-            SystemRole.HOTEL_ADMIN.value,
-            SystemRole.DEPT_MANAGER.value,
-            SystemRole.READ_ONLY.value,
-        ]
+        return staff.role in _VIEW_ALL_ROLES
 
 
 # Permission dependency for FastAPI
 def require_permission(permission: PermissionType):
     """Dependency factory for requiring a permission"""
 
-    def dependency(
+    async def dependency(
+        db: DBSession,
         staff_id: str = Depends(lambda: "current_user_id"),  # Would get from auth
-        db: Session = Depends(DBSession),
     ) -> bool:
         # Get staff (simplified for MVP)
         # In real implementation, staff_id comes from JWT token
-        staff = db.query(Staff).filter(Staff.id == staff_id).first()
+        staff = await db.get(Staff, staff_id)
         if not staff:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -154,8 +155,9 @@ def require_permission_decorator(permission: PermissionType):
 
 
 # Get all permissions as list
+@lru_cache(maxsize=1)
 def get_all_permissions() -> List[dict]:
-    """Get all available permissions"""
+    """Get all available permissions (cached, do not mutate the result)"""
     return [
         {
             "name": perm.value,
@@ -167,15 +169,16 @@ def get_all_permissions() -> List[dict]:
 
 
 # Get all roles with their permissions
+@lru_cache(maxsize=1)
 def get_all_roles() -> List[dict]:
-    """Get all system roles with their permissions"""
+    """Get all system roles with their permissions (cached, do not mutate the result)"""
     return [
         {
-            "name": role.value,
-            "display_name": role.value.replace("_", " ").title(),
-            "permissions": [p.value for p in perms],
+            "name": role,
+            "display_name": role.replace("_", " ").title(),
+            "permissions": list(perms),
         }
-        for role, perms in ROLE_PERMISSIONS.items()
+        for role, perms in ROLE_PERMISSION_VALUES.items()
     ]
 
 
@@ -5,13 +5,20 @@ Security utilities for JWT and password hashing
 from datetime import datetime, timedelta
 from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from app.config import get_settings
 
 settings = get_settings()
 
+# Signing key constructed once and used for both signing and verification;
+# jose skips key parsing for prebuilt Key objects
+_signing_key = jwk.construct(settings.secret_key, settings.algorithm)
+
+# Algorithms accepted when verifying tokens
+_ALGORITHMS = (settings.algorithm,)
+
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -66,7 +73,7 @@ def create_access_token(
         )
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
-        to_encode, settings.secret_key, algorithm=settings.algorithm
+        to_encode, _signing_key, algorithm=settings.algorithm
     )
     return encoded_jwt
 
@@ -82,9 +89,7 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
         Decoded token payload or None if invalid
     """
     try:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
+        payload = jwt.decode(token, _signing_key, algorithms=_ALGORITHMS)
         return payload
     except JWTError:
         return None
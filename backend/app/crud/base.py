@@ -5,7 +5,7 @@ Base CRUD operations
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
@@ -31,11 +31,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: SQLAlchemy model class
         """
         self.model = model
+        # Built once; count() runs it as is
+        self._count_stmt = select(func.count()).select_from(model)
 
     async def get(self, db: AsyncSession, id: Any) -> ModelType | None:
         """
         Get single record by ID
 
+        A record already in the session's identity map is returned without
+        a query.
+
         Args:
             db: Database session
             id: Record ID
@@ -43,8 +48,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Model instance or None
         """
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return result.scalar_one_or_none()
+        return await db.get(self.model, id)
 
     async def get_multi(
         self,
@@ -78,11 +82,55 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Total count
         """
-        from sqlalchemy import func
-
-        result = await db.execute(select(func.count()).select_from(self.model))
+        result = await db.execute(self._count_stmt)
         return result.scalar()
 
+    async def get_page(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: list[Any] | None = None,
+        order_by: list[Any] | None = None,
+    ) -> tuple[list[ModelType], int]:
+        """
+        Get a page of records together with the total count
+
+        The total is computed with COUNT(*) OVER () in the same statement,
+        so a paginated listing needs a single round-trip.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            filters: Optional filter expressions
+            order_by: Optional ordering expressions
+
+        Returns:
+            Tuple of (model instances, total matching records)
+        """
+        stmt = select(self.model, func.count().over().label("total"))
+        if filters:
+            stmt = stmt.filter(*filters)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        if skip == 0:
+            return [], 0
+
+        # Page past the end carries no window value, count separately
+        count_stmt = self._count_stmt
+        if filters:
+            count_stmt = count_stmt.filter(*filters)
+        total = (await db.execute(count_stmt)).scalar()
+        return [], total
+
     async def create(
         self,
         db: AsyncSession,
@@ -141,6 +189,48 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         await db.refresh(db_obj)
         return db_obj
 
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        id: Any,
+        obj_in: UpdateSchemaType | dict[str, Any],
+    ) -> ModelType | None:
+        """
+        Update a record by ID in a single UPDATE ... RETURNING
+
+        Unlike update(), the record does not have to be loaded first.
+
+        Args:
+            db: Database session
+            id: Record ID
+            obj_in: Pydantic schema or dict for update; dict values may be
+                SQL expressions
+
+        Returns:
+            Updated model instance, or None if not found
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(
+                exclude_unset=True,
+                exclude_none=True,
+            )
+
+        model_columns = {c.key for c in self.model.__table__.columns}
+        values = {k: v for k, v in update_data.items() if k in model_columns}
+        if not values:
+            return await self.get(db, id)
+
+        result = await db.scalars(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return result.one_or_none()
+
     async def delete(self, db: AsyncSession, id: Any) -> bool:
         """
         Delete record by ID
@@ -159,6 +249,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         await db.flush()
         return True
 
+    async def delete_by_id(self, db: AsyncSession, id: Any) -> bool:
+        """
+        Delete a record by ID in a single DELETE ... RETURNING
+
+        Unlike delete(), the record is not loaded first, so ORM-level
+        cascades do not run. Foreign key ON DELETE rules are not enforced
+        on SQLite, so subclasses whose rows are referenced must clear the
+        references themselves.
+
+        Args:
+            db: Database session
+            id: Record ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        result = await db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
+        )
+        return result.scalar_one_or_none() is not None
+
     async def exists(self, db: AsyncSession, id: Any) -> bool:
         """
         Check if record exists
@@ -171,6 +282,6 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             True if exists, False otherwise
         """
         result = await db.execute(
-            select(self.model.id).filter(self.model.id == id)
+            select(literal(1)).where(self.model.id == id).limit(1)
         )
-        return result.scalar_one_or_none() is not None
+        return result.first() is not None
@@ -2,14 +2,17 @@
 CRUD operations for Conversation model
 """
 
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.database import session_dialect
 from app.crud.base import CRUDBase
-from app.models.conversation import Conversation
+from app.models.conversation import Conversation, ConversationStatus
 from app.schemas.conversation import ConversationCreate, ConversationUpdate
 
 
@@ -33,6 +36,8 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
         Returns:
             Conversation or None
         """
+        # The partial unique index ux_conversations_hotel_guest_active
+        # serves this lookup and allows at most one match, so no sort
         result = await db.execute(
             select(Conversation)
             .filter(
@@ -40,10 +45,57 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
                 Conversation.guest_id == guest_id,
                 Conversation.status == "active",
             )
-            .order_by(Conversation.created_at.desc())
+            .limit(1)
         )
         return result.scalar_one_or_none()
 
+    async def upsert_by_guest(
+        self,
+        db: AsyncSession,
+        hotel_id: str,
+        guest_id: str,
+    ) -> tuple[Conversation, bool]:
+        """
+        Get the guest's active conversation, creating it if missing, and
+        record a new message on it
+
+        Uses INSERT ... ON CONFLICT (hotel_id, guest_id) WHERE active DO
+        UPDATE RETURNING, so concurrent messages from a new guest cannot
+        create duplicate conversations, and lookup, creation and the
+        last_message_at update are one statement.
+
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            guest_id: Guest ID
+
+        Returns:
+            Tuple of (conversation, whether it was created)
+        """
+        now = datetime.utcnow()
+        insert = postgresql.insert if session_dialect(db) == "postgresql" else sqlite.insert
+        stmt = insert(Conversation).values(
+            hotel_id=hotel_id,
+            guest_id=guest_id,
+            status=ConversationStatus.ACTIVE.value,
+            last_message_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Conversation.hotel_id, Conversation.guest_id],
+            index_where=text("status = 'active'"),
+            set_={
+                "last_message_at": stmt.excluded.last_message_at,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(Conversation)
+
+        conversation = (
+            await db.scalars(stmt, execution_options={"populate_existing": True})
+        ).one()
+        return conversation, conversation.created_at == now
+
     async def get_by_hotel(
         self,
         db: AsyncSession,
@@ -121,6 +173,50 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
         )
         return list(result.scalars().all())
 
+    async def get_guest_id(
+        self,
+        db: AsyncSession,
+        conversation_id: str,
+    ) -> str | None:
+        """
+        Get only the guest ID of a conversation
+
+        Args:
+            db: Database session
+            conversation_id: Conversation ID
+
+        Returns:
+            Guest ID or None if the conversation does not exist
+        """
+        return await db.scalar(
+            select(Conversation.guest_id).where(Conversation.id == conversation_id)
+        )
+
+    async def update_status(
+        self,
+        db: AsyncSession,
+        conversation_id: str,
+        status: str,
+    ) -> bool:
+        """
+        Set a conversation's status in a single UPDATE
+
+        Args:
+            db: Database session
+            conversation_id: Conversation ID
+            status: New status
+
+        Returns:
+            True if updated, False if the conversation does not exist
+        """
+        result = await db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(status=status)
+            .returning(Conversation.id)
+        )
+        return result.scalar_one_or_none() is not None
+
 
 # Create singleton instance
 conversation = CRUDConversation(Conversation)
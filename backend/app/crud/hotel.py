@@ -4,13 +4,18 @@ CRUD operations for Hotel model
 
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
 from app.models.hotel import Hotel
 from app.schemas.hotel import HotelCreate, HotelUpdate
 
+# Built once; count_active() runs it as is
+_COUNT_ACTIVE_STMT = (
+    select(func.count()).select_from(Hotel).filter(Hotel.status == "active")
+)
+
 
 class CRUDHotel(CRUDBase[Hotel, HotelCreate, HotelUpdate]):
     """CRUD operations for Hotel"""
@@ -66,12 +71,29 @@ class CRUDHotel(CRUDBase[Hotel, HotelCreate, HotelUpdate]):
         Returns:
             Count of active hotels
         """
-        from sqlalchemy import func
+        result = await db.execute(_COUNT_ACTIVE_STMT)
+        return result.scalar()
 
-        result = await db.execute(
-            select(func.count()).select_from(Hotel).filter(Hotel.status == "active")
+    async def get_active_page(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Hotel], int]:
+        """
+        Get a page of active hotels with the total active count
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum records to return
+
+        Returns:
+            Tuple of (active hotels, total active count)
+        """
+        return await self.get_page(
+            db, skip=skip, limit=limit, filters=[Hotel.status == "active"]
         )
-        return result.scalar()
 
 
 # Create singleton instance
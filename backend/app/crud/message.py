@@ -5,8 +5,10 @@ CRUD operations for Message model
 from typing import Any
 
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import session_dialect
 from app.crud.base import CRUDBase
 from app.models.message import Message
 from app.schemas.message import MessageCreate
@@ -99,10 +101,58 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, dict]):
 
         message = Message(**message_data)
         db.add(message)
+        # All defaults are client-side, so no refresh is needed after flush
         await db.flush()
-        await db.refresh(message)
         return message
 
 
+    async def create_unique_message(
+        self,
+        db: AsyncSession,
+        conversation_id: str,
+        message_type: str,
+        direction: str,
+        content: str | None = None,
+        media_url: str | None = None,
+        sender_id: str | None = None,
+        wechat_msg_id: str | None = None,
+    ) -> Message | None:
+        """
+        Create a message unless its WeChat message ID was already stored
+
+        Uses INSERT ... ON CONFLICT (wechat_msg_id) DO NOTHING RETURNING, so
+        the duplicate check and the insert are one atomic statement.
+
+        Args:
+            db: Database session
+            conversation_id: Conversation ID
+            message_type: Message type
+            direction: Message direction
+            content: Message content
+            media_url: Media URL
+            sender_id: Sender ID
+            wechat_msg_id: WeChat message ID
+
+        Returns:
+            Created message, or None if the WeChat message ID exists
+        """
+        insert = postgresql.insert if session_dialect(db) == "postgresql" else sqlite.insert
+        stmt = (
+            insert(Message)
+            .values(
+                conversation_id=conversation_id,
+                message_type=message_type,
+                direction=direction,
+                content=content,
+                media_url=media_url,
+                sender_id=sender_id,
+                wechat_msg_id=wechat_msg_id,
+            )
+            .on_conflict_do_nothing(index_elements=[Message.wechat_msg_id])
+            .returning(Message)
+        )
+        return (await db.scalars(stmt)).one_or_none()
+
+
 # Create singleton instance
 message = CRUDMessage(Message)
@@ -4,11 +4,16 @@ CRUD operations for Staff model
 
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, not_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import session_dialect
 from app.crud.base import CRUDBase
+from app.models.audit_log import AuditLog
 from app.models.staff import Staff
+from app.models.ticket import Ticket
+from app.models.ticket_timeline import TicketTimeline
 from app.schemas.staff import StaffCreate, StaffUpdate
 
 
@@ -33,6 +38,71 @@ class CRUDStaff(CRUDBase[Staff, StaffCreate, StaffUpdate]):
         )
         return result.scalar_one_or_none()
 
+    async def create_unique(
+        self, db: AsyncSession, obj_in: StaffCreate
+    ) -> Staff | None:
+        """
+        Create staff unless the WeChat user ID is already taken
+
+        Uses INSERT ... ON CONFLICT (wechat_userid) DO NOTHING RETURNING, so
+        the duplicate check and the insert are one atomic statement.
+
+        Args:
+            db: Database session
+            obj_in: Staff creation data
+
+        Returns:
+            Created staff member, or None if the WeChat user ID exists
+        """
+        insert = postgresql.insert if session_dialect(db) == "postgresql" else sqlite.insert
+        stmt = (
+            insert(Staff)
+            .values(**obj_in.model_dump())
+            .on_conflict_do_nothing(index_elements=[Staff.wechat_userid])
+            .returning(Staff)
+        )
+        return (await db.scalars(stmt)).one_or_none()
+
+    async def toggle_availability(
+        self, db: AsyncSession, staff_id: str
+    ) -> Staff | None:
+        """
+        Flip a staff member's availability in a single UPDATE
+
+        Args:
+            db: Database session
+            staff_id: Staff ID
+
+        Returns:
+            Updated staff member, or None if not found
+        """
+        return await self.update_by_id(
+            db, staff_id, {"is_available": not_(Staff.is_available)}
+        )
+
+    async def delete_by_id(self, db: AsyncSession, id: Any) -> bool:
+        """
+        Delete a staff member and clear the references to them
+
+        Every foreign key to staff.id is ON DELETE SET NULL, but SQLite
+        does not enforce foreign keys, so the referencing columns are
+        cleared explicitly in the same transaction.
+
+        Args:
+            db: Database session
+            id: Staff ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        for column in (Ticket.assigned_to, TicketTimeline.staff_id, AuditLog.staff_id):
+            await db.execute(
+                update(column.class_)
+                .where(column == id)
+                .values({column.key: None})
+            )
+        return await super().delete_by_id(db, id)
+
     async def get_by_hotel(
         self,
         db: AsyncSession,
@@ -60,6 +130,44 @@ class CRUDStaff(CRUDBase[Staff, StaffCreate, StaffUpdate]):
         )
         return list(result.scalars().all())
 
+    async def get_filtered_page(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        hotel_id: str | None = None,
+        role: str | None = None,
+        status: str | None = None,
+        is_available: bool | None = None,
+    ) -> tuple[list[Staff], int]:
+        """
+        Get a page of staff matching the given filters with the total count
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum records to return
+            hotel_id: Filter by hotel ID
+            role: Filter by role
+            status: Filter by status
+            is_available: Filter by availability
+
+        Returns:
+            Tuple of (staff members, total matching count)
+        """
+        conditions = []
+
+        if hotel_id:
+            conditions.append(Staff.hotel_id == hotel_id)
+        if role:
+            conditions.append(Staff.role == role)
+        if status:
+            conditions.append(Staff.status == status)
+        if is_available is not None:
+            conditions.append(Staff.is_available == is_available)
+
+        return await self.get_page(db, skip=skip, limit=limit, filters=conditions)
+
     async def get_available(
         self,
         db: AsyncSession,
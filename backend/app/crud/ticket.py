@@ -4,14 +4,22 @@ CRUD operations for Ticket model
 
 from typing import Any
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.crud.base import CRUDBase
-from app.models.ticket import Ticket
+from app.models.ticket import Ticket, TicketStatus
 from app.schemas.ticket import TicketCreate, TicketUpdate
 
+# Statuses counted as open; written as status IN (...) to match the
+# predicate of the partial index ix_tickets_hotel_open
+OPEN_STATUSES = (
+    TicketStatus.PENDING.value,
+    TicketStatus.ASSIGNED.value,
+    TicketStatus.IN_PROGRESS.value,
+)
+
 
 class CRUDTicket(CRUDBase[Ticket, TicketCreate, TicketUpdate]):
     """CRUD operations for Ticket"""
@@ -72,6 +80,50 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, TicketUpdate]):
         )
         return list(result.scalars().all())
 
+    async def get_filtered_page(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        hotel_id: str | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        category: str | None = None,
+    ) -> tuple[list[Ticket], int]:
+        """
+        Get a page of tickets matching the given filters with the total count
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum records to return
+            hotel_id: Filter by hotel ID
+            status: Filter by status
+            priority: Filter by priority
+            category: Filter by category
+
+        Returns:
+            Tuple of (tickets, total matching count)
+        """
+        conditions = []
+
+        if hotel_id:
+            conditions.append(Ticket.hotel_id == hotel_id)
+        if status:
+            conditions.append(Ticket.status == status)
+        if priority:
+            conditions.append(Ticket.priority == priority)
+        if category:
+            conditions.append(Ticket.category == category)
+
+        return await self.get_page(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=conditions,
+            order_by=[Ticket.created_at.desc()],
+        )
+
     async def get_by_conversation(
         self,
         db: AsyncSession,
@@ -109,12 +161,14 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, TicketUpdate]):
         Returns:
             Ticket with relations or None
         """
+        # To-one relations ride along in the ticket query's joins; only the
+        # timeline collection needs a second (IN) query
         result = await db.execute(
             select(Ticket)
             .options(
-                selectinload(Ticket.hotel),
-                selectinload(Ticket.conversation),
-                selectinload(Ticket.assignee),
+                joinedload(Ticket.hotel, innerjoin=True),
+                joinedload(Ticket.conversation),
+                joinedload(Ticket.assignee),
                 selectinload(Ticket.timelines),
             )
             .filter(Ticket.id == ticket_id)
@@ -138,13 +192,7 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, TicketUpdate]):
         Returns:
             List of open tickets
         """
-        conditions = [
-            or_(
-                Ticket.status == TicketStatus.PENDING.value,
-                Ticket.status == TicketStatus.ASSIGNED.value,
-                Ticket.status == TicketStatus.IN_PROGRESS.value,
-            )
-        ]
+        conditions = [Ticket.status.in_(OPEN_STATUSES)]
 
         if hotel_id:
             conditions.append(Ticket.hotel_id == hotel_id)
@@ -177,11 +225,7 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, TicketUpdate]):
 
         conditions = [
             Ticket.due_at < datetime.utcnow(),
-            Ticket.status.in_([
-                TicketStatus.PENDING.value,
-                TicketStatus.ASSIGNED.value,
-                TicketStatus.IN_PROGRESS.value,
-            ])
+            Ticket.status.in_(OPEN_STATUSES),
         ]
 
         if hotel_id:
@@ -4,7 +4,7 @@ CRUD operations for TicketTimeline model
 
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
@@ -81,6 +81,24 @@ class CRUDTicketTimeline(CRUDBase[TicketTimeline, TicketTimelineCreate, dict]):
         await db.refresh(timeline)
         return timeline
 
+    async def create_many(
+        self,
+        db: AsyncSession,
+        entries: list[dict[str, Any]],
+    ) -> None:
+        """
+        Create several timeline entries in a single INSERT
+
+        Unlike create_timeline_entry(), the entries are not loaded back.
+
+        Args:
+            db: Database session
+            entries: Column values for each entry (ticket_id, staff_id,
+                event_type, old_value, new_value, comment)
+        """
+        if entries:
+            await db.execute(insert(TicketTimeline), entries)
+
 
 # Create singleton instance
 ticket_timeline = CRUDTicketTimeline(TicketTimeline)
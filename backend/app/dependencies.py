@@ -22,5 +22,13 @@ async def get_db_session() -> AsyncSession:
         yield session
 
 
-# Type alias for dependency injection
-DBSession = Annotated[AsyncSession, Depends(get_db_session)]
+# Type alias for dependency injection; depends on get_db directly so there is
+# a single per-request session provider (and a single override point in tests).
+# Function scope commits and closes the session as soon as the handler
+# returns, so its connection goes back to the pool before the response is
+# sent and a failed commit surfaces as an error response
+DBSession = Annotated[AsyncSession, Depends(get_db, scope="function")]
+
+# Session that stays open until the response has been sent, for handlers
+# returning a StreamingResponse that reads from the database while streaming
+StreamingDBSession = Annotated[AsyncSession, Depends(get_db)]
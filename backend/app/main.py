@@ -3,21 +3,37 @@ FastAPI Application Entry Point
 迎客通 InConnect Backend
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.api.v1 import (
+    auth,
+    batch,
+    health,
+    hotels,
+    messages,
+    reports,
+    rules,
+    staff,
+    tickets,
+    webhook,
+    websocket,
+)
+from app.api.v1 import settings as settings_api
 from app.config import get_settings
-from app.core.database import close_db, init_db
+from app.core.database import close_db, init_db, is_postgresql, warm_up_db
 from app.core.exceptions import BusinessException
 from app.core.logging import setup_logging
-from app.core.performance import PerformanceMiddleware
+from app.core.performance import PerformanceMiddleware, QueryCounterMiddleware
 from app.schemas.common import APIResponse
-from app.api.v1 import health, auth, hotels, staff, tickets, webhook, messages, websocket, reports, batch, rules
-from app.api.v1 import settings as settings_api
+from app.services.report_service import report_service
+from app.services.timeline_writer import timeline_writer
+
 # permissions, audit - Temporarily disabled (missing dependencies)
 
 # Setup logging
@@ -35,8 +51,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     if settings.app_env == "development":
         await init_db()
+    await warm_up_db()
+    timeline_writer.start()
+
+    # Keep the report materialized views fresh (PostgreSQL only)
+    refresh_task = None
+    if is_postgresql:
+        refresh_task = asyncio.create_task(
+            report_service.refresh_report_views_periodically(
+                settings.report_refresh_interval_seconds
+            )
+        )
+
     yield
     # Shutdown
+    if refresh_task:
+        refresh_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresh_task
+    await timeline_writer.stop()
     await close_db()
 
 
@@ -147,6 +180,10 @@ app.add_middleware(
 # Add performance monitoring middleware
 app.add_middleware(PerformanceMiddleware)
 
+# Report the number of database queries per request (development only)
+if settings.app_env == "development":
+    app.add_middleware(QueryCounterMiddleware)
+
 
 # Request ID middleware
 @app.middleware("http")
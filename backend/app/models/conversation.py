@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -44,12 +44,26 @@ class Conversation(Base):
     """
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        Index("ix_conversations_hotel_status", "hotel_id", "status"),
+        Index("ix_conversations_hotel_last_message", "hotel_id", "last_message_at"),
+        # At most one active conversation per guest and hotel; the target of
+        # the webhook's ON CONFLICT upsert
+        Index(
+            "ux_conversations_hotel_guest_active",
+            "hotel_id",
+            "guest_id",
+            unique=True,
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
     hotel_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("hotels.id"), nullable=False, index=True
+        String(36), ForeignKey("hotels.id"), nullable=False
     )
     guest_id: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     guest_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -120,6 +120,17 @@ ROLE_PERMISSIONS: dict[SystemRole, list[PermissionType]] = {
     ],
 }
 
+# Set view of ROLE_PERMISSIONS for O(1) membership checks; the lists above
+# keep their declaration order for display
+ROLE_PERMISSION_SETS: dict[SystemRole, frozenset[PermissionType]] = {
+    role: frozenset(perms) for role, perms in ROLE_PERMISSIONS.items()
+}
+
+# Permission values per role value, in declaration order, for API output
+ROLE_PERMISSION_VALUES: dict[str, tuple[str, ...]] = {
+    role.value: tuple(p.value for p in perms) for role, perms in ROLE_PERMISSIONS.items()
+}
+
 
 class Permission(Base):
     """
@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, Text, ForeignKey, Integer
+from sqlalchemy import DateTime, String, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -72,12 +72,15 @@ class Ticket(Base):
     """
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_hotel_status", "hotel_id", "status"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(50), primary_key=True, default=lambda: f"TK{datetime.utcnow().strftime('%Y%m%d%H%M%S')}{uuid.uuid4().hex[:4].upper()}"
     )
     hotel_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("hotels.id"), nullable=False, index=True
+        String(36), ForeignKey("hotels.id"), nullable=False
     )
     conversation_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("conversations.id", ondelete="SET NULL"), nullable=True
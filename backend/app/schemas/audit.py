@@ -0,0 +1,16 @@
+"""
+Audit log schemas
+"""
+
+
+from pydantic import Field
+
+from app.schemas.common import DateRangeFilter
+
+
+class AuditFilter(DateRangeFilter):
+    """Audit log query filters"""
+
+    staff_id: str | None = Field(default=None, description="Filter by staff ID")
+    action: str | None = Field(default=None, description="Filter by action")
+    resource_type: str | None = Field(default=None, description="Filter by resource type")
@@ -8,6 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field
 class LoginRequest(BaseModel):
     """Schema for login request"""
 
+    model_config = ConfigDict(extra="forbid")
+
     wechat_userid: str = Field(..., min_length=1, max_length=100)
     password: str = Field(..., min_length=1, max_length=100)
 
@@ -2,14 +2,17 @@
 Batch operation schemas
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BatchAssignRequest(BaseModel):
     """Request for batch assigning tickets"""
 
-    ticket_ids: List[str] = Field(..., min_items=1, max_items=100)
+    model_config = ConfigDict(extra="forbid")
+
+    ticket_ids: list[str] = Field(..., min_length=1, max_length=100)
     staff_id: str
     comment: Optional[str] = None
 
@@ -17,7 +20,9 @@ class BatchAssignRequest(BaseModel):
 class BatchStatusUpdateRequest(BaseModel):
     """Request for batch updating ticket status"""
 
-    ticket_ids: List[str] = Field(..., min_items=1, max_items=100)
+    model_config = ConfigDict(extra="forbid")
+
+    ticket_ids: list[str] = Field(..., min_length=1, max_length=100)
     status: str
     comment: Optional[str] = None
 
@@ -27,8 +32,8 @@ class BatchOperationResult(BaseModel):
 
     success_count: int
     failed_count: int
-    failed_ids: List[str]
-    errors: List[str]
+    failed_ids: list[str]
+    errors: list[str]
 
 
 class TicketExportRequest(BaseModel):
@@ -2,9 +2,10 @@
 Common Pydantic schemas for API responses
 """
 
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
@@ -23,10 +24,7 @@ class APIResponse(BaseModel, Generic[T]):
     message: str = Field(default="success", description="Response message")
     data: T | None = Field(default=None, description="Response data")
 
-    class Config:
-        """Pydantic config"""
-
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class PaginatedData(BaseModel, Generic[T]):
@@ -80,7 +78,20 @@ class PaginatedResponse(BaseModel, Generic[T]):
     message: str = Field(default="success", description="Response message")
     data: PaginatedData[T] | None = Field(default=None, description="Paginated data")
 
-    class Config:
-        """Pydantic config"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class DateRangeFilter(BaseModel):
+    """
+    Optional date window for list/export query parameters
+
+    Used as ``Annotated[DateRangeFilter, Depends()]`` so FastAPI parses the
+    ISO strings once and rejects malformed dates with a 422.
+
+    Attributes:
+        start_date: Inclusive start date
+        end_date: Inclusive end date
+    """
 
-        arbitrary_types_allowed = True
+    start_date: datetime | None = Field(default=None, description="Start date (ISO format)")
+    end_date: datetime | None = Field(default=None, description="End date (ISO format)")
@@ -22,7 +22,7 @@ class HotelBase(BaseModel):
 class HotelCreate(HotelBase):
     """Schema for creating a hotel"""
 
-    pass
+    model_config = ConfigDict(extra="forbid")
 
 
 class HotelUpdate(BaseModel):
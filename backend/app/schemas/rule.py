@@ -0,0 +1,38 @@
+"""
+Routing rule schemas
+"""
+
+
+from pydantic import BaseModel, Field
+
+
+class RuleTestRequest(BaseModel):
+    """Request for testing a routing rule"""
+    message_content: str = Field(..., description="Message content to test")
+    category: str | None = Field(None, description="Optional ticket category")
+    priority: str | None = Field(None, description="Optional ticket priority")
+
+
+class RuleSummary(BaseModel):
+    """Rule summary for display"""
+    id: str
+    name: str
+    type: str
+    keywords: list[str] | None = None
+    category: str | None = None
+    priority: str | None = None
+    target_staff_count: int = 0
+    rule_priority: int = 0
+    is_active: bool = True
+
+
+class RuleCreateRequest(BaseModel):
+    """Request for creating a routing rule"""
+    name: str = Field(..., max_length=100, description="Rule name")
+    rule_type: str = Field(..., description="Rule type: keyword, category, priority, round_robin, manual")
+    keywords: list[str] = Field(default_factory=list, description="Keywords for keyword matching")
+    category: str | None = Field(None, description="Category for category matching")
+    priority: str | None = Field(None, description="Priority for priority matching")
+    target_staff_ids: list[str] = Field(..., description="Target staff IDs for assignment")
+    rule_priority: int = Field(default=0, description="Rule priority (higher = more priority)")
+    is_active: bool = Field(default=True, description="Whether the rule is active")
@@ -4,7 +4,7 @@ System Configuration schemas
 
 from datetime import datetime
 from typing import Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SystemConfigBase(BaseModel):
@@ -36,8 +36,7 @@ class SystemConfigResponse(SystemConfigBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TicketCategoryConfig(BaseModel):
@@ -0,0 +1,27 @@
+"""
+Pydantic schemas for WeChat webhook payloads
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class WeChatUser(BaseModel):
+    """Sender or recipient of a WeChat message"""
+
+    userid: str | None = None
+
+
+class WeChatEvent(BaseModel):
+    """Inbound WeChat Work event; unknown fields are ignored"""
+
+    event_type: str = "unknown"
+    msgtype: str | None = None
+    from_user: WeChatUser = WeChatUser()
+    to_user: WeChatUser = WeChatUser()
+    agentid: str | None = None
+    content: str = ""
+    msgid: str | None = None
+    media_id: str | None = None
+
+    # WeChat sends agentid and msgid as numbers; they are stored as strings
+    model_config = ConfigDict(coerce_numbers_to_str=True)
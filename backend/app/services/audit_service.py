@@ -2,12 +2,14 @@
 Audit logging service
 """
 
-from typing import Optional, Any
+import json
+from collections.abc import Iterable
 from datetime import datetime
+from typing import Any
+
 from sqlalchemy.orm import Session
-import json
 
-from app.models.audit_log import AuditLog, AuditAction
+from app.models.audit_log import AuditAction, AuditLog
 from app.models.staff import Staff
 
 
@@ -143,35 +145,33 @@ class AuditService:
         )
 
     @staticmethod
-    def get_logs(
-        db: Session,
+    def _apply_log_filters(
+        query,
         hotel_id: str,
         staff_id: str | None = None,
         action: str | None = None,
         resource_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-        limit: int = 100,
-    ) -> list[AuditLog]:
+    ):
         """
-        Query audit logs with filters
+        Apply the common audit log filters to a query
 
         Args:
-            db: Database session
+            query: Query selecting from AuditLog
             hotel_id: Hotel ID
             staff_id: Filter by staff ID
             action: Filter by action
             resource_type: Filter by resource type
             start_date: Filter by start date
             end_date: Filter by end date
-            limit: Maximum records to return
 
         Returns:
-            List of audit log entries
+            Filtered query
         """
-        from sqlalchemy import and_, or_
+        from sqlalchemy import and_
 
-        query = db.query(AuditLog).filter(AuditLog.hotel_id == hotel_id)
+        query = query.filter(AuditLog.hotel_id == hotel_id)
 
         filters = []
 
@@ -193,8 +193,97 @@ class AuditService:
         if filters:
             query = query.filter(and_(*filters))
 
+        return query
+
+    @staticmethod
+    def get_logs(
+        db: Session,
+        hotel_id: str,
+        staff_id: str | None = None,
+        action: str | None = None,
+        resource_type: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+    ) -> list[AuditLog]:
+        """
+        Query audit logs with filters
+
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            staff_id: Filter by staff ID
+            action: Filter by action
+            resource_type: Filter by resource type
+            start_date: Filter by start date
+            end_date: Filter by end date
+            limit: Maximum records to return
+
+        Returns:
+            List of audit log entries
+        """
+        query = AuditService._apply_log_filters(
+            db.query(AuditLog),
+            hotel_id,
+            staff_id=staff_id,
+            action=action,
+            resource_type=resource_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
         return query.order_by(AuditLog.created_at.desc()).limit(limit).all()
 
+    @staticmethod
+    def get_logs_with_staff(
+        db: Session,
+        hotel_id: str,
+        staff_id: str | None = None,
+        action: str | None = None,
+        resource_type: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+        yield_per: int | None = None,
+    ) -> Iterable[tuple[AuditLog, str | None]]:
+        """
+        Query audit logs together with the acting staff name
+
+        The staff name is resolved through an outer join in the same
+        statement, so no second lookup query is needed.
+
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            staff_id: Filter by staff ID
+            action: Filter by action
+            resource_type: Filter by resource type
+            start_date: Filter by start date
+            end_date: Filter by end date
+            limit: Maximum records to return
+            yield_per: Fetch rows in batches of this size instead of
+                loading the whole result (used by exports)
+
+        Returns:
+            Iterable of (audit log, staff name) rows
+        """
+        query = AuditService._apply_log_filters(
+            db.query(AuditLog, Staff.name).outerjoin(Staff, AuditLog.staff_id == Staff.id),
+            hotel_id,
+            staff_id=staff_id,
+            action=action,
+            resource_type=resource_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        query = query.order_by(AuditLog.created_at.desc()).limit(limit)
+
+        if yield_per:
+            return query.yield_per(yield_per)
+
+        return query.all()
+
     @staticmethod
     def get_login_history(
         db: Session,
@@ -215,7 +304,7 @@ class AuditService:
             List of login events with staff info
         """
         from datetime import timedelta
-        from sqlalchemy import and_
+
 
         start_date = datetime.utcnow() - timedelta(days=days)
 
@@ -2,14 +2,17 @@
 Batch operation service for tickets
 """
 
-from typing import List, Tuple
-from sqlalchemy.orm import Session
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.models.staff import Staff
 from app.models.ticket import Ticket
 from app.models.ticket_timeline import TicketTimeline, TimelineEventType
-from app.models.staff import Staff
 from app.schemas.batch import BatchOperationResult
+from app.utils.csv_stream import format_csv_datetime, iter_csv
 
 
 class BatchOperationService:
@@ -17,7 +20,7 @@ class BatchOperationService:
 
     @staticmethod
     def batch_assign_tickets(
-        db: Session, ticket_ids: List[str], staff_id: str, comment: str | None = None
+        db: Session, ticket_ids: list[str], staff_id: str, comment: str | None = None
     ) -> BatchOperationResult:
         """
         Batch assign tickets to a staff member
@@ -41,53 +44,44 @@ class BatchOperationService:
                 errors=[f"Staff {staff_id} not found"],
             )
 
-        success_count = 0
-        failed_count = 0
-        failed_ids: List[str] = []
-        errors: List[str] = []
-
-        for ticket_id in ticket_ids:
-            try:
-                ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
-                if not ticket:
-                    failed_count += 1
-                    failed_ids.append(ticket_id)
-                    errors.append(f"Ticket {ticket_id} not found")
-                    continue
-
-                # Update ticket
-                old_assignee = ticket.assigned_to
-                ticket.assigned_to = staff_id
-                ticket.status = "assigned"
-
-                # Create timeline entry
-                timeline = TicketTimeline(
-                    ticket_id=ticket_id,
-                    staff_id=staff_id,
-                    event_type=TimelineEventType.ASSIGNED.value,
-                    old_value=old_assignee,
-                    new_value=staff_id,
-                    comment=comment,
-                )
-                db.add(timeline)
-
-                success_count += 1
-            except Exception as e:
-                failed_count += 1
-                failed_ids.append(ticket_id)
-                errors.append(f"Ticket {ticket_id}: {str(e)}")
+        # Load current assignees for all requested tickets in one query. Only
+        # tickets of the staff member's hotel can be assigned to them; others
+        # are reported as not found
+        old_assignees = dict(
+            db.query(Ticket.id, Ticket.assigned_to)
+            .filter(Ticket.id.in_(ticket_ids), Ticket.hotel_id == staff.hotel_id)
+            .all()
+        )
+        found_ids = [tid for tid in ticket_ids if tid in old_assignees]
+
+        if found_ids:
+            # One UPDATE for every ticket, one bulk INSERT for the timeline
+            db.execute(
+                update(Ticket)
+                .where(Ticket.id.in_(found_ids), Ticket.hotel_id == staff.hotel_id)
+                .values(assigned_to=staff_id, status="assigned")
+            )
+            db.execute(
+                insert(TicketTimeline),
+                [
+                    {
+                        "ticket_id": ticket_id,
+                        "staff_id": staff_id,
+                        "event_type": TimelineEventType.ASSIGNED.value,
+                        "old_value": old_assignees[ticket_id],
+                        "new_value": staff_id,
+                        "comment": comment,
+                    }
+                    for ticket_id in found_ids
+                ],
+            )
 
         db.commit()
-        return BatchOperationResult(
-            success_count=success_count,
-            failed_count=failed_count,
-            failed_ids=failed_ids,
-            errors=errors,
-        )
+        return BatchOperationService._build_result(ticket_ids, found_ids)
 
     @staticmethod
     def batch_update_status(
-        db: Session, ticket_ids: List[str], status: str, comment: str | None = None
+        db: Session, ticket_ids: list[str], status: str, comment: str | None = None
     ) -> BatchOperationResult:
         """
         Batch update ticket status
@@ -101,53 +95,68 @@ class BatchOperationService:
         Returns:
             Batch operation result
         """
-        success_count = 0
-        failed_count = 0
-        failed_ids: List[str] = []
-        errors: List[str] = []
-
-        for ticket_id in ticket_ids:
-            try:
-                ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
-                if not ticket:
-                    failed_count += 1
-                    failed_ids.append(ticket_id)
-                    errors.append(f"Ticket {ticket_id} not found")
-                    continue
-
-                # Update ticket
-                old_status = ticket.status
-                ticket.status = status
-
-                # Update timestamps based on status
-                now = datetime.utcnow()
-                if status == "resolved":
-                    ticket.resolved_at = now
-                elif status == "closed":
-                    ticket.closed_at = now
-
-                # Create timeline entry
-                timeline = TicketTimeline(
-                    ticket_id=ticket_id,
-                    event_type=TimelineEventType.STATUS_CHANGED.value,
-                    old_value=old_status,
-                    new_value=status,
-                    comment=comment,
-                )
-                db.add(timeline)
-
-                success_count += 1
-            except Exception as e:
-                failed_count += 1
-                failed_ids.append(ticket_id)
-                errors.append(f"Ticket {ticket_id}: {str(e)}")
+        # Load current statuses for all requested tickets in one query
+        old_statuses = dict(
+            db.query(Ticket.id, Ticket.status)
+            .filter(Ticket.id.in_(ticket_ids))
+            .all()
+        )
+        found_ids = [tid for tid in ticket_ids if tid in old_statuses]
+
+        if found_ids:
+            # Update timestamps based on status
+            values: dict = {"status": status}
+            now = datetime.utcnow()
+            if status == "resolved":
+                values["resolved_at"] = now
+            elif status == "closed":
+                values["closed_at"] = now
+
+            # One UPDATE for every ticket, one bulk INSERT for the timeline
+            db.execute(
+                update(Ticket)
+                .where(Ticket.id.in_(found_ids))
+                .values(**values)
+            )
+            db.execute(
+                insert(TicketTimeline),
+                [
+                    {
+                        "ticket_id": ticket_id,
+                        "event_type": TimelineEventType.STATUS_CHANGED.value,
+                        "old_value": old_statuses[ticket_id],
+                        "new_value": status,
+                        "comment": comment,
+                    }
+                    for ticket_id in found_ids
+                ],
+            )
 
         db.commit()
+        return BatchOperationService._build_result(ticket_ids, found_ids)
+
+    @staticmethod
+    def _build_result(
+        ticket_ids: list[str], updated_ids: list[str]
+    ) -> BatchOperationResult:
+        """
+        Build a batch result by diffing requested and updated ticket IDs
+
+        Args:
+            ticket_ids: Requested ticket IDs
+            updated_ids: Ticket IDs that were found and updated
+
+        Returns:
+            Batch operation result
+        """
+        updated = set(updated_ids)
+        failed_ids = [tid for tid in ticket_ids if tid not in updated]
+
         return BatchOperationResult(
-            success_count=success_count,
-            failed_count=failed_count,
+            success_count=len(updated_ids),
+            failed_count=len(failed_ids),
             failed_ids=failed_ids,
-            errors=errors,
+            errors=[f"Ticket {tid} not found" for tid in failed_ids],
         )
 
     @staticmethod
@@ -159,7 +168,8 @@ class BatchOperationService:
         category: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-    ) -> List[Ticket]:
+        yield_per: int | None = None,
+    ) -> Iterable[Ticket]:
         """
         Get tickets for export based on filters
 
@@ -171,9 +181,11 @@ class BatchOperationService:
             category: Optional category filter
             start_date: Optional start date filter
             end_date: Optional end date filter
+            yield_per: Fetch rows in batches of this size instead of
+                loading the whole result
 
         Returns:
-            List of tickets matching filters
+            Tickets matching filters
         """
         query = db.query(Ticket).filter(Ticket.hotel_id == hotel_id)
 
@@ -188,63 +200,68 @@ class BatchOperationService:
         if end_date:
             query = query.filter(Ticket.created_at <= end_date)
 
+        if yield_per:
+            return query.yield_per(yield_per)
+
         return query.all()
 
     @staticmethod
-    def export_tickets_to_csv(tickets: List[Ticket]) -> str:
+    def iter_tickets_csv(tickets: Iterable[Ticket]) -> Iterator[str]:
         """
-        Export tickets to CSV format
+        Export tickets to CSV format chunk by chunk
 
         Args:
-            tickets: List of tickets to export
+            tickets: Tickets to export
 
-        Returns:
-            CSV formatted string
+        Yields:
+            CSV formatted text chunks
         """
-        import csv
-        from io import StringIO
-
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
+        header = [
+            "工单ID",
+            "标题",
+            "描述",
+            "分类",
+            "优先级",
+            "状态",
+            "分配给",
+            "创建时间",
+            "更新时间",
+            "截止时间",
+            "解决时间",
+            "关闭时间",
+        ]
+
+        rows = (
             [
-                "工单ID",
-                "标题",
-                "描述",
-                "分类",
-                "优先级",
-                "状态",
-                "分配给",
-                "创建时间",
-                "更新时间",
-                "截止时间",
-                "解决时间",
-                "关闭时间",
+                ticket.id,
+                ticket.title,
+                ticket.description or "",
+                ticket.category,
+                ticket.priority,
+                ticket.status,
+                ticket.assigned_to or "",
+                format_csv_datetime(ticket.created_at),
+                format_csv_datetime(ticket.updated_at),
+                format_csv_datetime(ticket.due_at),
+                format_csv_datetime(ticket.resolved_at),
+                format_csv_datetime(ticket.closed_at),
             ]
+            for ticket in tickets
         )
 
-        # Write data
-        for ticket in tickets:
-            writer.writerow(
-                [
-                    ticket.id,
-                    ticket.title,
-                    ticket.description or "",
-                    ticket.category,
-                    ticket.priority,
-                    ticket.status,
-                    ticket.assigned_to or "",
-                    ticket.created_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.created_at else "",
-                    ticket.updated_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.updated_at else "",
-                    ticket.due_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.due_at else "",
-                    ticket.resolved_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.resolved_at else "",
-                    ticket.closed_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.closed_at else "",
-                ]
-            )
+        return iter_csv(header, rows)
+
+    @staticmethod
+    def export_tickets_to_csv(tickets: Iterable[Ticket]) -> str:
+        """
+        Export tickets to CSV format
 
-        return output.getvalue()
+        Args:
+            tickets: Tickets to export
 
+        Returns:
+            CSV formatted string
+        """
+        return "".join(BatchOperationService.iter_tickets_csv(tickets))
 
 batch_service = BatchOperationService()
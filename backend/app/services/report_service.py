@@ -2,496 +2,575 @@
 Report service for generating statistics and analytics
 """
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional
-from sqlalchemy import select, func, case, and_
-from sqlalchemy.orm import Session
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Date,
+    FromClause,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    column,
+    func,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCategory
-from app.models.message import Message, MessageType, MessageDirection
-from app.models.staff import Staff, StaffStatus
+from app.core.cache import TTLCache
+from app.core.database import async_session_maker, session_dialect
+from app.core.logging import get_logger
 from app.models.conversation import Conversation
+from app.models.message import Message, MessageDirection
+from app.models.staff import Staff, StaffStatus
+from app.models.ticket import Ticket, TicketStatus
 from app.schemas.report import (
-    TimeRangeRequest,
-    TicketReport,
-    TicketStatusStats,
-    TicketPriorityStats,
-    TicketCategoryStats,
-    StaffReport,
-    StaffPerformanceStats,
+    DashboardSummary,
+    MessageDirectionStats,
     MessageReport,
     MessageTypeStats,
-    MessageDirectionStats,
-    DashboardSummary,
-    TimeRangeType,
+    StaffPerformanceStats,
+    StaffReport,
+    TicketCategoryStats,
+    TicketPriorityStats,
+    TicketReport,
+    TicketStatusStats,
+)
+
+logger = get_logger("app.services.report")
+
+# Daily rollups maintained as PostgreSQL materialized views by the
+# 20261016_add_report_views migration. They live in their own MetaData so
+# create_all() never tries to create them as tables.
+report_views_metadata = MetaData()
+
+ticket_daily_counts_view = Table(
+    "mv_ticket_report_by_hotel_day",
+    report_views_metadata,
+    Column("hotel_id", String(36)),
+    Column("day", Date),
+    Column("status", String(20)),
+    Column("priority", String(10)),
+    Column("category", String(50)),
+    Column("count", Integer),
+)
+
+message_daily_counts_view = Table(
+    "mv_message_report_by_hotel_day",
+    report_views_metadata,
+    Column("hotel_id", String(36)),
+    Column("day", Date),
+    Column("message_type", String(20)),
+    Column("direction", String(20)),
+    Column("count", Integer),
 )
 
+REPORT_VIEWS = [ticket_daily_counts_view.name, message_daily_counts_view.name]
+
+# Engines whose database was found to have the report views; a database
+# set up with init_db() (create_all) has none until migrated
+_engines_with_report_views: set[Engine] = set()
+
+# Serialized report responses keyed by (report, hotel_id, range, ...); cleared
+# whenever the report views are refreshed
+REPORT_CACHE_TTL_SECONDS = 60
+report_cache = TTLCache(ttl_seconds=REPORT_CACHE_TTL_SECONDS)
+
+
+async def _report_views_available(db: AsyncSession) -> bool:
+    """
+    Check whether the report materialized views exist for a session
+
+    Only PostgreSQL databases migrated past 20261016_add_report_views have
+    them. A positive answer is remembered per engine.
+
+    Args:
+        db: Database session
+
+    Returns:
+        True if the rollups can be read from the views
+    """
+    if session_dialect(db) != "postgresql":
+        return False
+
+    bind = db.get_bind()
+    if bind in _engines_with_report_views:
+        return True
+
+    matviews = table("pg_matviews", column("matviewname"))
+    found = await db.scalar(
+        select(func.count())
+        .select_from(matviews)
+        .where(matviews.c.matviewname.in_(REPORT_VIEWS))
+    )
+    if found != len(REPORT_VIEWS):
+        return False
+    _engines_with_report_views.add(bind)
+    return True
+
+
+def _ticket_daily_counts(use_views: bool) -> FromClause:
+    """
+    Get the ticket daily rollup
+
+    Returns the materialized view when available and an equivalent
+    aggregate over the tickets table otherwise (SQLite has no views
+    to refresh).
+    """
+    if use_views:
+        return ticket_daily_counts_view
+
+    day = func.date(Ticket.created_at, type_=Date)
+    return (
+        select(
+            Ticket.hotel_id,
+            day.label("day"),
+            Ticket.status,
+            Ticket.priority,
+            Ticket.category,
+            func.count().label("count"),
+        )
+        .group_by(Ticket.hotel_id, day, Ticket.status, Ticket.priority, Ticket.category)
+        .subquery("ticket_daily_counts")
+    )
+
+
+def _message_daily_counts(use_views: bool) -> FromClause:
+    """
+    Get the message daily rollup
+
+    Returns the materialized view when available and an equivalent
+    aggregate over messages joined to conversations otherwise.
+    """
+    if use_views:
+        return message_daily_counts_view
+
+    day = func.date(Message.created_at, type_=Date)
+    return (
+        select(
+            Conversation.hotel_id,
+            day.label("day"),
+            Message.message_type,
+            Message.direction,
+            func.count().label("count"),
+        )
+        .join(Conversation, Message.conversation_id == Conversation.id)
+        .group_by(Conversation.hotel_id, day, Message.message_type, Message.direction)
+        .subquery("message_daily_counts")
+    )
+
+
+def _hours_between(later, earlier, dialect: str):
+    """Build an expression for the number of hours between two timestamps"""
+    if dialect == "postgresql":
+        return func.extract("epoch", later - earlier) / 3600
+    return (func.julianday(later) - func.julianday(earlier)) * 24
+
+
+def _percentage(count: int, total: int) -> float:
+    """Share of total as a percentage rounded to two decimals"""
+    return round((count / total * 100) if total > 0 else 0, 2)
+
+
+def _round_hours(hours: float | None) -> float | None:
+    """Round an average duration, keeping None for no data"""
+    return round(hours, 2) if hours else None
+
 
 class ReportService:
     """Service for generating reports and statistics"""
 
     @staticmethod
-    def _get_date_range(range_request: TimeRangeRequest) -> tuple[datetime, datetime]:
-        """Calculate start and end dates based on range type"""
-        now = datetime.now(timezone.utc)
-        range_type = range_request.range_type
-
-        if range_type == TimeRangeType.TODAY:
-            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = now
-        elif range_type == TimeRangeType.YESTERDAY:
-            yesterday = now - timedelta(days=1)
-            start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
-        elif range_type == TimeRangeType.THIS_WEEK:
-            start = (now - timedelta(days=now.weekday())).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            end = now
-        elif range_type == TimeRangeType.LAST_WEEK:
-            start = (now - timedelta(days=now.weekday() + 7)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            end = (now - timedelta(days=now.weekday() + 1)).replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-        elif range_type == TimeRangeType.THIS_MONTH:
-            start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            end = now
-        elif range_type == TimeRangeType.LAST_MONTH:
-            start = (now.replace(day=1) - timedelta(days=1)).replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
-            )
-            end = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(
-                seconds=1
-            )
-        else:  # CUSTOM
-            start = range_request.start_date or now - timedelta(days=7)
-            end = range_request.end_date or now
+    async def refresh_report_views() -> None:
+        """
+        Refresh the report materialized views (PostgreSQL only)
+
+        CONCURRENTLY keeps the views readable during the refresh; it relies
+        on the unique indexes created alongside them. Does nothing until the
+        views have been created by the migration.
+        """
+        async with async_session_maker() as session:
+            if not await _report_views_available(session):
+                return
+            for view in REPORT_VIEWS:
+                await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            await session.commit()
+
+        # Cached reports were built from the previous snapshot
+        report_cache.clear()
 
-        return start, end
+    @staticmethod
+    async def refresh_report_views_periodically(interval_seconds: int) -> None:
+        """
+        Refresh the report views forever, every interval_seconds
+
+        Meant to run as a background task for the lifetime of the app.
+
+        Args:
+            interval_seconds: Delay between refreshes
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await ReportService.refresh_report_views()
+            except Exception as e:
+                logger.warning("Report view refresh failed", error=str(e))
 
     @staticmethod
-    def get_ticket_report(
-        db: Session, hotel_id: str, range_request: TimeRangeRequest, department: Optional[str] = None
+    async def get_ticket_report(
+        db: AsyncSession,
+        hotel_id: str,
+        start: datetime,
+        end: datetime,
+        department: str | None = None,
     ) -> TicketReport:
-        """Generate ticket statistics report"""
-        start, end = ReportService._get_date_range(range_request)
-
-        # Base query with filters
+        """
+        Generate ticket statistics report
+
+        Breakdowns and created_in_period come from the daily rollup, so the
+        period is applied at day granularity. Resolution and overdue figures
+        depend on columns that change after creation and are read live.
+
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            start: Period start
+            end: Period end
+            department: Optional category filter
+
+        Returns:
+            Ticket report
+        """
+        rollup = _ticket_daily_counts(await _report_views_available(db))
+
+        rollup_filters = [rollup.c.hotel_id == hotel_id]
         base_filters = [Ticket.hotel_id == hotel_id]
         if department:
+            rollup_filters.append(rollup.c.category == department)
             base_filters.append(Ticket.category == department)
 
-        # Total tickets
-        total_query = select(func.count(Ticket.id)).where(and_(*base_filters))
-        total = db.execute(total_query).scalar() or 0
-
-        # By status
-        status_query = (
-            select(
-                Ticket.status,
-                func.count(Ticket.id).label("count"),
-            )
-            .where(and_(*base_filters))
-            .group_by(Ticket.status)
-        )
-        status_results = db.execute(status_query).all()
-        by_status = [
-            TicketStatusStats(
-                status=row.status,
-                count=row.count,
-                percentage=round((row.count / total * 100) if total > 0 else 0, 2),
-            )
-            for row in status_results
-        ]
-
-        # By priority
-        priority_query = (
-            select(
-                Ticket.priority,
-                func.count(Ticket.id).label("count"),
-            )
-            .where(and_(*base_filters))
-            .group_by(Ticket.priority)
-        )
-        priority_results = db.execute(priority_query).all()
-        by_priority = [
-            TicketPriorityStats(
-                priority=row.priority,
-                count=row.count,
-                percentage=round((row.count / total * 100) if total > 0 else 0, 2),
-            )
-            for row in priority_results
-        ]
-
-        # By category
-        category_query = (
+        # One pass over the rollup for every breakdown
+        rollup_query = (
             select(
-                Ticket.category,
-                func.count(Ticket.id).label("count"),
-            )
-            .where(and_(*base_filters))
-            .group_by(Ticket.category)
-        )
-        category_results = db.execute(category_query).all()
-        by_category = [
-            TicketCategoryStats(
-                category=row.category,
-                count=row.count,
-                percentage=round((row.count / total * 100) if total > 0 else 0, 2),
-            )
-            for row in category_results
-        ]
-
-        # Created in period
-        created_query = select(func.count(Ticket.id)).where(
-            and_(*base_filters, Ticket.created_at >= start, Ticket.created_at <= end)
-        )
-        created_in_period = db.execute(created_query).scalar() or 0
-
-        # Resolved in period
-        resolved_query = select(func.count(Ticket.id)).where(
-            and_(
-                *base_filters,
-                Ticket.resolved_at.isnot(None),
-                Ticket.resolved_at >= start,
-                Ticket.resolved_at <= end,
-            )
-        )
-        resolved_in_period = db.execute(resolved_query).scalar() or 0
-
-        # Closed in period
-        closed_query = select(func.count(Ticket.id)).where(
-            and_(
-                *base_filters,
-                Ticket.closed_at.isnot(None),
-                Ticket.closed_at >= start,
-                Ticket.closed_at <= end,
-            )
-        )
-        closed_in_period = db.execute(closed_query).scalar() or 0
-
-        # Average resolution time (in hours)
-        avg_time_query = select(
-            func.avg(
-                func.extract(
-                    "epoch",
-                    case(
-                        (Ticket.resolved_at.isnot(None), Ticket.resolved_at - Ticket.created_at),
-                        else_=None,
+                rollup.c.status,
+                rollup.c.priority,
+                rollup.c.category,
+                func.sum(rollup.c.count).label("count"),
+                func.coalesce(
+                    func.sum(rollup.c.count).filter(
+                        rollup.c.day.between(start.date(), end.date())
                     ),
-                )
+                    0,
+                ).label("in_period"),
             )
-            / 3600
-        ).where(
-            and_(*base_filters, Ticket.resolved_at.isnot(None))
+            .where(and_(*rollup_filters))
+            .group_by(rollup.c.status, rollup.c.priority, rollup.c.category)
         )
-        avg_resolution_hours = db.execute(avg_time_query).scalar()
 
-        # Overdue count
-        overdue_query = select(func.count(Ticket.id)).where(
-            and_(
-                *base_filters,
-                Ticket.due_at < datetime.now(timezone.utc),
+        by_status: dict[str, int] = defaultdict(int)
+        by_priority: dict[str, int] = defaultdict(int)
+        by_category: dict[str, int] = defaultdict(int)
+        total = 0
+        created_in_period = 0
+
+        for row in (await db.execute(rollup_query)).all():
+            by_status[row.status] += row.count
+            by_priority[row.priority] += row.count
+            by_category[row.category] += row.count
+            total += row.count
+            created_in_period += row.in_period
+
+        # Live figures in a single statement
+        dialect = session_dialect(db)
+        live_query = select(
+            func.count().filter(Ticket.resolved_at.between(start, end)).label("resolved"),
+            func.count().filter(Ticket.closed_at.between(start, end)).label("closed"),
+            func.avg(_hours_between(Ticket.resolved_at, Ticket.created_at, dialect))
+            .filter(Ticket.resolved_at.isnot(None))
+            .label("avg_resolution_hours"),
+            func.count()
+            .filter(
+                Ticket.due_at < datetime.utcnow(),
                 Ticket.status.notin_([TicketStatus.RESOLVED.value, TicketStatus.CLOSED.value]),
             )
-        )
-        overdue_count = db.execute(overdue_query).scalar() or 0
+            .label("overdue"),
+        ).where(and_(*base_filters))
+        live = (await db.execute(live_query)).one()
 
         return TicketReport(
             total=total,
-            by_status=by_status,
-            by_priority=by_priority,
-            by_category=by_category,
+            by_status=[
+                TicketStatusStats(status=key, count=count, percentage=_percentage(count, total))
+                for key, count in by_status.items()
+            ],
+            by_priority=[
+                TicketPriorityStats(priority=key, count=count, percentage=_percentage(count, total))
+                for key, count in by_priority.items()
+            ],
+            by_category=[
+                TicketCategoryStats(category=key, count=count, percentage=_percentage(count, total))
+                for key, count in by_category.items()
+            ],
             created_in_period=created_in_period,
-            resolved_in_period=resolved_in_period,
-            closed_in_period=closed_in_period,
-            avg_resolution_hours=round(avg_resolution_hours, 2) if avg_resolution_hours else None,
-            overdue_count=overdue_count,
+            resolved_in_period=live.resolved,
+            closed_in_period=live.closed,
+            avg_resolution_hours=_round_hours(live.avg_resolution_hours),
+            overdue_count=live.overdue,
         )
 
     @staticmethod
-    def get_staff_report(
-        db: Session, hotel_id: str, range_request: TimeRangeRequest
+    async def get_staff_report(
+        db: AsyncSession, hotel_id: str, start: datetime, end: datetime
     ) -> StaffReport:
-        """Generate staff performance report"""
-        start, end = ReportService._get_date_range(range_request)
+        """
+        Generate staff performance report
+
+        Per-staff figures are computed in one grouped query instead of a set
+        of queries per staff member.
+
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            start: Period start
+            end: Period end
+
+        Returns:
+            Staff report
+        """
+        dialect = session_dialect(db)
+        ticket_stats = (
+            select(
+                Ticket.assigned_to.label("staff_id"),
+                func.count().label("total_assigned"),
+                func.count()
+                .filter(Ticket.status == TicketStatus.RESOLVED.value)
+                .label("total_resolved"),
+                func.count()
+                .filter(Ticket.status == TicketStatus.IN_PROGRESS.value)
+                .label("total_in_progress"),
+                func.avg(_hours_between(Ticket.resolved_at, Ticket.created_at, dialect))
+                .filter(Ticket.resolved_at.isnot(None))
+                .label("avg_resolution_hours"),
+                # Time from ticket creation to first assignment
+                func.avg(_hours_between(Ticket.updated_at, Ticket.created_at, dialect)).label(
+                    "avg_response_hours"
+                ),
+            )
+            .where(Ticket.assigned_to.isnot(None))
+            .group_by(Ticket.assigned_to)
+            .subquery()
+        )
 
-        # Get all active staff
-        staff_query = select(Staff).where(
-            and_(Staff.hotel_id == hotel_id, Staff.status == StaffStatus.ACTIVE.value)
+        query = (
+            select(
+                Staff.id,
+                Staff.name,
+                Staff.department,
+                ticket_stats.c.total_assigned,
+                ticket_stats.c.total_resolved,
+                ticket_stats.c.total_in_progress,
+                ticket_stats.c.avg_resolution_hours,
+                ticket_stats.c.avg_response_hours,
+            )
+            .outerjoin(ticket_stats, ticket_stats.c.staff_id == Staff.id)
+            .where(and_(Staff.hotel_id == hotel_id, Staff.status == StaffStatus.ACTIVE.value))
         )
-        staff_members = db.execute(staff_query).scalars().all()
 
         staff_stats = []
-
-        for staff in staff_members:
-            # Total assigned
-            total_assigned_query = select(func.count(Ticket.id)).where(
-                Ticket.assigned_to == staff.id
-            )
-            total_assigned = db.execute(total_assigned_query).scalar() or 0
-
-            # Total resolved
-            total_resolved_query = select(func.count(Ticket.id)).where(
-                and_(
-                    Ticket.assigned_to == staff.id,
-                    Ticket.status == TicketStatus.RESOLVED.value,
-                )
-            )
-            total_resolved = db.execute(total_resolved_query).scalar() or 0
-
-            # Total in progress
-            total_in_progress_query = select(func.count(Ticket.id)).where(
-                and_(
-                    Ticket.assigned_to == staff.id,
-                    Ticket.status == TicketStatus.IN_PROGRESS.value,
-                )
-            )
-            total_in_progress = db.execute(total_in_progress_query).scalar() or 0
-
-            # Resolution rate
-            resolution_rate = (
-                round((total_resolved / total_assigned * 100), 2) if total_assigned > 0 else 0
-            )
-
-            # Average resolution time
-            avg_resolution_query = select(
-                func.avg(
-                    func.extract("epoch", Ticket.resolved_at - Ticket.created_at)
-                )
-                / 3600
-            ).where(
-                and_(
-                    Ticket.assigned_to == staff.id,
-                    Ticket.resolved_at.isnot(None),
-                )
-            )
-            avg_resolution_hours = db.execute(avg_resolution_query).scalar()
-
-            # Average response time (time from ticket creation to first assignment)
-            avg_response_query = select(
-                func.avg(
-                    func.extract("epoch", Ticket.updated_at - Ticket.created_at)
-                )
-                / 3600
-            ).where(
-                and_(
-                    Ticket.assigned_to == staff.id,
-                    Ticket.assigned_to.isnot(None),
-                )
-            )
-            avg_response_hours = db.execute(avg_response_query).scalar()
-
+        for row in (await db.execute(query)).all():
+            total_assigned = row.total_assigned or 0
+            total_resolved = row.total_resolved or 0
             staff_stats.append(
                 StaffPerformanceStats(
-                    staff_id=staff.id,
-                    staff_name=staff.name,
-                    department=staff.department,
+                    staff_id=row.id,
+                    staff_name=row.name,
+                    department=row.department,
                     total_assigned=total_assigned,
                     total_resolved=total_resolved,
-                    total_in_progress=total_in_progress,
-                    resolution_rate=resolution_rate,
-                    avg_resolution_hours=round(avg_resolution_hours, 2) if avg_resolution_hours else None,
-                    avg_response_hours=round(avg_response_hours, 2) if avg_response_hours else None,
+                    total_in_progress=row.total_in_progress or 0,
+                    resolution_rate=_percentage(total_resolved, total_assigned),
+                    avg_resolution_hours=_round_hours(row.avg_resolution_hours),
+                    avg_response_hours=_round_hours(row.avg_response_hours),
                 )
             )
 
         return StaffReport(
-            total_staff=len(staff_members),
+            total_staff=len(staff_stats),
             staff_stats=staff_stats,
             period_start=start,
             period_end=end,
         )
 
     @staticmethod
-    def get_message_report(
-        db: Session, hotel_id: str, range_request: TimeRangeRequest
+    async def get_message_report(
+        db: AsyncSession, hotel_id: str, start: datetime, end: datetime
     ) -> MessageReport:
-        """Generate message statistics report"""
-        start, end = ReportService._get_date_range(range_request)
-
-        # Get conversation IDs for this hotel
-        conv_query = select(Conversation.id).where(Conversation.hotel_id == hotel_id)
-        conversation_ids = [row[0] for row in db.execute(conv_query).all()]
-
-        if not conversation_ids:
-            return MessageReport(
-                total=0,
-                by_type=[],
-                by_direction=[],
-                avg_daily_count=0,
-                peak_conversations=0,
-                period_start=start,
-                period_end=end,
-            )
+        """
+        Generate message statistics report
 
-        # Total messages in period
-        total_query = select(func.count(Message.id)).where(
-            and_(
-                Message.conversation_id.in_(conversation_ids),
-                Message.created_at >= start,
-                Message.created_at <= end,
-            )
-        )
-        total = db.execute(total_query).scalar() or 0
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            start: Period start
+            end: Period end
 
-        # By type
-        type_query = (
-            select(Message.message_type, func.count(Message.id).label("count"))
-            .where(
-                and_(
-                    Message.conversation_id.in_(conversation_ids),
-                    Message.created_at >= start,
-                    Message.created_at <= end,
-                )
-            )
-            .group_by(Message.message_type)
-        )
-        type_results = db.execute(type_query).all()
-        by_type = [
-            MessageTypeStats(
-                message_type=row.message_type,
-                count=row.count,
-                percentage=round((row.count / total * 100) if total > 0 else 0, 2),
-            )
-            for row in type_results
-        ]
+        Returns:
+            Message report
+        """
+        rollup = _message_daily_counts(await _report_views_available(db))
 
-        # By direction
-        direction_query = (
-            select(Message.direction, func.count(Message.id).label("count"))
+        rollup_query = (
+            select(
+                rollup.c.message_type,
+                rollup.c.direction,
+                func.sum(rollup.c.count).label("count"),
+            )
             .where(
                 and_(
-                    Message.conversation_id.in_(conversation_ids),
-                    Message.created_at >= start,
-                    Message.created_at <= end,
+                    rollup.c.hotel_id == hotel_id,
+                    rollup.c.day.between(start.date(), end.date()),
                 )
             )
-            .group_by(Message.direction)
+            .group_by(rollup.c.message_type, rollup.c.direction)
         )
-        direction_results = db.execute(direction_query).all()
-        by_direction = [
-            MessageDirectionStats(
-                direction=row.direction,
-                count=row.count,
-                percentage=round((row.count / total * 100) if total > 0 else 0, 2),
-            )
-            for row in direction_results
-        ]
 
-        # Average daily count
-        days_diff = max(1, (end - start).days)
-        avg_daily_count = round(total / days_diff, 2)
+        by_type: dict[str, int] = defaultdict(int)
+        by_direction: dict[str, int] = defaultdict(int)
+        total = 0
 
-        # Peak conversations (active conversations in period)
+        for row in (await db.execute(rollup_query)).all():
+            by_type[row.message_type] += row.count
+            by_direction[row.direction] += row.count
+            total += row.count
+
+        # Distinct conversations cannot be summed across days, read live
         peak_query = (
             select(func.count(func.distinct(Message.conversation_id)))
+            .join(Conversation, Message.conversation_id == Conversation.id)
             .where(
                 and_(
-                    Message.conversation_id.in_(conversation_ids),
+                    Conversation.hotel_id == hotel_id,
                     Message.created_at >= start,
                     Message.created_at <= end,
                 )
             )
         )
-        peak_conversations = db.execute(peak_query).scalar() or 0
+        peak_conversations = (await db.execute(peak_query)).scalar() or 0
+
+        days_diff = max(1, (end - start).days)
 
         return MessageReport(
             total=total,
-            by_type=by_type,
-            by_direction=by_direction,
-            avg_daily_count=avg_daily_count,
+            by_type=[
+                MessageTypeStats(message_type=key, count=count, percentage=_percentage(count, total))
+                for key, count in by_type.items()
+            ],
+            by_direction=[
+                MessageDirectionStats(direction=key, count=count, percentage=_percentage(count, total))
+                for key, count in by_direction.items()
+            ],
+            avg_daily_count=round(total / days_diff, 2),
             peak_conversations=peak_conversations,
             period_start=start,
             period_end=end,
         )
 
     @staticmethod
-    def get_dashboard_summary(
-        db: Session, hotel_id: str, range_request: TimeRangeRequest
+    async def get_dashboard_summary(
+        db: AsyncSession, hotel_id: str, start: datetime, end: datetime
     ) -> DashboardSummary:
-        """Generate dashboard summary"""
-        start, end = ReportService._get_date_range(range_request)
-
-        # Total tickets
-        total_tickets_query = select(func.count(Ticket.id)).where(Ticket.hotel_id == hotel_id)
-        total_tickets = db.execute(total_tickets_query).scalar() or 0
-
-        # Pending tickets
-        pending_tickets_query = select(func.count(Ticket.id)).where(
-            and_(
-                Ticket.hotel_id == hotel_id,
-                Ticket.status == TicketStatus.PENDING.value,
-            )
+        """
+        Generate dashboard summary
+
+        Args:
+            db: Database session
+            hotel_id: Hotel ID
+            start: Period start
+            end: Period end
+
+        Returns:
+            Dashboard summary
+        """
+        use_views = await _report_views_available(db)
+        tickets = _ticket_daily_counts(use_views)
+        messages = _message_daily_counts(use_views)
+
+        ticket_status_query = (
+            select(tickets.c.status, func.sum(tickets.c.count).label("count"))
+            .where(tickets.c.hotel_id == hotel_id)
+            .group_by(tickets.c.status)
         )
-        pending_tickets = db.execute(pending_tickets_query).scalar() or 0
-
-        # In progress tickets
-        in_progress_tickets_query = select(func.count(Ticket.id)).where(
-            and_(
-                Ticket.hotel_id == hotel_id,
-                Ticket.status == TicketStatus.IN_PROGRESS.value,
-            )
-        )
-        in_progress_tickets = db.execute(in_progress_tickets_query).scalar() or 0
-
-        # Overdue tickets
-        overdue_tickets_query = select(func.count(Ticket.id)).where(
-            and_(
-                Ticket.hotel_id == hotel_id,
-                Ticket.due_at < datetime.now(timezone.utc),
-                Ticket.status.notin_([TicketStatus.RESOLVED.value, TicketStatus.CLOSED.value]),
-            )
-        )
-        overdue_tickets = db.execute(overdue_tickets_query).scalar() or 0
-
-        # Total messages
-        conv_query = select(Conversation.id).where(Conversation.hotel_id == hotel_id)
-        conversation_ids = [row[0] for row in db.execute(conv_query).all()]
-
-        if conversation_ids:
-            total_messages_query = select(func.count(Message.id)).where(
-                Message.conversation_id.in_(conversation_ids)
+        tickets_by_status = {
+            row.status: row.count for row in (await db.execute(ticket_status_query)).all()
+        }
+
+        # Remaining figures as scalar subqueries in one round trip
+        summary_query = select(
+            select(func.coalesce(func.sum(messages.c.count), 0))
+            .where(messages.c.hotel_id == hotel_id)
+            .scalar_subquery()
+            .label("total_messages"),
+            select(func.count())
+            .select_from(Ticket)
+            .where(
+                and_(
+                    Ticket.hotel_id == hotel_id,
+                    Ticket.due_at < datetime.utcnow(),
+                    Ticket.status.notin_([TicketStatus.RESOLVED.value, TicketStatus.CLOSED.value]),
+                )
             )
-            total_messages = db.execute(total_messages_query).scalar() or 0
-
-            # Unread messages
-            unread_messages_query = select(func.count(Message.id)).where(
+            .scalar_subquery()
+            .label("overdue_tickets"),
+            select(func.count())
+            .select_from(Message)
+            .join(Conversation, Message.conversation_id == Conversation.id)
+            .where(
                 and_(
-                    Message.conversation_id.in_(conversation_ids),
+                    Conversation.hotel_id == hotel_id,
                     Message.direction == MessageDirection.INBOUND.value,
-                    Message.is_read == False,
+                    Message.is_read.is_(False),
                 )
             )
-            unread_messages = db.execute(unread_messages_query).scalar() or 0
-        else:
-            total_messages = 0
-            unread_messages = 0
-
-        # Active conversations
-        active_conversations = len(conversation_ids)
-
-        # Available staff
-        available_staff_query = select(func.count(Staff.id)).where(
-            and_(
-                Staff.hotel_id == hotel_id,
-                Staff.status == StaffStatus.ACTIVE.value,
-                Staff.is_available == True,
+            .scalar_subquery()
+            .label("unread_messages"),
+            select(func.count())
+            .select_from(Conversation)
+            .where(Conversation.hotel_id == hotel_id)
+            .scalar_subquery()
+            .label("active_conversations"),
+            select(func.count())
+            .select_from(Staff)
+            .where(
+                and_(
+                    Staff.hotel_id == hotel_id,
+                    Staff.status == StaffStatus.ACTIVE.value,
+                    Staff.is_available.is_(True),
+                )
             )
+            .scalar_subquery()
+            .label("available_staff"),
         )
-        available_staff = db.execute(available_staff_query).scalar() or 0
+        summary = (await db.execute(summary_query)).one()
 
         return DashboardSummary(
-            total_tickets=total_tickets,
-            pending_tickets=pending_tickets,
-            in_progress_tickets=in_progress_tickets,
-            overdue_tickets=overdue_tickets,
-            total_messages=total_messages,
-            unread_messages=unread_messages,
-            active_conversations=active_conversations,
-            available_staff=available_staff,
+            total_tickets=sum(tickets_by_status.values()),
+            pending_tickets=tickets_by_status.get(TicketStatus.PENDING.value, 0),
+            in_progress_tickets=tickets_by_status.get(TicketStatus.IN_PROGRESS.value, 0),
+            overdue_tickets=summary.overdue_tickets,
+            total_messages=summary.total_messages,
+            unread_messages=summary.unread_messages,
+            active_conversations=summary.active_conversations,
+            available_staff=summary.available_staff,
             period_start=start,
             period_end=end,
         )
+
+
+report_service = ReportService()
@@ -2,13 +2,74 @@
 Rule testing service for previewing routing results
 """
 
-from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
 import json
+from typing import Any
 
+from sqlalchemy import JSON, ColumnElement, case, cast, exists, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import session_dialect
 from app.models.routing_rule import RoutingRule, RoutingRuleType
 from app.models.staff import Staff, StaffStatus
-from app.models.ticket import TicketCategory, TicketPriority
+
+# A JSON array of strings, as a PostgreSQL regular expression. PostgreSQL 15
+# has no json_valid() (IS JSON arrived in 16), and a cast of malformed text
+# to JSON fails the whole query, so only rows shaped like this are cast.
+_JSON_WS = r"[ \t\n\r]*"
+_JSON_STRING = r'"([^"\\[:cntrl:]]|\\(["\\/bfnrt]|u[0-9a-fA-F]{4}))*"'
+_JSON_STRING_ARRAY = (
+    rf"^{_JSON_WS}\[{_JSON_WS}"
+    rf"({_JSON_STRING}({_JSON_WS},{_JSON_WS}{_JSON_STRING})*)?"
+    rf"{_JSON_WS}\]{_JSON_WS}$"
+)
+
+
+def _keyword_match(message_content: str, dialect: str) -> ColumnElement[bool]:
+    """
+    Build a filter that is true when any of a rule's keywords occurs in a message
+
+    The rule's keywords JSON array is expanded with the dialect's JSON table
+    function and matched inside the database, case-insensitively. Both sides
+    are folded by the database's lower(), so they are folded alike even
+    where it only handles ASCII (SQLite). Rules whose keywords are not a
+    valid JSON array never match, as parse_json_field() skipped them.
+
+    Args:
+        message_content: Message content to test
+        dialect: Dialect name of the session the query runs on
+
+    Returns:
+        EXISTS expression correlated to RoutingRule
+    """
+    # CASE is evaluated lazily, so malformed keywords are never parsed;
+    # the table function then gets NULL and yields no rows
+    if dialect == "postgresql":
+        keywords = func.json_array_elements_text(
+            case(
+                (
+                    RoutingRule.keywords.regexp_match(_JSON_STRING_ARRAY),
+                    cast(RoutingRule.keywords, JSON),
+                ),
+            )
+        )
+        position = func.strpos
+    else:
+        keywords = func.json_each(
+            case(
+                (
+                    func.json_valid(RoutingRule.keywords) == 1,
+                    case(
+                        (func.json_type(RoutingRule.keywords) == "array", RoutingRule.keywords),
+                    ),
+                ),
+            )
+        )
+        position = func.instr
+
+    keyword = keywords.table_valued("value").alias("keyword")
+    return exists().where(
+        position(func.lower(literal(message_content)), func.lower(keyword.c.value)) > 0
+    )
 
 
 class RuleTestService:
@@ -25,13 +86,13 @@ class RuleTestService:
             return []
 
     @staticmethod
-    def test_message(
-        db: Session,
+    async def test_message(
+        db: AsyncSession,
         hotel_id: str,
         message_content: str,
         category: str | None = None,
         priority: str | None = None,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """
         Test which rule would match a message
 
@@ -45,58 +106,55 @@ class RuleTestService:
         Returns:
             Test result with matched rule and assigned staff
         """
-        # Get active rules for hotel, ordered by priority
-        rules = (
-            db.query(RoutingRule)
-            .filter(
+        # Pick the highest-priority matching active rule in the database
+        # rather than loading every rule and matching in Python
+        rule_matches = [
+            (RoutingRule.rule_type == RoutingRuleType.KEYWORD.value)
+            & RoutingRule.keywords.is_not(None)
+            & _keyword_match(message_content, session_dialect(db)),
+            RoutingRule.rule_type == RoutingRuleType.MANUAL.value,
+        ]
+        if category:
+            rule_matches.append(
+                (RoutingRule.rule_type == RoutingRuleType.CATEGORY.value)
+                & (RoutingRule.category == category)
+            )
+        if priority:
+            rule_matches.append(
+                (RoutingRule.rule_type == RoutingRuleType.PRIORITY.value)
+                & (RoutingRule.priority == priority)
+            )
+
+        rule_query = (
+            select(
+                RoutingRule.id,
+                RoutingRule.name,
+                RoutingRule.rule_type,
+                RoutingRule.priority_level,
+                RoutingRule.target_staff_ids,
+            )
+            .where(
                 RoutingRule.hotel_id == hotel_id,
-                RoutingRule.is_active == True,
+                RoutingRule.is_active.is_(True),
+                or_(*rule_matches),
             )
             .order_by(RoutingRule.priority_level.desc())
-            .all()
+            .limit(1)
         )
+        matched_rule = (await db.execute(rule_query)).first()
 
-        matched_rule = None
         assigned_staff = []
-
-        for rule in rules:
-            # Check if rule matches
-            match = False
-
-            if rule.rule_type == RoutingRuleType.KEYWORD.value:
-                keywords = RuleTestService.parse_json_field(rule.keywords)
-                if keywords:
-                    match = any(
-                        kw.lower() in message_content.lower() for kw in keywords
-                    )
-
-            elif rule.rule_type == RoutingRuleType.CATEGORY.value:
-                if category:
-                    match = rule.category == category
-
-            elif rule.rule_type == RoutingRuleType.PRIORITY.value:
-                if priority:
-                    match = rule.priority == priority
-
-            elif rule.rule_type == RoutingRuleType.MANUAL.value:
-                # Manual rule always matches if reached
-                match = True
-
-            if match:
-                matched_rule = rule
-                # Get assigned staff
-                staff_ids = RuleTestService.parse_json_field(rule.target_staff_ids)
-                if staff_ids:
-                    assigned_staff = (
-                        db.query(Staff)
-                        .filter(
-                            Staff.id.in_(staff_ids),
-                            Staff.status == StaffStatus.ACTIVE.value,
-                            Staff.is_available == True,
-                        )
-                        .all()
+        if matched_rule:
+            staff_ids = RuleTestService.parse_json_field(matched_rule.target_staff_ids)
+            if staff_ids:
+                staff_result = await db.execute(
+                    select(Staff.id, Staff.name, Staff.department).where(
+                        Staff.id.in_(staff_ids),
+                        Staff.status == StaffStatus.ACTIVE.value,
+                        Staff.is_available.is_(True),
                     )
-                break
+                )
+                assigned_staff = staff_result.all()
 
         return {
             "matched_rule": {
@@ -115,7 +173,7 @@ class RuleTestService:
         }
 
     @staticmethod
-    def get_rule_summary(db: Session, hotel_id: str) -> List[Dict[str, Any]]:
+    async def get_rule_summary(db: AsyncSession, hotel_id: str) -> list[dict[str, Any]]:
         """
         Get summary of all rules for a hotel
 
@@ -126,12 +184,12 @@ class RuleTestService:
         Returns:
             List of rule summaries
         """
-        rules = (
-            db.query(RoutingRule)
-            .filter(RoutingRule.hotel_id == hotel_id)
+        result = await db.execute(
+            select(RoutingRule)
+            .where(RoutingRule.hotel_id == hotel_id)
             .order_by(RoutingRule.priority_level.desc())
-            .all()
         )
+        rules = result.scalars().all()
 
         summaries = []
         for rule in rules:
@@ -139,13 +197,13 @@ class RuleTestService:
             staff_ids = RuleTestService.parse_json_field(rule.target_staff_ids)
 
             # Get staff count
-            staff_count = (
-                db.query(Staff)
-                .filter(
+            staff_count = await db.scalar(
+                select(func.count())
+                .select_from(Staff)
+                .where(
                     Staff.id.in_(staff_ids),
                     Staff.status == StaffStatus.ACTIVE.value,
                 )
-                .count()
             )
 
             summaries.append({
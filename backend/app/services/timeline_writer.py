@@ -0,0 +1,250 @@
+"""
+Batched background writer for ticket timeline entries
+"""
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+from app.crud.ticket_timeline import ticket_timeline as timeline_crud
+
+logger = get_logger("app.services.timeline_writer")
+
+# Session.info keys holding entries that wait for the request's commit,
+# and the engine they are to be written to
+_PENDING_KEY = "pending_timeline_entries"
+_BIND_KEY = "pending_timeline_bind"
+
+# Queued by flush() to cut the current batch's flush interval short
+_WAKE = object()
+
+
+class TimelineWriter:
+    """
+    Write timeline entries off the request path
+
+    Entries are handed to the writer only once the request's transaction
+    commits, so they never reference an uncommitted ticket and are dropped
+    with a rolled back one. The writer task inserts them in batches, through
+    the engine of the session they came from. Readers call flush() first,
+    so they see the entries this process committed before the read; the
+    guarantee is per process, as entries queued by other workers are not
+    waited for. The trade-off is a short window where a crash loses queued
+    entries.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        flush_timeout: float = 1.0,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_timeout = flush_timeout
+        # Created by start() on the running loop. Items are (engine, entry)
+        # pairs, _WAKE, or None as the stop sentinel
+        self._queue: asyncio.Queue[Any] | None = None
+        self._task: asyncio.Task | None = None
+        # Entries queued and written so far; flush() waits on the count
+        # queued when it was called
+        self._queued = 0
+        self._written = 0
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer task is running"""
+        return self._task is not None
+
+    async def enqueue(self, db: AsyncSession, entries: list[dict[str, Any]]) -> None:
+        """
+        Schedule timeline entries to be written after db commits
+
+        Without a running writer (e.g. outside the app lifespan), or for a
+        session without a single bind, the entries are inserted in db's
+        transaction instead.
+
+        Args:
+            db: Database session of the request
+            entries: Column values of the entries
+        """
+        if not self.running or db.bind is None:
+            await timeline_crud.create_many(db, entries)
+            return
+        # The entries belong to the current transaction; begin it if no
+        # statement has yet, so a rollback also drops them
+        if not db.in_transaction():
+            await db.begin()
+        db.info.setdefault(_PENDING_KEY, []).extend(entries)
+        db.info[_BIND_KEY] = db.bind
+
+    async def flush(self) -> None:
+        """
+        Wait until the entries queued before the call have been written
+
+        Entries queued later are not waited for, and the wait gives up
+        after flush_timeout.
+        """
+        if self._queue is None or self._written >= self._queued:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((self._queued, waiter))
+        self._queue.put_nowait(_WAKE)
+        try:
+            await asyncio.wait_for(waiter, self.flush_timeout)
+        except TimeoutError:
+            logger.warning(
+                "Timeline flush timed out",
+                pending=self._queued - self._written,
+                timeout=self.flush_timeout,
+            )
+
+    def start(self) -> None:
+        """Start the writer task on the running loop"""
+        self._queue = asyncio.Queue()
+        self._queued = 0
+        self._written = 0
+        self._waiters = []
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the writer task after writing the entries still queued"""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._release_waiters(everyone=True)
+        self._task = None
+        self._queue = None
+
+    async def _run(self) -> None:
+        """Collect entries into batches and write them until stopped"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if item is _WAKE:
+                continue
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                if item is _WAKE:
+                    # A reader is waiting; write what is queued so far
+                    break
+                batch.append(item)
+
+            await self._write(batch)
+            self._written += len(batch)
+            self._release_waiters()
+            if stopping:
+                return
+
+    def _release_waiters(self, everyone: bool = False) -> None:
+        """
+        Wake the flush() calls whose entries have been written
+
+        Args:
+            everyone: Wake every waiter, e.g. once the writer stopped
+        """
+        remaining = []
+        for target, waiter in self._waiters:
+            if everyone or target <= self._written:
+                if not waiter.done():
+                    waiter.set_result(None)
+            else:
+                remaining.append((target, waiter))
+        self._waiters = remaining
+
+    async def _write(self, batch: list[tuple[AsyncEngine, dict[str, Any]]]) -> None:
+        """
+        Insert a batch of entries, one transaction per engine
+
+        If an engine's transaction fails, its entries are retried one by
+        one, so a bad entry drops only itself.
+
+        Args:
+            batch: Engine and column values of each entry
+        """
+        by_bind: dict[AsyncEngine, list[dict[str, Any]]] = {}
+        for bind, entry in batch:
+            by_bind.setdefault(bind, []).append(entry)
+
+        for bind, entries in by_bind.items():
+            try:
+                await self._insert(bind, entries)
+            except Exception as e:
+                if len(entries) == 1:
+                    self._log_dropped(entries[0], e)
+                    continue
+                logger.warning(
+                    "Timeline batch write failed, retrying entries one by one",
+                    error=str(e),
+                    count=len(entries),
+                )
+                for entry in entries:
+                    try:
+                        await self._insert(bind, [entry])
+                    except Exception as e:
+                        self._log_dropped(entry, e)
+
+    @staticmethod
+    async def _insert(bind: AsyncEngine, entries: list[dict[str, Any]]) -> None:
+        """Insert entries in a transaction of their own"""
+        async with AsyncSession(bind) as session:
+            await timeline_crud.create_many(session, entries)
+            await session.commit()
+
+    @staticmethod
+    def _log_dropped(entry: dict[str, Any], error: Exception) -> None:
+        """Log an entry that could not be written"""
+        logger.error(
+            "Timeline entry write failed, entry dropped",
+            error=str(error),
+            ticket_id=entry.get("ticket_id"),
+            event_type=entry.get("event_type"),
+        )
+
+    def _on_commit(self, session: Session) -> None:
+        """Queue the entries of a committed transaction"""
+        entries = session.info.pop(_PENDING_KEY, None)
+        bind = session.info.pop(_BIND_KEY, None)
+        if not entries:
+            return
+        if self._queue is None:
+            logger.warning("Timeline writer stopped, entries dropped", count=len(entries))
+            return
+        for entry in entries:
+            self._queue.put_nowait((bind, entry))
+        self._queued += len(entries)
+
+
+timeline_writer = TimelineWriter()
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_committed_entries(session: Session) -> None:
+    timeline_writer._on_commit(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_entries(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_BIND_KEY, None)
@@ -20,6 +20,13 @@ class WebSocketMessage(BaseModel):
     data: dict[str, Any]
 
 
+class WebSocketClientMessage(BaseModel):
+    """Message sent by a WebSocket client (ping, subscribe, etc.)"""
+
+    type: str | None = None
+    timestamp: Any = None
+
+
 class ConnectionManager:
     """
     WebSocket connection manager for real-time notifications
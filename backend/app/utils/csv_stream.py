@@ -0,0 +1,114 @@
+"""
+CSV streaming helpers for export endpoints
+"""
+
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from datetime import datetime
+from io import StringIO
+
+
+def format_csv_datetime(value: datetime | None) -> str:
+    """
+    Format a timestamp as "YYYY-MM-DD HH:MM:SS" for CSV export
+
+    isoformat() takes a C fast path, unlike strftime() which goes through
+    the platform formatter on every row.
+
+    Args:
+        value: Naive timestamp or None
+
+    Returns:
+        Formatted timestamp, or an empty string for None
+    """
+    return value.isoformat(sep=" ", timespec="seconds") if value else ""
+
+
+class _CSVChunker:
+    """Accumulate CSV rows and hand them out in chunks of text"""
+
+    def __init__(self, header: Sequence[str], batch_size: int) -> None:
+        self.batch_size = batch_size
+        self.buffer = StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.writer.writerow(header)
+        self.pending = 1
+
+    def add(self, row: Sequence) -> str | None:
+        """Write a row, returning a chunk once batch_size rows are pending"""
+        self.writer.writerow(row)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Return pending rows as text and reset the buffer"""
+        if not self.pending:
+            return None
+        chunk = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate(0)
+        self.pending = 0
+        return chunk
+
+
+def iter_csv(
+    header: Sequence[str],
+    rows: Iterable[Sequence],
+    batch_size: int = 500,
+) -> Iterator[str]:
+    """
+    Encode rows as CSV text in chunks
+
+    Only one chunk is held in memory at a time, so the generator can be
+    passed to a StreamingResponse and driven by a batched query result.
+
+    Args:
+        header: Column titles for the first line
+        rows: Iterable of row values
+        batch_size: Number of rows per yielded chunk
+
+    Yields:
+        CSV formatted text chunks
+    """
+    chunker = _CSVChunker(header, batch_size)
+
+    for row in rows:
+        chunk = chunker.add(row)
+        if chunk:
+            yield chunk
+
+    chunk = chunker.flush()
+    if chunk:
+        yield chunk
+
+
+async def aiter_csv(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence],
+    batch_size: int = 500,
+) -> AsyncIterator[str]:
+    """
+    Encode rows from an async iterable as CSV text in chunks
+
+    Async counterpart of iter_csv for AsyncSession.stream() results.
+
+    Args:
+        header: Column titles for the first line
+        rows: Async iterable of row values
+        batch_size: Number of rows per yielded chunk
+
+    Yields:
+        CSV formatted text chunks
+    """
+    chunker = _CSVChunker(header, batch_size)
+
+    async for row in rows:
+        chunk = chunker.add(row)
+        if chunk:
+            yield chunk
+
+    chunk = chunker.flush()
+    if chunk:
+        yield chunk
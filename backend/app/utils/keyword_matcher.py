@@ -0,0 +1,82 @@
+"""
+Multi-keyword matching with an Aho-Corasick automaton
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of keywords
+
+    Builds a trie of all keywords with failure links so that every
+    occurrence of every keyword in a text is found in a single pass,
+    instead of one substring scan per keyword.
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, Any]]) -> None:
+        """
+        Build the automaton
+
+        Args:
+            keywords: (keyword, value) pairs; a keyword may map to several values
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[Any]] = [[]]
+
+        for keyword, value in keywords:
+            if keyword:
+                self._add(keyword, value)
+        self._link()
+
+    def _add(self, keyword: str, value: Any) -> None:
+        """Insert a keyword into the trie"""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(value)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output[next_state].extend(self._output[fail])
+                queue.append(next_state)
+
+    def iter(self, text: str) -> Iterator[Any]:
+        """
+        Scan text for keyword occurrences
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Iterator over the values of every matched keyword, in match order
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield from output[state]
@@ -0,0 +1,282 @@
+"""
+Unit Tests for core utilities
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from app.api.v1 import auth as auth_api
+from app.api.v1 import staff as staff_api
+from app.api.v1.reports import cached_report_response
+from app.core import auth_cache, performance
+from app.core.cache import TTLCache
+from app.core.database import async_session_maker
+from app.core.security import create_access_token
+from app.crud.staff import staff as staff_crud
+from app.schemas.staff import StaffCreate, StaffUpdate
+from app.services.report_service import REPORT_CACHE_TTL_SECONDS, report_cache
+from fastapi import Request
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import BaseModel
+from sqlalchemy import text
+
+
+def _token_for(staff_id: str) -> str:
+    """Issue an access token for a staff member and cache its verification"""
+    token = create_access_token(data={"sub": staff_id, "hotel_id": "hotel-auth", "role": "staff"})
+    assert auth_cache.decode_access_token_cached(token)["sub"] == staff_id
+    return token
+
+
+def _is_cached(token: str) -> bool:
+    return auth_cache._token_cache.get(token) is not None
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start and end each test with an empty token cache"""
+    auth_cache._token_cache.clear()
+    yield
+    auth_cache._token_cache.clear()
+
+
+@pytest.mark.asyncio
+class TestAuthCache:
+    """Access token verification cache unit tests"""
+
+    async def test_reuses_verification(self):
+        """Test a cached token is not verified again"""
+        token = _token_for("staff-auth-reuse")
+        with patch.object(auth_cache, "decode_access_token") as decode:
+            payload = auth_cache.decode_access_token_cached(token)
+        decode.assert_not_called()
+        assert payload["sub"] == "staff-auth-reuse"
+
+    async def test_invalid_token_is_not_cached(self):
+        """Test a failed verification is not remembered"""
+        assert auth_cache.decode_access_token_cached("not-a-token") is None
+        assert not _is_cached("not-a-token")
+
+    async def test_expired_entry_is_dropped(self):
+        """Test a cached payload past its exp claim is rejected"""
+        auth_cache._token_cache.set("expired-token", ({"sub": "staff-auth-exp"}, 0))
+        assert auth_cache.decode_access_token_cached("expired-token") is None
+        assert not _is_cached("expired-token")
+
+    async def test_logout_invalidates_token(self):
+        """Test logging out drops the token's cached verification"""
+        token = _token_for("staff-auth-logout")
+        other = _token_for("staff-auth-other")
+
+        await auth_api.logout(
+            credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+
+        assert not _is_cached(token)
+        assert _is_cached(other)
+
+    async def test_staff_update_invalidates_user_tokens(self, db_session):
+        """Test deactivating a staff member drops all their cached tokens"""
+        member = await staff_crud.create_unique(
+            db_session, StaffCreate(hotel_id="hotel-auth", name="王五", wechat_userid="wangwu_auth")
+        )
+        tokens = [_token_for(member.id), _token_for(member.id)]
+        other = _token_for("staff-auth-other")
+
+        await staff_api.update_staff(
+            member.id, StaffUpdate(status="inactive", role="manager"), db_session, _user_id="admin"
+        )
+
+        assert not any(_is_cached(token) for token in tokens)
+        assert _is_cached(other)
+
+    async def test_staff_delete_invalidates_user_tokens(self, db_session):
+        """Test deleting a staff member drops their cached tokens"""
+        member = await staff_crud.create_unique(
+            db_session, StaffCreate(hotel_id="hotel-auth", name="赵六", wechat_userid="zhaoliu_auth")
+        )
+        token = _token_for(member.id)
+
+        await staff_api.delete_staff(member.id, db_session, _user_id="admin")
+
+        assert not _is_cached(token)
+
+
+class TestTTLCache:
+    """In-process TTL cache unit tests"""
+
+    def test_get_set_delete(self):
+        """Test values are returned until deleted"""
+        cache = TTLCache(ttl_seconds=60)
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        cache.delete("key")
+        assert cache.get("key") is None
+        cache.delete("key")
+
+    def test_entries_expire(self):
+        """Test a value is dropped once its TTL has passed"""
+        cache = TTLCache(ttl_seconds=60)
+        with patch("app.core.cache.time.monotonic", return_value=1000.0):
+            cache.set("key", "value")
+        with patch("app.core.cache.time.monotonic", return_value=1059.0):
+            assert cache.get("key") == "value"
+        with patch("app.core.cache.time.monotonic", return_value=1060.0):
+            assert cache.get("key") is None
+        assert len(cache._entries) == 0
+
+    def test_set_renews_expiry(self):
+        """Test setting a key again restarts its TTL"""
+        cache = TTLCache(ttl_seconds=60)
+        with patch("app.core.cache.time.monotonic", return_value=1000.0):
+            cache.set("key", "old")
+        with patch("app.core.cache.time.monotonic", return_value=1050.0):
+            cache.set("key", "new")
+        with patch("app.core.cache.time.monotonic", return_value=1100.0):
+            assert cache.get("key") == "new"
+
+    def test_maxsize_evicts_oldest(self):
+        """Test the least recently set entry is evicted first"""
+        cache = TTLCache(ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+        assert cache.get("b") is None
+        assert cache.get("a") == 3
+        assert cache.get("c") == 4
+
+    def test_delete_where_and_clear(self):
+        """Test selective and full invalidation"""
+        cache = TTLCache(ttl_seconds=60)
+        for i in range(4):
+            cache.set(i, i)
+        cache.delete_where(lambda value: value % 2 == 0)
+        assert [cache.get(i) for i in range(4)] == [None, 1, None, 3]
+        cache.clear()
+        assert cache.get(1) is None
+
+
+class _Report(BaseModel):
+    total: int
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    """Build a bare GET request, optionally revalidating an ETag"""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.asyncio
+class TestCachedReportResponse:
+    """Report response cache unit tests"""
+
+    @pytest.fixture(autouse=True)
+    def clear_report_cache(self):
+        """Start and end each test with an empty report cache"""
+        report_cache.clear()
+        yield
+        report_cache.clear()
+
+    async def test_hit_skips_build(self):
+        """Test a cached report is served without rebuilding it"""
+        build = AsyncMock(return_value=_Report(total=3))
+        first = await cached_report_response(_request(), ("test", "hotel"), build)
+        second = await cached_report_response(_request(), ("test", "hotel"), build)
+
+        build.assert_awaited_once()
+        assert first.status_code == second.status_code == 200
+        assert first.body == second.body
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == f"private, max-age={REPORT_CACHE_TTL_SECONDS}"
+
+    async def test_if_none_match_returns_304(self):
+        """Test revalidating with the current ETag returns an empty 304"""
+        build = AsyncMock(return_value=_Report(total=3))
+        first = await cached_report_response(_request(), ("test", "hotel"), build)
+        etag = first.headers["etag"]
+
+        response = await cached_report_response(_request(etag), ("test", "hotel"), build)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+        stale = await cached_report_response(_request('"stale"'), ("test", "hotel"), build)
+        assert stale.status_code == 200
+
+    async def test_changed_payload_gets_new_etag(self):
+        """Test a rebuilt report with different data has a different ETag"""
+        first = await cached_report_response(
+            _request(), ("test", "hotel"), AsyncMock(return_value=_Report(total=3))
+        )
+        report_cache.clear()
+        second = await cached_report_response(
+            _request(first.headers["etag"]),
+            ("test", "hotel"),
+            AsyncMock(return_value=_Report(total=4)),
+        )
+
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+
+    async def test_expired_entry_is_rebuilt(self):
+        """Test a report is rebuilt once the cache TTL has passed"""
+        build = AsyncMock(return_value=_Report(total=3))
+        with patch("app.core.cache.time.monotonic", return_value=1000.0):
+            await cached_report_response(_request(), ("test", "hotel"), build)
+        with patch(
+            "app.core.cache.time.monotonic",
+            return_value=1000.0 + REPORT_CACHE_TTL_SECONDS,
+        ):
+            await cached_report_response(_request(), ("test", "hotel"), build)
+
+        assert build.await_count == 2
+
+
+async def _run_asgi(app, scope: dict) -> dict:
+    """Call an ASGI app and return its response start message"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]
+
+
+async def _two_queries(_scope, _receive, send):
+    """ASGI app running two database queries before responding"""
+    async with async_session_maker() as session:
+        await session.execute(text("SELECT 1"))
+        await session.execute(text("SELECT 2"))
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.mark.asyncio
+class TestQueryCounterMiddleware:
+    """Per-request database query counter unit tests"""
+
+    async def test_counts_queries_in_development(self, monkeypatch):
+        """Test the response reports the queries run for the request"""
+        monkeypatch.setattr(performance.settings, "app_env", "development")
+        middleware = performance.QueryCounterMiddleware(_two_queries)
+
+        start = await _run_asgi(middleware, {"type": "http", "headers": []})
+        assert (b"x-db-queries", b"2") in start["headers"]
+
+        # The count is per request, not cumulative
+        start = await _run_asgi(middleware, {"type": "http", "headers": []})
+        assert (b"x-db-queries", b"2") in start["headers"]
+
+    async def test_disabled_outside_development(self, monkeypatch):
+        """Test no header is added outside development"""
+        monkeypatch.setattr(performance.settings, "app_env", "production")
+        middleware = performance.QueryCounterMiddleware(_two_queries)
+
+        start = await _run_asgi(middleware, {"type": "http", "headers": []})
+        assert all(name != b"x-db-queries" for name, _ in start["headers"])
@@ -0,0 +1,142 @@
+"""
+Unit Tests for CRUD operations
+"""
+
+import pytest
+from app.crud.conversation import conversation as conversation_crud
+from app.crud.hotel import hotel as hotel_crud
+from app.crud.message import message as message_crud
+from app.crud.staff import staff as staff_crud
+from app.models.audit_log import AuditLog
+from app.models.conversation import ConversationStatus
+from app.models.hotel import Hotel
+from app.models.staff import Staff
+from app.models.ticket import Ticket
+from app.models.ticket_timeline import TicketTimeline
+from sqlalchemy import select
+
+
+@pytest.mark.asyncio
+class TestCRUDHotel:
+    """Hotel CRUD unit tests"""
+
+    async def test_get_page_returns_rows_and_total(self, db_session):
+        """Test fetching a page together with the total count"""
+        for i in range(5):
+            db_session.add(
+                Hotel(
+                    id=f"hotel-page-{i}",
+                    name=f"分页酒店{i}",
+                    corp_id=f"corp-page-{i}",
+                    status="active" if i < 3 else "inactive",
+                )
+            )
+        await db_session.flush()
+
+        hotels, total = await hotel_crud.get_active_page(db_session, skip=0, limit=2)
+        assert len(hotels) == 2
+        assert total == 3
+
+        hotels, total = await hotel_crud.get_active_page(db_session, skip=10, limit=2)
+        assert hotels == []
+        assert total == 3
+
+
+@pytest.mark.asyncio
+class TestCRUDConversation:
+    """Conversation CRUD unit tests"""
+
+    async def test_upsert_by_guest_creates_then_reuses(self, db_session):
+        """Test a second message from the guest hits the conflict path"""
+        conversation, created = await conversation_crud.upsert_by_guest(
+            db_session, "hotel-upsert", "guest-upsert"
+        )
+        assert created
+        assert conversation.status == ConversationStatus.ACTIVE.value
+        first_message_at = conversation.last_message_at
+
+        again, created = await conversation_crud.upsert_by_guest(
+            db_session, "hotel-upsert", "guest-upsert"
+        )
+        assert not created
+        assert again.id == conversation.id
+        assert again.last_message_at >= first_message_at
+
+    async def test_upsert_by_guest_ignores_closed_conversation(self, db_session):
+        """Test a guest whose conversation was closed gets a new one"""
+        conversation, _ = await conversation_crud.upsert_by_guest(
+            db_session, "hotel-upsert", "guest-closed"
+        )
+        conversation.status = ConversationStatus.CLOSED.value
+        await db_session.flush()
+
+        reopened, created = await conversation_crud.upsert_by_guest(
+            db_session, "hotel-upsert", "guest-closed"
+        )
+        assert created
+        assert reopened.id != conversation.id
+
+
+@pytest.mark.asyncio
+class TestCRUDMessage:
+    """Message CRUD unit tests"""
+
+    async def test_create_unique_message_skips_duplicate(self, db_session):
+        """Test a redelivered WeChat message is not stored twice"""
+        conversation, _ = await conversation_crud.upsert_by_guest(
+            db_session, "hotel-dedup", "guest-dedup"
+        )
+        values = {
+            "conversation_id": conversation.id,
+            "message_type": "text",
+            "direction": "inbound",
+            "content": "房间需要打扫",
+            "wechat_msg_id": "wx-msg-dedup-001",
+        }
+
+        created = await message_crud.create_unique_message(db_session, **values)
+        assert created is not None
+        assert created.wechat_msg_id == "wx-msg-dedup-001"
+
+        assert await message_crud.create_unique_message(db_session, **values) is None
+
+        messages = await message_crud.get_by_conversation(db_session, conversation.id)
+        assert [m.id for m in messages] == [created.id]
+
+
+@pytest.mark.asyncio
+class TestCRUDStaff:
+    """Staff CRUD unit tests"""
+
+    async def test_delete_by_id_clears_references(self, db_session):
+        """Test deleting an assigned staff member unassigns their records"""
+        db_session.add(Hotel(id="hotel-del", name="删除酒店", corp_id="corp-del"))
+        db_session.add(Staff(id="staff-del", hotel_id="hotel-del", name="王五"))
+        await db_session.flush()
+        db_session.add(
+            Ticket(id="ticket-del", hotel_id="hotel-del", title="测试", assigned_to="staff-del")
+        )
+        await db_session.flush()
+        db_session.add(
+            TicketTimeline(ticket_id="ticket-del", staff_id="staff-del", event_type="assigned")
+        )
+        db_session.add(
+            AuditLog(
+                hotel_id="hotel-del", staff_id="staff-del",
+                action="update", resource_type="ticket",
+            )
+        )
+        await db_session.flush()
+
+        assert await staff_crud.delete_by_id(db_session, "staff-del")
+        assert not await staff_crud.delete_by_id(db_session, "staff-del")
+
+        assert await db_session.scalar(
+            select(Ticket.assigned_to).where(Ticket.id == "ticket-del")
+        ) is None
+        assert await db_session.scalar(
+            select(TicketTimeline.staff_id).where(TicketTimeline.ticket_id == "ticket-del")
+        ) is None
+        assert await db_session.scalar(
+            select(AuditLog.staff_id).where(AuditLog.hotel_id == "hotel-del")
+        ) is None
@@ -0,0 +1,53 @@
+"""
+Alembic migration chain tests
+"""
+
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def get_script_directory() -> ScriptDirectory:
+    """Load the Alembic script directory without touching the database"""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+class TestMigrationChain:
+    """Migration revision chain integrity tests"""
+
+    def test_single_head(self):
+        """Test that the revision graph has exactly one head"""
+        script = get_script_directory()
+        assert len(script.get_heads()) == 1
+
+    def test_chain_reaches_base(self):
+        """Test that every revision links back to the initial migration"""
+        script = get_script_directory()
+        revisions = list(script.walk_revisions())
+
+        assert revisions[-1].revision == "001"
+        assert revisions[-1].down_revision is None
+
+        known = {rev.revision for rev in revisions}
+        for rev in revisions[:-1]:
+            assert rev.down_revision in known
+
+    def test_docstring_matches_down_revision(self):
+        """Test that the 'Revises:' header matches down_revision"""
+        script = get_script_directory()
+
+        for rev in script.walk_revisions():
+            header = f"Revises: {rev.down_revision or ''}".strip()
+            assert header in rev.module.__doc__
+
+    def test_revision_ids_fit_version_table(self):
+        """Test that revision IDs fit alembic_version.version_num (VARCHAR(32))"""
+        script = get_script_directory()
+
+        for rev in script.walk_revisions():
+            assert len(rev.revision) <= 32, rev.revision
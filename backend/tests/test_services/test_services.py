@@ -3,6 +3,7 @@ Unit Tests for Services
 """
 
 import pytest
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 from sqlalchemy.orm import Session
@@ -11,7 +12,9 @@ from app.services.routing_service import routing_service
 from app.services.auto_ticket_service import AutoTicketService
 from app.services.batch_service import BatchOperationService
 from app.services.rule_test_service import rule_test_service
-from app.models.ticket import TicketStatus, TicketPriority, TicketCategory
+from app.services.timeline_writer import timeline_writer
+from app.crud.ticket_timeline import ticket_timeline as ticket_timeline_crud
+from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCategory
 from app.models.routing_rule import RoutingRuleType
 from app.models.staff import Staff, StaffStatus
 from app.models.auto_rule import TriggerType
@@ -259,12 +262,68 @@ class TestRuleTestService:
 
         # Get summary
         service = rule_test_service
-        summary = service.get_rule_summary(db_session, "hotel-test")
+        summary = await service.get_rule_summary(db_session, "hotel-test")
 
         assert len(summary) == 1
         assert summary[0]["id"] == "rule-test-001"
         assert summary[0]["name"] == "测试规则"
 
+    async def test_message_matches_keyword_case_insensitively(self, db_session):
+        """Test keyword rules match regardless of letter case"""
+        from app.models.routing_rule import RoutingRule
+
+        db_session.add(
+            RoutingRule(
+                id="rule-test-case",
+                hotel_id="hotel-test-case",
+                name="WiFi规则",
+                rule_type=RoutingRuleType.KEYWORD.value,
+                keywords='["WiFi"]',
+                target_staff_ids="[]",
+                priority_level=10,
+                is_active=True,
+            )
+        )
+        await db_session.flush()
+
+        result = await rule_test_service.test_message(
+            db_session, "hotel-test-case", "房间的wifi连不上"
+        )
+        assert result["matched_rule"]["id"] == "rule-test-case"
+
+        result = await rule_test_service.test_message(
+            db_session, "hotel-test-case", "需要加一床被子"
+        )
+        assert result["matched_rule"]["id"] is None
+
+    async def test_message_skips_malformed_keywords(self, db_session):
+        """Test a rule with malformed keywords JSON is skipped, not an error"""
+        from app.models.routing_rule import RoutingRule
+
+        for rule_id, keywords, priority_level in [
+            ("rule-test-bad-json", '["WiFi"', 20),
+            ("rule-test-not-array", '"WiFi"', 15),
+            ("rule-test-good-json", '["wifi"]', 10),
+        ]:
+            db_session.add(
+                RoutingRule(
+                    id=rule_id,
+                    hotel_id="hotel-test-bad-json",
+                    name=rule_id,
+                    rule_type=RoutingRuleType.KEYWORD.value,
+                    keywords=keywords,
+                    target_staff_ids="[]",
+                    priority_level=priority_level,
+                    is_active=True,
+                )
+            )
+        await db_session.flush()
+
+        result = await rule_test_service.test_message(
+            db_session, "hotel-test-bad-json", "房间的WiFi连不上"
+        )
+        assert result["matched_rule"]["id"] == "rule-test-good-json"
+
 
 @pytest.mark.asyncio
 class TestReportService:
@@ -273,7 +332,6 @@ class TestReportService:
     async def test_get_ticket_report(self, db_session):
         """Test ticket report generation"""
         from app.services.report_service import ReportService
-        from app.schemas.report import TimeRangeRequest
 
         # Create test tickets
         for status in [TicketStatus.PENDING, TicketStatus.ASSIGNED, TicketStatus.RESOLVED]:
@@ -292,10 +350,12 @@ class TestReportService:
 
         # Generate report
         service = ReportService()
-        report = service.get_ticket_report(
+        now = datetime.utcnow()
+        report = await service.get_ticket_report(
             db_session,
             hotel_id="hotel-report",
-            range_request=TimeRangeRequest(range_type="this_week"),
+            start=now - timedelta(days=7),
+            end=now + timedelta(minutes=1),
         )
 
         assert report.total == 3
@@ -305,7 +365,6 @@ class TestReportService:
     async def test_get_staff_performance(self, db_session):
         """Test staff performance report"""
         from app.services.report_service import ReportService
-        from app.schemas.report import TimeRangeRequest
 
         # Create staff with tickets
         staff = Staff(
@@ -338,10 +397,12 @@ class TestReportService:
 
         # Generate report
         service = ReportService()
-        report = service.get_staff_report(
+        now = datetime.utcnow()
+        report = await service.get_staff_report(
             db_session,
             hotel_id="hotel-perf",
-            range_request=TimeRangeRequest(range_type="this_month"),
+            start=now - timedelta(days=30),
+            end=now,
         )
 
         assert report.total_staff == 1
@@ -350,3 +411,116 @@ class TestReportService:
         assert staff_stat.total_assigned == 5
         assert staff_stat.total_resolved == 3
         assert staff_stat.resolution_rate == 60.0
+
+
+def _timeline_values(ticket_id: str, event_type: str) -> dict:
+    """Column values of a timeline entry"""
+    return {
+        "ticket_id": ticket_id,
+        "staff_id": None,
+        "event_type": event_type,
+        "old_value": None,
+        "new_value": None,
+        "comment": None,
+    }
+
+
+@pytest.mark.asyncio
+class TestTimelineWriter:
+    """Background timeline writer unit tests"""
+
+    async def test_enqueue_without_writer_inserts_inline(self, db_session):
+        """Test that entries go into the caller's transaction when no writer runs"""
+        assert not timeline_writer.running
+
+        await timeline_writer.enqueue(db_session, [_timeline_values("TK-TW-INLINE", "created")])
+
+        entries = await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-INLINE")
+        assert [e.event_type for e in entries] == ["created"]
+
+    async def test_enqueue_defers_until_commit(self, db_session):
+        """Test that entries are written after commit and visible after flush"""
+        timeline_writer.start()
+        try:
+            await timeline_writer.enqueue(
+                db_session,
+                [_timeline_values("TK-TW-DEFER", "created"), _timeline_values("TK-TW-DEFER", "assigned")],
+            )
+            assert await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-DEFER") == []
+
+            await db_session.commit()
+            await timeline_writer.flush()
+
+            entries = await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-DEFER")
+            assert sorted(e.event_type for e in entries) == ["assigned", "created"]
+        finally:
+            await timeline_writer.stop()
+
+    async def test_rollback_drops_entries(self, db_session):
+        """Test that entries of a rolled back transaction are never written"""
+        timeline_writer.start()
+        try:
+            await timeline_writer.enqueue(db_session, [_timeline_values("TK-TW-ROLLBACK", "created")])
+            await db_session.rollback()
+            await db_session.commit()
+            await timeline_writer.flush()
+
+            assert await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-ROLLBACK") == []
+        finally:
+            await timeline_writer.stop()
+
+    async def test_flush_does_not_wait_out_interval(self, db_session):
+        """Test that a reader wakes the writer instead of waiting for the batch"""
+        timeline_writer.start()
+        interval = timeline_writer.flush_interval
+        timeline_writer.flush_interval = 30
+        try:
+            await timeline_writer.enqueue(db_session, [_timeline_values("TK-TW-WAKE", "created")])
+            await db_session.commit()
+
+            await asyncio.wait_for(timeline_writer.flush(), 5)
+
+            entries = await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-WAKE")
+            assert [e.event_type for e in entries] == ["created"]
+        finally:
+            timeline_writer.flush_interval = interval
+            await timeline_writer.stop()
+
+    async def test_bad_entry_drops_only_itself(self, db_session):
+        """Test that a failing entry does not take its batch down with it"""
+        timeline_writer.start()
+        try:
+            await timeline_writer.enqueue(
+                db_session,
+                [
+                    _timeline_values("TK-TW-BAD", "created"),
+                    _timeline_values("TK-TW-BAD", None),
+                    _timeline_values("TK-TW-BAD", "assigned"),
+                ],
+            )
+            await db_session.commit()
+            await timeline_writer.flush()
+
+            entries = await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-BAD")
+            assert sorted(e.event_type for e in entries) == ["assigned", "created"]
+        finally:
+            await timeline_writer.stop()
+
+    async def test_stop_drains_queue(self, db_session):
+        """Test that stopping writes the queued entries and resets the writer"""
+        timeline_writer.start()
+        await timeline_writer.enqueue(
+            db_session,
+            [_timeline_values("TK-TW-DRAIN", f"event_{i}") for i in range(250)],
+        )
+        await db_session.commit()
+
+        await timeline_writer.stop()
+
+        assert not timeline_writer.running
+        entries = await ticket_timeline_crud.get_by_ticket(db_session, "TK-TW-DRAIN", limit=500)
+        assert len(entries) == 250
+
+        # A stopped writer can be started again on a new loop
+        timeline_writer.start()
+        await timeline_writer.stop()
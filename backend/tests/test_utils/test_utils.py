@@ -0,0 +1,116 @@
+"""
+Unit Tests for utilities
+"""
+
+import json
+
+import pytest
+from app.api.v1 import rules
+from app.schemas.rule import RuleTestRequest
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+def _matches(keywords: list[str], text: str) -> list[str]:
+    """Match text against keywords that map to themselves"""
+    return list(KeywordMatcher((keyword, keyword) for keyword in keywords).iter(text))
+
+
+class TestKeywordMatcher:
+    """Aho-Corasick keyword matcher unit tests"""
+
+    def test_overlapping_keywords(self):
+        """Test every overlapping occurrence is reported, in match order"""
+        assert _matches(["he", "she", "hers"], "ushers") == ["she", "he", "hers"]
+
+    def test_shared_prefixes(self):
+        """Test keywords sharing a prefix are all found"""
+        assert _matches(["空调", "空调坏了", "空气"], "空调坏了，空气很差") == [
+            "空调",
+            "空调坏了",
+            "空气",
+        ]
+
+    def test_failure_link_fallthrough(self):
+        """Test a broken partial match falls back to the longest suffix"""
+        # "abcd" fails at "e"; the scan must resume from "bc" to find "bce"
+        assert _matches(["abcd", "bce"], "abce") == ["bce"]
+        # Fallthrough to the root still finds a keyword starting at the mismatch
+        assert _matches(["aab", "b"], "aaab") == ["aab", "b"]
+
+    def test_repeated_occurrences(self):
+        """Test each occurrence of a keyword is reported"""
+        assert _matches(["aa"], "aaaa") == ["aa", "aa", "aa"]
+
+    def test_case_folding_is_left_to_caller(self):
+        """Test matching is exact-case unless both sides are folded"""
+        assert _matches(["WiFi"], "wifi is down") == []
+        matcher = KeywordMatcher([("WiFi".casefold(), "wifi")])
+        assert list(matcher.iter("The WIFI is down".casefold())) == ["wifi"]
+
+    def test_empty_keyword_set(self):
+        """Test an automaton without keywords matches nothing"""
+        assert _matches([], "anything") == []
+        assert _matches([""], "anything") == []
+        assert _matches(["keyword"], "") == []
+
+    def test_non_ascii_input(self):
+        """Test CJK and accented keywords are matched character-wise"""
+        assert _matches(["漏水", "café"], "浴室漏水了, café closed") == ["漏水", "café"]
+        assert _matches(["漏水"], "漏了水") == []
+
+    def test_keyword_with_several_values(self):
+        """Test a keyword mapped to several values yields all of them"""
+        matcher = KeywordMatcher([("维修", "rule-a"), ("维修", "rule-b")])
+        assert list(matcher.iter("需要维修")) == ["rule-a", "rule-b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("keyword_rules")
+class TestRuleKeywordMatching:
+    """Rule test endpoint keyword matching unit tests"""
+
+    @pytest.fixture
+    def keyword_rules(self, monkeypatch):
+        """Replace the stored rules and rebuild the automaton around the test"""
+
+        def rule(rule_id: str, keywords: list[str], rule_priority: int, is_active: bool = True):
+            return {
+                "id": rule_id,
+                "name": rule_id,
+                "type": "keyword",
+                "keywords": keywords,
+                "category": None,
+                "priority": None,
+                "target_staff_count": 1,
+                "rule_priority": rule_priority,
+                "is_active": is_active,
+            }
+
+        monkeypatch.setattr(
+            rules,
+            "_rules",
+            {
+                "low": rule("low", ["漏水"], 10),
+                "inactive": rule("inactive", ["漏水", "空调"], 99, is_active=False),
+                "high": rule("high", ["浴室"], 30),
+            },
+        )
+        rules._invalidate_automaton()
+        yield
+        rules._invalidate_automaton()
+
+    async def _matched_rule_id(self, message_content: str) -> str:
+        response = await rules.test_routing_rule(
+            hotel_id="hotel-rules", request=RuleTestRequest(message_content=message_content)
+        )
+        return json.loads(response.body)["data"]["matched_rule"]["id"]
+
+    async def test_highest_rule_priority_wins(self):
+        """Test the match with the highest rule_priority is chosen, not the first"""
+        assert await self._matched_rule_id("漏水了，在浴室") == "high"
+
+    async def test_inactive_rules_are_skipped(self):
+        """Test an inactive rule never matches, whatever its priority"""
+        assert await self._matched_rule_id("水管漏水") == "low"
+        # No active keyword rule matches: falls back to the first stored rule
+        assert await self._matched_rule_id("空调不制冷") == "low"